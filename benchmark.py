@@ -0,0 +1,258 @@
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+
+from models import Image, Size, TransformPool, AudioConfig, Scene, Sprite, Movement, MovementManipulator, Action, \
+    ReplicationServer, ReplicationClient, LatencyMonitor, Archetype, Level, CircleCollider
+
+
+def _init_display():
+    """Initialize a hidden display so surfaces can be converted."""
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+
+def _timed(func) -> float:
+    """Time a function call in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def benchmark_transform_pool(worker_counts=(1, 2, 4, 8), image_count=64):
+    """Compare pre-rendering rotation frames and scaled variants across worker counts."""
+    _init_display()
+    for workers in worker_counts:
+        pool = TransformPool(workers)
+        images = [Image(Size(256, 256), image_name=f"ball{i}", file_location="assets/ball.png")
+                  for i in range(image_count)]
+        for image in images:
+            _ = image.surface
+        rotation_time = _timed(lambda: pool.prerender_rotations(images, step=5))
+
+        wallpapers = [Image(Size(1920, 1080), image_name=f"wallpaper{i}", file_location="assets/wallpaper.jpg")
+                      for i in range(image_count // 4)]
+        for wallpaper in wallpapers:
+            _ = wallpaper.surface
+        scale_time = _timed(lambda: pool.prescale(wallpapers, [0.25, 0.5, 0.75]))
+        pool.shutdown()
+
+        print(f"{workers} worker(s): {image_count * 72} rotations in {rotation_time:.3f}s, "
+              f"{len(wallpapers) * 3} scales in {scale_time:.3f}s")
+
+
+def measure_mix_delay(config: AudioConfig, output_file: str, trials: int = 5, timeout: float = 2.0):
+    """Measure the time between scheduling a sound and it being mixed into an output buffer.
+
+    Uses SDL's disk audio driver, which writes every mixed buffer to a file and then waits as long as the buffer
+    takes to play. The delay is the time until the buffer holding the sound is written, plus the offset of the sound
+    inside of that buffer.
+
+    ..Note:: This is not the output latency. The disk driver has no device queue, while a sound card only starts
+        playing a mixed buffer once the buffer before it finished, which adds at least another buffer. Delays of
+        small buffers are also dominated by the sleep granularity of the driver and of the polling.
+
+    :param config: :ref:`AudioConfig`
+        The mixer settings to measure. Only signed sample sizes are supported.
+    :param output_file: str
+        The file the disk driver writes to.
+    :param trials: int
+        The amount of sounds to schedule.
+    :param timeout: float
+        The time in seconds to wait for a sound to appear in the output.
+    :returns: List[float]
+        The delay in seconds of every sound that was mixed.
+    """
+    os.environ["SDL_AUDIODRIVER"] = "disk"
+    os.environ["SDL_DISKAUDIOFILE"] = output_file
+    pygame.mixer.quit()
+    config.init()
+    time.sleep(0.25)  # let the output settle.
+
+    sample_bytes = abs(config.size) // 8
+    buffer_bytes = config.buffer * config.channels * sample_bytes
+    loudest = (2 ** (abs(config.size) - 1) - 1).to_bytes(sample_bytes, "little", signed=True)
+    click = pygame.mixer.Sound(buffer=loudest * config.channels * (config.frequency // 100))
+
+    delays = []
+    for trial in range(trials):
+        # schedule at different points of the buffer cycle.
+        time.sleep(config.buffer_latency * (1 + trial / trials))
+        start = os.path.getsize(output_file)
+        scheduled = time.perf_counter()
+        click.play()
+
+        while time.perf_counter() - scheduled < timeout:
+            with open(output_file, "rb") as output:
+                output.seek(start)
+                data = output.read()
+            silence = len(data) - len(data.lstrip(b"\0"))
+            if silence < len(data):
+                written = time.perf_counter() - scheduled
+                delays.append(written + (silence % buffer_bytes) / config.bytes_per_second)
+                break
+            time.sleep(0.0005)
+
+        click.stop()
+        time.sleep(0.05)  # let the click drain from the output.
+
+    pygame.mixer.quit()
+    return delays
+
+
+def benchmark_audio_latency(configs=None):
+    """Report the mix delay of mixer configurations and the output latency it leads to with one queued buffer."""
+    configs = configs or [AudioConfig(buffer=buffer) for buffer in (256, 512, 1024, 2048, 4096)] + \
+        [AudioConfig(frequency=22050, buffer=512)]
+    driver = os.environ.get("SDL_AUDIODRIVER")
+    with tempfile.TemporaryDirectory() as directory:
+        for config in configs:
+            delays = measure_mix_delay(config, f"{directory}/output.raw")
+            # a device plays the mixed buffer after the one it is playing, so at least a buffer is added.
+            result = f"mixed after {sum(delays) / len(delays) * 1000:.1f}ms average, {max(delays) * 1000:.1f}ms max, " \
+                f"estimated output latency {(sum(delays) / len(delays) + config.buffer_latency) * 1000:.1f}ms" \
+                if delays else "no sound was mixed"
+            print(f"{config.frequency}Hz, {config.buffer} sample buffer ({config.buffer_latency * 1000:.1f}ms): "
+                  f"{result}")
+
+    if driver is None:
+        os.environ.pop("SDL_AUDIODRIVER")
+    else:
+        os.environ["SDL_AUDIODRIVER"] = driver
+    os.environ.pop("SDL_DISKAUDIOFILE")
+
+
+def benchmark_replication(moving=50, still=200, ticks=300):
+    """Report the bytes per tick of replicating a scene to a client over localhost."""
+    def ball(position=None, velocity=None):
+        return Sprite(image=Image(Size(24, 24), image_name="ball", file_location="assets/ball.png"),
+                      movement=Movement(position=position, velocity=velocity, static=False),
+                      bounded_action=Action.bounce(), collision_action=Action.pass_through())
+
+    def brick(position=None):
+        return Sprite(image=Image(Size(32, 16), image_name="brick", file_location="assets/blue_tile.png"),
+                      movement=Movement(position=position, static=True), collision_action=Action.pass_through())
+
+    balls = [ball(MovementManipulator(40 + i * 20 % 1200, 40 + i * 37 % 640), MovementManipulator(3, -2))
+             for i in range(moving)]
+    bricks = [brick(MovementManipulator(20 + i * 33 % 1240, 20 + i // 37 * 17)) for i in range(still)]
+
+    server = ReplicationServer(kind_of=lambda sprite: 1 if sprite.static else 0)
+    server_scene = Scene("Server", sprites=balls + bricks, replication=server)
+    client = ReplicationClient(*server.address, kinds={0: ball, 1: brick})
+    client_scene = Scene("Client", replication=client)
+    server_scene._prepare()
+    client_scene._prepare()
+
+    step = server_scene.physics_step
+    for _ in range(ticks):
+        server_scene._frame(step, 0)
+        client_scene._frame(step, 0)
+    time.sleep(0.1)
+    client_scene._frame(step, 0)
+
+    # the client draws a few ticks in the past, so moving sprites trail by a few pixels.
+    drift = max(abs(client._sprites[sprite_id][1].movement.position.x - sprite.movement.position.x)
+                for sprite, sprite_id in server._ids.items())
+    print(f"{moving} moving and {still} still sprites over {server.tick} ticks: "
+          f"{server.average_bytes_per_tick:.0f} bytes per tick sent, {client.average_bytes_per_tick:.0f} received, "
+          f"{server.keyframe_bytes} bytes for the full state, {drift:.1f}px client drift")
+    client.close()
+    server.close()
+
+
+def benchmark_input_latency(sprite_count=150, frames=120):
+    """Compare the input-to-present latency of sampling input before and after simulating the world."""
+    for late_input in (False, True):
+        sprites = [Sprite(image=Image(Size(24, 24), image_name="ball", file_location="assets/ball.png"),
+                          movement=Movement(position=MovementManipulator(40 + i * 20 % 1200, 40 + i * 37 % 640),
+                                            velocity=MovementManipulator(3, -2), static=False),
+                          bounded_action=Action.bounce(), collision_action=Action.pass_through())
+                   for i in range(sprite_count)]
+        player = Sprite(image=Image(Size(128, 16), image_name="platform", file_location="assets/red_tile.png"),
+                        movement=Movement(position=MovementManipulator(640, 680), static=False),
+                        bounded_action=Action.stop(), player_controlled=True)
+        monitor = LatencyMonitor(window=frames)
+        scene = Scene("Latency", sprites=sprites + [player], latency_monitor=monitor, late_input=late_input)
+        scene._prepare()
+        for _ in range(frames):
+            scene._frame(scene.physics_step, 0)
+        print(f"{'late' if late_input else 'early'} input sampling with {sprite_count} sprites: {monitor.report()}")
+
+
+def benchmark_archetypes(count=5000):
+    """Compare the construction time and memory of identical bricks built one by one and from an archetype."""
+    positions = [(20 + i % 100 * 33, 20 + i // 100 * 17) for i in range(count)]
+
+    def one_by_one():
+        return [Sprite(image=Image(Size(32, 16), image_name="brick", file_location="assets/blue_tile.png"),
+                       movement=Movement(position=MovementManipulator(x, y), static=True),
+                       bounded_action=Action.pass_through(), collision_action=Action.hide())
+                for x, y in positions]
+
+    def from_archetype():
+        brick = Archetype(Image(Size(32, 16), image_name="brick", file_location="assets/blue_tile.png"),
+                          bounded_action=Action.pass_through(), collision_action=Action.hide())
+        return brick.create_many(positions)
+
+    for name, build in (("one by one", one_by_one), ("archetype", from_archetype)):
+        elapsed = min(_timed(build) for _ in range(5))
+        # trace the memory in a separate build, since tracing slows the construction down.
+        tracemalloc.start()
+        sprites = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{len(sprites)} bricks {name}: {elapsed * 1000:.1f}ms, {memory / len(sprites):.0f} bytes per sprite")
+
+
+def benchmark_level_loading(count=50000):
+    """Compare the load time breakdown of a large level stored as JSON and in the binary form."""
+    with open("assets/levels/bricks.json") as level_file:
+        data = json.load(level_file)
+    data["archetypes"]["brick"] = {"asset": "blue_tile", "collision_action": "hide"}
+    data["sprites"].append({"archetype": "brick",
+                            "positions": [[20 + i % 250 * 32, 20 + i // 250 * 16] for i in range(count)]})
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(f"{directory}/level.json", "w") as level_file:
+            json.dump(data, level_file)
+        Level(data).save_binary(f"{directory}/level.lvl")
+        for extension in ("json", "lvl"):
+            level = Level.load(f"{directory}/level.{extension}")
+            level.build()
+            print(f"{extension} ({os.path.getsize(f'{directory}/level.{extension}')} bytes): {level.report.report()}")
+
+
+def benchmark_colliders(count=2000):
+    """Compare how often balls near the corner of a brick collide and how long the checks take with and without a
+    circle collider."""
+    _init_display()
+    brick = Sprite(image=Image(Size(32, 16), image_name="brick", file_location="assets/blue_tile.png"),
+                   movement=Movement(position=MovementManipulator(100, 100), static=True),
+                   collision_action=Action.bounce())
+    brick.update()
+    # balls around the top left corner of the brick, where the rect of a ball reaches further than the ball.
+    positions = [(72 + i % 40 * 0.5, 80 + i // 40 * 0.4) for i in range(count)]
+    for name, collider in (("rect", None), ("circle", CircleCollider())):
+        balls = Archetype(Image(Size(24, 24), image_name="ball", file_location="assets/ball.png"), static=False,
+                          collider=collider).create_many(positions)
+        for ball in balls:
+            ball.update()
+        hits = [ball.collides_with(brick) for ball in balls]
+        elapsed = min(_timed(lambda: [ball.collides_with(brick) for ball in balls]) for _ in range(5))
+        print(f"{name} collisions near a corner: {sum(hits)} of {count} hit, "
+              f"{elapsed / count * 1e6:.2f}us per check")
+
+
+if __name__ == '__main__':
+    benchmark_transform_pool()
+    benchmark_audio_latency()
+    benchmark_replication()
+    benchmark_input_latency()
+    benchmark_archetypes()
+    benchmark_level_loading()
+    benchmark_colliders()
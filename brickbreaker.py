@@ -2,7 +2,8 @@
 import pygame
 
 from models import Sprite, Image, Scene, Movement, MovementManipulator, Angle, Action, Size, KeyboardTrigger, \
-    Trigger, Audio
+    Trigger, Audio, SpritePool, AssetCache, TileLayer, Text, \
+    Archetype, CircleCollider
 
 SCENE_WIDTH = 1080
 SCENE_HEIGHT = 720
@@ -11,9 +12,8 @@ SCENE_HEIGHT = 720
 # SCENE_HEIGHT = 1080
 
 
-def create_brick_sprites():
-    """Create the brick sprites."""
-    brick_sprites = []
+def create_brick_layer():
+    """Create the brick tile layer."""
     size = Size(384 // 3, 128 // 3)
 
     brick_start_width = 0.15 * scene_size.width
@@ -44,31 +44,26 @@ def create_brick_sprites():
         else:
             break
 
-    for i in range(i_start_range, i_end_range):
-        for j in range(j_start_range, j_end_range):
-            x = (i * size.width)
-            y = (j * size.height)
-            img = Image(size=size, image_name=f"tile{i}-{j}", file_location="assets/blue_tile.png")
-            position = MovementManipulator(x, y)
-            movement = Movement(static=True, position=position)
-            sprite = Sprite(image=img, movement=movement, scene_size=scene_size, collision_action=Action.hide())
-            brick_sprites.append(sprite)
-    return brick_sprites
+    brick = Image(size=size, image_name="tile", file_location="assets/blue_tile.png")
+    brick_layer = TileLayer(size, columns=i_end_range - i_start_range, rows=j_end_range - j_start_range,
+                            tiles={1: brick},
+                            position=MovementManipulator(i_start_range * size.width, j_start_range * size.height),
+                            collision_action=Action.hide())
+    brick_layer.fill(1)
+    return brick_layer
+
+
+def create_ball_archetype():
+    """Create the archetype shared by every ball."""
+    # the balls share their image, so its rotations are cached. A circle makes corner hits bounce off at an angle.
+    return Archetype(Image(size=Size(24, 24), image_name="ball", file_location="assets/ball.png", rotation_step=5),
+                     static=False, bounded_action=Action.bounce(), collision_action=Action.bounce(),
+                     scene_size=scene_size, angle_collision=True, collider=CircleCollider())
 
 
 def create_ball_sprite():
     """Create a ball sprite."""
-    return Sprite(
-        image=Image(size=Size(24, 24),
-                    image_name=f"ball",
-                    file_location="assets/ball.png"),
-        movement=Movement(
-            static=False,
-            position=MovementManipulator(600, 600),
-            velocity=MovementManipulator(-5, -5)),
-        bounded_action=Action.bounce(), collision_action=Action.bounce(), scene_size=scene_size,
-        angle_collision=True
-    )
+    return ball_archetype.create(position=(600, 600), velocity=(-5, -5))
 
 
 def create_player_platform():
@@ -84,7 +79,7 @@ def create_player_platform():
     )
 
 
-def create_platform_triggers(sprite):
+def create_platform_triggers(sprite, ball_pool):
     """Create triggers for the platform."""
     def move(key):
         if key == pygame.K_LEFT:
@@ -94,11 +89,8 @@ def create_platform_triggers(sprite):
 
     def spawn_ball(key):
         if key == pygame.K_SPACE:
-            new_ball = create_ball_sprite()
-            new_ball.movement.set_position(sprite.rect.centerx, sprite.rect.centery - 20)
-            new_ball.movement.velocity.x = 0
-            new_ball.movement.velocity.y = -20
-            new_ball.add(sprite.groups())
+            ball_pool.acquire(position=MovementManipulator(sprite.rect.centerx, sprite.rect.centery - 20),
+                              velocity=MovementManipulator(0, -20), groups=sprite.groups())
 
     return [Trigger(pygame.K_LEFT, move), Trigger(pygame.K_RIGHT, move), Trigger(pygame.K_SPACE, spawn_ball)]
 
@@ -143,15 +135,35 @@ def create_audio_triggers():
     return [Trigger(pygame.K_p, manage_audio), Trigger(pygame.K_m, manage_audio), Trigger(pygame.K_s, manage_audio)]
 
 
+def create_hud(brick_layer, player_platform):
+    """Create the score, ball and frame rate counters."""
+    brick_count = brick_layer.count()
+    color = (255, 255, 255)
+    score = Text(0, label="Score: ", position=MovementManipulator(10, 10), color=color,
+                 source=lambda: (brick_count - brick_layer.count()) * 10)
+    balls = Text(0, label="Balls: ", position=MovementManipulator(10, 45), color=color,
+                 source=lambda: sum(1 for group in player_platform.groups() for sprite in group
+                                    if sprite is not player_platform and sprite.visible))
+    # the frame rate changes every frame, so it is composed from cached glyphs.
+    frame_rate = Text(0, label="FPS: ", position=MovementManipulator(10, 80), color=color, atlas=True,
+                      value_format="{:.0f}", source=lambda: brick_breaker.clock.get_fps())
+    return [score, balls, frame_rate]
+
+
 if __name__ == '__main__':
     scene_size = Size(SCENE_WIDTH, SCENE_HEIGHT)
     player_platform = create_player_platform()
-    ball = create_ball_sprite()
+    ball_archetype = create_ball_archetype()
+    ball_pool = SpritePool(create_ball_sprite, size=16)
+    ball = ball_pool.acquire()
     ball_death_floor = create_ball_death_floor()
     wallpaper = create_wallpaper()
-    sprites = [wallpaper, ball_death_floor] + create_brick_sprites() + [ball, player_platform]
-    platform_triggers = create_platform_triggers(player_platform)
+    brick_layer = create_brick_layer()
+    sprites = [wallpaper, ball_death_floor, brick_layer, ball, player_platform] + \
+        create_hud(brick_layer, player_platform)
+    platform_triggers = create_platform_triggers(player_platform, ball_pool)
     audio_triggers = create_audio_triggers()
     brick_breaker = Scene("Brick Breaker", sprites=sprites, size=scene_size,
-                          keyboard_input=KeyboardTrigger(platform_triggers + audio_triggers))
+                          keyboard_input=KeyboardTrigger(platform_triggers + audio_triggers), asset_cache=AssetCache(),
+                          dirty_rects=True, idle_timeout=0.5)
     brick_breaker.start()
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from . import Image
+from .Movement import REFERENCE_FRAME_RATE
+
+
+@dataclass
+class Animation:
+    """
+    A sequence of frames played at a fixed rate. Animations hold no playback state, so sprites can share them.
+
+    :param frames: List[:ref:`Image`]
+        The frames in playing order, such as the frames of a row of a :ref:`SpriteSheet`.
+    :param fps: float
+        The amount of frames shown per second.
+    :param loop: bool
+        Whether the animation starts over after its last frame.
+    :param next_state: Optional[str]
+        The state to play once an animation that does not loop ends.
+        Without one, the animation holds its last frame.
+    """
+    frames: List[Image]
+    fps: float = 12.0
+    loop: bool = True
+    next_state: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Get the time in seconds to play every frame once."""
+        return len(self.frames) / self.fps
+
+
+class Animator:
+    """
+    The animation state of a single sprite. Each state plays an :ref:`Animation`.
+
+    The animator is advanced by the sprite every physics step, so animations play at the same speed at any frame rate.
+
+    :param animations: Dict[str, :ref:`Animation`]
+        The animations by state name.
+    :param state: Optional[str]
+        The state to start in. Defaults to the first state.
+    :param speed: float
+        The factor time passes at for the animations.
+    """
+    def __init__(self, animations: Dict[str, Animation], state: str = None, speed: float = 1.0):
+        self.animations = animations
+        self.speed = speed
+        self.state = state or next(iter(animations))
+        self.frame_index = 0
+        self.elapsed = 0.0
+        # whether an animation without a loop or next state reached its last frame.
+        self.finished = False
+
+    @property
+    def animation(self) -> Animation:
+        """Get the animation of the current state."""
+        return self.animations[self.state]
+
+    @property
+    def image(self) -> Image:
+        """Get the frame to show."""
+        return self.animation.frames[self.frame_index]
+
+    def play(self, state: str, restart: bool = False):
+        """Switch to another state.
+
+        :param state: str
+            The name of the state.
+        :param restart: bool
+            Start the animation over when it is already playing.
+        """
+        if state == self.state and not restart:
+            return
+        self.state = state
+        self.frame_index = 0
+        self.elapsed = 0.0
+        self.finished = False
+
+    def update(self, dt: float = None) -> bool:
+        """Advance the current animation.
+
+        :param dt: Optional[float]
+            The elapsed time in seconds. Defaults to a single reference frame.
+        :returns: bool
+            Whether the frame to show changed.
+        """
+        if self.finished:
+            return False
+
+        previous = self.image
+        self.elapsed += (1 / REFERENCE_FRAME_RATE if dt is None else dt) * self.speed
+        while not self.finished and self.elapsed >= 1 / self.animation.fps:
+            self.elapsed -= 1 / self.animation.fps
+            animation = self.animation
+            if self.frame_index + 1 < len(animation.frames):
+                self.frame_index += 1
+            elif animation.loop:
+                self.frame_index = 0
+            elif animation.next_state:
+                elapsed = self.elapsed
+                self.play(animation.next_state, restart=True)
+                self.elapsed = elapsed
+            else:
+                self.finished = True
+                self.elapsed = 0.0
+        return self.image is not previous
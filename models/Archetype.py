@@ -0,0 +1,106 @@
+import gc
+from typing import Dict, List, Sequence, Tuple, Type
+
+import numpy as np
+
+from . import Image, Movement, MovementManipulator, Size, Action, Animator, Animation, Collider, \
+    Sprite
+
+
+class Archetype:
+    """
+    The configuration shared by identical sprites, such as the bricks of a level.
+
+    The image, size, actions and flags are stored once on a sprite class made for the archetype. Sprites created from
+    it only keep their own movement, visibility and collision state.
+
+    ..Note:: Sprites of an archetype share their image, so moving sprites should use an image with a rotation step.
+        Otherwise every sprite renders its own rotation of the shared image each physics step.
+
+    :param image: :ref:`Image`
+        The image shared by every sprite.
+    :param static: bool
+        Whether the sprites are static.
+    :param scene_size: Optional[:ref:`Size`]
+        The size of the area the sprites are bounded by.
+    :param bounded_action: Optional[:ref:`Action`]
+        The action for hitting the boundaries of a scene.
+    :param collision_action: Optional[:ref:`Action`]
+        The action for hitting another sprite.
+    :param angle_collision: bool
+        Bounce for collisions using angles.
+    :param player_controlled: bool
+        Whether the sprites are player controlled.
+    :param animations: Optional[Dict[str, :ref:`Animation`]]
+        Animations every sprite plays with its own :ref:`Animator`.
+    :param collider: Optional[:ref:`Collider`]
+        The shape every sprite collides with. Defaults to the rect of the image.
+    :param sprite_type: Type[:ref:`Sprite`]
+        The sprite class to create. Its constructor is not called for the created sprites.
+    """
+    def __init__(self, image: Image, static: bool = True, scene_size: Size = None, bounded_action: Action = None,
+                 collision_action: Action = None, angle_collision: bool = True, player_controlled: bool = False,
+                 animations: Dict[str, Animation] = None, collider: Collider = None,
+                 sprite_type: Type[Sprite] = Sprite):
+        self.image = image
+        self.static = static
+        self.animations = animations
+        self.image.sprite_type = sprite_type.__name__
+        # keep the name of the sprite type so memory accounting and replication see the same type.
+        self.sprite_class: Type[Sprite] = type(sprite_type.__name__, (sprite_type,), {
+            "archetype": self,
+            "image_obj": image,
+            "size": image.size,
+            "animator": None,
+            "_scene_size": scene_size or Size(1280, 720),
+            "_bounded_action": bounded_action or Action.wrap(),
+            "collision_action": collision_action or Action.bounce(),
+            "angle_collision": angle_collision,
+            "player_controlled": player_controlled,
+            "collider": collider.fitted(image.size) if collider else None,
+        })
+
+    def create(self, position: Tuple[float, float] = (0, 0), velocity: Tuple[float, float] = None,
+               visibility: bool = True) -> Sprite:
+        """Create a sprite of the archetype.
+
+        :param position: Tuple[float, float]
+            The center of the sprite.
+        :param velocity: Optional[Tuple[float, float]]
+            The velocity of the sprite. Defaults to not moving.
+        :param visibility: bool
+            Whether the sprite is visible.
+        """
+        sprite = self.sprite_class.__new__(self.sprite_class)
+        super(Sprite, sprite).__init__()
+        movement = Movement(position=MovementManipulator(*position), static=self.static)
+        if velocity is not None:
+            movement.velocity = MovementManipulator(*velocity)
+        sprite._init_state(movement, visibility)
+        if self.animations:
+            sprite.animator = Animator(self.animations)
+            sprite.image_obj = sprite.animator.image
+        return sprite
+
+    def create_many(self, positions: Sequence[Tuple[float, float]],
+                    velocities: Sequence[Tuple[float, float]] = None) -> List[Sprite]:
+        """Create a sprite of the archetype at every position.
+
+        :param positions: Sequence[Tuple[float, float]]
+            The centers of the sprites, such as an array with a row per sprite.
+        :param velocities: Optional[Sequence[Tuple[float, float]]]
+            The velocity of every sprite. Defaults to not moving.
+        :returns: List[:ref:`Sprite`]
+            The sprites in the order of their positions.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2).tolist()
+        velocities = [None] * len(positions) if velocities is None else \
+            np.asarray(velocities, dtype=np.float64).reshape(-1, 2).tolist()
+        # every sprite allocates several objects, which would otherwise trigger many garbage collections.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return [self.create(position, velocity) for position, velocity in zip(positions, velocities)]
+        finally:
+            if collecting:
+                gc.enable()
@@ -0,0 +1,151 @@
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pygame
+
+from . import Size
+
+
+CACHE_FOLDER_PATH = f"{Path(__file__).parent.parent.absolute()}/assets/.cache"
+BYTES_PER_PIXEL = {"RGB": 3, "RGBA": 4}
+
+
+class AssetCache:
+    """
+    Stores decoded and pre-scaled pixel data on disk so images do not have to be decoded again.
+
+    Cached files contain raw pixels only and are keyed by the hash of the source file, the size and the pixel
+    format. On load they are memory-mapped and wrapped as a surface without decoding.
+
+    The mapped pixels are read-only, so surfaces handed out by :ref:`AssetCache.load` and :ref:`AssetCache.get` are
+    copies of them. Images get them without a copy, since they only convert them to the display format.
+
+    :param directory: Optional[str]
+        The folder to store the cached pixel data in.
+    """
+    def __init__(self, directory: str = None):
+        self.directory = directory or CACHE_FOLDER_PATH
+        os.makedirs(self.directory, exist_ok=True)
+        # the mapped files must outlive the surfaces wrapping them.
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._source_hashes: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def pixel_format(file_location: str) -> str:
+        """Get the pixel format an image is cached in.
+
+        :param file_location: str
+            The file location of the source image.
+        """
+        return "RGBA" if '.png' in file_location else "RGB"
+
+    def _source_hash(self, file_location: str) -> str:
+        """Get the hash of a source file."""
+        if file_location not in self._source_hashes:
+            with open(file_location, "rb") as source:
+                self._source_hashes[file_location] = hashlib.sha1(source.read()).hexdigest()
+        return self._source_hashes[file_location]
+
+    def key(self, file_location: str, size: Size, pixel_format: str) -> str:
+        """Get the cache key of an image.
+
+        :param file_location: str
+            The file location of the source image.
+        :param size: :ref:`Size`
+            The size the image is scaled to.
+        :param pixel_format: str
+            The pixel format of the cached data.
+        """
+        return f"{self._source_hash(file_location)}-{size.width}x{size.height}-{pixel_format}"
+
+    def _path(self, key: str) -> str:
+        return f"{self.directory}/{key}.raw"
+
+    def _map(self, file_location: str, size: Size) -> Optional[pygame.Surface]:
+        """Wrap the mapped pixels of a cached image as a surface, which must never be written to."""
+        pixel_format = self.pixel_format(file_location)
+        key = self.key(file_location, size, pixel_format)
+        if key not in self._maps:
+            path = self._path(key)
+            expected_size = size.width * size.height * BYTES_PER_PIXEL[pixel_format]
+            if not os.path.exists(path) or os.path.getsize(path) != expected_size:
+                return None
+            with open(path, "rb") as cached:
+                self._maps[key] = mmap.mmap(cached.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return pygame.image.frombuffer(self._maps[key], size.get_tuple(), pixel_format)
+
+    def load(self, file_location: str, size: Size) -> Optional[pygame.Surface]:
+        """Load a cached image without decoding it.
+
+        :param file_location: str
+            The file location of the source image.
+        :param size: :ref:`Size`
+            The size the image is scaled to.
+        :returns: Optional[pygame.Surface]
+            A copy of the cached pixels or None if the image is not cached.
+        """
+        surface = self._map(file_location, size)
+        return surface.copy() if surface else None
+
+    def store(self, surface: pygame.Surface, file_location: str, size: Size):
+        """Store the pixels of a decoded and scaled image.
+
+        :param surface: pygame.Surface
+            The decoded surface, scaled to `size`.
+        :param file_location: str
+            The file location of the source image.
+        :param size: :ref:`Size`
+            The size the image was scaled to.
+        """
+        pixel_format = self.pixel_format(file_location)
+        path = self._path(self.key(file_location, size, pixel_format))
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as cached:
+            cached.write(pygame.image.tostring(surface, pixel_format))
+        os.replace(temp_path, path)  # never leave a partially written file behind.
+
+    def get(self, file_location: str, size: Size, copy: bool = True) -> pygame.Surface:
+        """Get an image scaled to a size, decoding and caching it on the first run.
+
+        :param file_location: str
+            The file location of the source image.
+        :param size: :ref:`Size`
+            The size to scale the image to.
+        :param copy: bool
+            Copy the cached pixels. Without a copy the surface may wrap the read-only mapped pixels, so it must never
+            be written to, only converted or copied.
+        """
+        surface = self._map(file_location, size)
+        if surface:
+            self.hits += 1
+        else:
+            self.misses += 1
+            surface = pygame.transform.scale(pygame.image.load(file_location), size.get_tuple())
+            self.store(surface, file_location, size)
+            surface = self._map(file_location, size) or surface
+        return surface.copy() if copy else surface
+
+    def warm(self, images: Iterable):
+        """Build the cache ahead of time, such as during installation.
+
+        :param images: Iterable[:ref:`Image`]
+            The images to cache.
+        """
+        for image in images:
+            if not self._map(image.file_location, image.size):
+                self.get(image.file_location, image.size, copy=False)
+
+    def clear(self):
+        """Remove all cached files.
+
+        ..Note:: Mapped files are only released once the surfaces wrapping them are gone.
+        """
+        self._maps.clear()
+        for path in Path(self.directory).glob("*.raw"):
+            path.unlink()
@@ -1,6 +1,46 @@
+from dataclasses import dataclass
+
 from pygame import mixer
 
 
+@dataclass
+class AudioConfig:
+    """
+    Mixer settings that must be applied before pygame initializes.
+
+    :param frequency: int
+        The sample rate in Hz.
+    :param size: int
+        The bits per sample. Negative values are signed.
+    :param channels: int
+        The amount of output channels.
+    :param buffer: int
+        The amount of samples per buffer. Smaller buffers lower the latency at the risk of audio dropouts.
+    """
+    frequency: int = 44100
+    size: int = -16
+    channels: int = 2
+    buffer: int = 512
+
+    @property
+    def buffer_latency(self) -> float:
+        """Get the time in seconds a single buffer holds."""
+        return self.buffer / self.frequency
+
+    @property
+    def bytes_per_second(self) -> int:
+        """Get the amount of output bytes per second."""
+        return self.frequency * self.channels * abs(self.size) // 8
+
+    def pre_init(self):
+        """Apply the settings to the mixer before it is initialized."""
+        mixer.pre_init(self.frequency, self.size, self.channels, self.buffer)
+
+    def init(self):
+        """Initialize the mixer with the settings."""
+        mixer.init(self.frequency, self.size, self.channels, self.buffer)
+
+
 class Audio:
     """
     Stores the information of an audio.
@@ -0,0 +1,70 @@
+import pygame
+
+from . import Size, MovementManipulator
+
+
+class Camera:
+    """
+    A viewport into a world that may be larger than the scene.
+
+    :param viewport: :ref:`Size`
+        The size of the visible area, usually the scene size.
+    :param world_size: Optional[:ref:`Size`]
+        The size of the world. Defaults to the viewport size.
+    :param position: Optional[:ref:`MovementManipulator`]
+        The top left position of the viewport in the world.
+    :param target: Optional[:ref:`Sprite`]
+        A sprite to keep centered in the viewport.
+    """
+    def __init__(self, viewport: Size, world_size: Size = None, position: MovementManipulator = None,
+                 target=None):
+        self.viewport = viewport
+        self.world_size = world_size or viewport
+        self.position = position or MovementManipulator(0, 0)
+        self.target = target
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Get the viewport in world coordinates."""
+        return pygame.Rect(int(self.position.x), int(self.position.y), self.viewport.width, self.viewport.height)
+
+    def follow(self, sprite):
+        """Keep a sprite centered in the viewport.
+
+        :param sprite: Optional[:ref:`Sprite`]
+            The sprite to follow. None stops following.
+        """
+        self.target = sprite
+
+    def move_to(self, x, y):
+        """Move the top left of the viewport, clamped to the world.
+
+        :param x: Union[int, float]
+            The new x position.
+        :param y: Union[int, float]
+            The new y position.
+        """
+        self.position.x = min(max(0, x), max(0, self.world_size.width - self.viewport.width))
+        self.position.y = min(max(0, y), max(0, self.world_size.height - self.viewport.height))
+
+    def update(self):
+        """Center the viewport on the target."""
+        if self.target and self.target.visible:
+            self.move_to(self.target.rect.centerx - self.viewport.width / 2,
+                         self.target.rect.centery - self.viewport.height / 2)
+
+    def world_to_screen(self, position):
+        """Map a position in the world to the viewport.
+
+        :param position: Tuple[int, int]
+            The position in world coordinates.
+        """
+        return position[0] - self.position.x, position[1] - self.position.y
+
+    def screen_to_world(self, position):
+        """Map a position in the viewport, such as the mouse position, to the world.
+
+        :param position: Tuple[int, int]
+            The position in viewport coordinates.
+        """
+        return position[0] + self.position.x, position[1] + self.position.y
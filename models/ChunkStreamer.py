@@ -0,0 +1,330 @@
+import os
+import struct
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from math import floor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import Size, Sprite, MovementManipulator
+
+
+# a chunk file is a header followed by fixed-size sprite records.
+CHUNK_MAGIC = b"CHNK"
+CHUNK_VERSION = 1
+CHUNK_HEADER = struct.Struct("<4sHI")
+CHUNK_RECORD = struct.Struct("<HffffB")
+
+Chunk = Tuple[int, int]
+
+
+@dataclass
+class ChunkRecord:
+    """
+    The stored state of a sprite in a chunk.
+
+    :param kind: int
+        The kind of sprite, used to pick the factory that recreates it.
+    :param x: float
+        The x position of the sprite.
+    :param y: float
+        The y position of the sprite.
+    :param velocity_x: float
+        The horizontal velocity of the sprite.
+    :param velocity_y: float
+        The vertical velocity of the sprite.
+    :param visible: bool
+        Whether the sprite is visible.
+    """
+    kind: int
+    x: float
+    y: float
+    velocity_x: float = 0.0
+    velocity_y: float = 0.0
+    visible: bool = True
+
+    @staticmethod
+    def encode(records: List["ChunkRecord"]) -> bytes:
+        """Pack records into the chunk file format."""
+        return CHUNK_HEADER.pack(CHUNK_MAGIC, CHUNK_VERSION, len(records)) + b"".join(
+            CHUNK_RECORD.pack(record.kind, record.x, record.y, record.velocity_x, record.velocity_y, record.visible)
+            for record in records)
+
+    @staticmethod
+    def decode(data: bytes) -> List["ChunkRecord"]:
+        """Unpack records from the chunk file format."""
+        magic, version, count = CHUNK_HEADER.unpack_from(data)
+        if magic != CHUNK_MAGIC or version != CHUNK_VERSION:
+            raise ValueError(f"Unsupported chunk format {magic!r} version {version}.")
+        body = memoryview(data)[CHUNK_HEADER.size:CHUNK_HEADER.size + count * CHUNK_RECORD.size]
+        return [ChunkRecord(kind, x, y, velocity_x, velocity_y, bool(visible))
+                for kind, x, y, velocity_x, velocity_y, visible in CHUNK_RECORD.iter_unpack(body)]
+
+
+class ChunkStreamer:
+    """
+    Streams the sprites of a large world in fixed-size chunks.
+
+    Chunks near the camera (or a focus sprite) are read and decoded on a worker thread, then their sprites are built
+    and added to the scene on the main thread. Chunks that are far away are written back out and their sprites are
+    removed from the scene, and chunks that move out of range while loading are cancelled.
+
+    ..Note:: Sprites are stored as a kind and their movement, so every kind needs a factory to recreate it.
+
+    :param directory: str
+        The folder with one file per chunk.
+    :param chunk_size: :ref:`Size`
+        The size of a chunk in world pixels.
+    :param kinds: Dict[int, Callable[[], :ref:`Sprite`]]
+        Factories that create a sprite of a kind.
+    :param load_radius: int
+        Chunks within this many chunks of the focus are loaded.
+    :param unload_radius: Optional[int]
+        Chunks further than this many chunks from the focus are unloaded. Defaults to one more than the load radius,
+        so chunks on the border are not reloaded over and over.
+    :param max_sprites: Optional[int]
+        The most streamed sprites kept in memory. The farthest chunks are unloaded first when it is exceeded and
+        chunks that would exceed it are not loaded.
+    :param focus: Optional[:ref:`Sprite`]
+        The sprite to stream around. Defaults to the center of the camera.
+    :param workers: int
+        The amount of threads reading and writing chunks.
+    """
+    def __init__(self, directory: str, chunk_size: Size, kinds: Dict[int, Callable[[], Sprite]],
+                 load_radius: int = 1, unload_radius: int = None, max_sprites: int = None, focus: Sprite = None,
+                 workers: int = 1):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.kinds = kinds
+        self.load_radius = max(0, load_radius)
+        self.unload_radius = max(self.load_radius, unload_radius if unload_radius is not None else load_radius + 1)
+        self.max_sprites = max_sprites
+        self.focus = focus
+        self.workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="chunk-stream")
+        # the sprites of every chunk in memory.
+        self._resident: Dict[Chunk, List[Sprite]] = {}
+        self._loading: Dict[Chunk, Future] = {}
+        self._writing: Dict[Chunk, Future] = {}
+        self._sprite_kinds: Dict[Sprite, int] = {}
+        self.loads = 0
+        self.unloads = 0
+        self.cancelled = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    @property
+    def sprite_count(self) -> int:
+        """Get the amount of streamed sprites in memory."""
+        return sum(len(sprites) for sprites in self._resident.values())
+
+    @property
+    def loading(self) -> bool:
+        """Whether any chunk is still being read."""
+        return bool(self._loading)
+
+    @property
+    def loaded_chunks(self) -> List[Chunk]:
+        """Get the chunks in memory."""
+        return list(self._resident)
+
+    def chunk_of(self, x: float, y: float) -> Chunk:
+        """Get the chunk containing a world position."""
+        return floor(x / self.chunk_size.width), floor(y / self.chunk_size.height)
+
+    def path(self, chunk: Chunk) -> str:
+        """Get the file of a chunk."""
+        return os.path.join(self.directory, f"chunk_{chunk[0]}_{chunk[1]}.bin")
+
+    def save(self, records: Iterable[ChunkRecord]):
+        """Write records to the chunk files of their positions, replacing those files.
+
+        :param records: Iterable[:ref:`ChunkRecord`]
+            The sprites of the world.
+        """
+        chunks: Dict[Chunk, List[ChunkRecord]] = {}
+        for record in records:
+            chunks.setdefault(self.chunk_of(record.x, record.y), []).append(record)
+        writes = []
+        for chunk, chunk_records in chunks.items():
+            data = ChunkRecord.encode(chunk_records)
+            writes.append(self._queue_write(chunk, data))
+            self.bytes_written += len(data)
+        for future in writes:
+            future.result()
+
+    def _queue_write(self, chunk: Chunk, data: bytes) -> Future:
+        """Write a chunk file on a worker thread once the writes already queued for the chunk are done."""
+        future = self._executor.submit(self._write, chunk, data, self._writing.get(chunk))
+        self._writing[chunk] = future
+        return future
+
+    def _write(self, chunk: Chunk, data: bytes, previous_write: Optional[Future]):
+        """Write a chunk file, replacing it only once it is complete. Runs on a worker thread.
+
+        ..Note:: Every write uses its own temporary file and waits for the previous write of the chunk, so the newest
+            state of the chunk is always the one left on disk.
+        """
+        if previous_write:
+            # the previous write was submitted first, so it is already running on another thread or done.
+            wait([previous_write])
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(chunk)
+        descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", prefix=os.path.basename(path),
+                                                      dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _stored_count(self, chunk: Chunk) -> int:
+        """Get the amount of records in a chunk file without reading them."""
+        try:
+            return max(0, (os.path.getsize(self.path(chunk)) - CHUNK_HEADER.size) // CHUNK_RECORD.size)
+        except OSError:
+            return 0
+
+    def _read(self, chunk: Chunk, pending_write: Optional[Future]) -> Tuple[List[ChunkRecord], int]:
+        """Read and decode the records of a chunk along with the size of its file. Runs on a worker thread.
+
+        ..Note:: Nothing the main thread uses is touched here, so a cancelled read can simply be dropped.
+        """
+        if pending_write:
+            pending_write.result()
+        try:
+            with open(self.path(chunk), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return [], 0
+        return ChunkRecord.decode(data), len(data)
+
+    def _focus_position(self, scene) -> Tuple[float, float]:
+        """Get the world position to stream around."""
+        if self.focus:
+            return self.focus.rect.center
+        if scene.camera:
+            return scene.camera.rect.center
+        return scene.size.width / 2, scene.size.height / 2
+
+    @staticmethod
+    def _distance(first: Chunk, second: Chunk) -> int:
+        """Get the distance between chunks in chunks."""
+        return max(abs(first[0] - second[0]), abs(first[1] - second[1]))
+
+    def update(self, scene):
+        """Add the chunks that finished loading, unload far chunks and start loading near chunks.
+
+        :param scene: :ref:`Scene`
+            The scene the sprites are streamed into.
+        """
+        center = self.chunk_of(*self._focus_position(scene))
+        self._writing = {chunk: future for chunk, future in self._writing.items() if not future.done()}
+
+        for chunk, future in list(self._loading.items()):
+            if self._distance(chunk, center) > self.unload_radius:
+                # the chunk moved out of range before it loaded, so it is not needed anymore.
+                future.cancel()
+                del self._loading[chunk]
+                self.cancelled += 1
+            elif future.done():
+                del self._loading[chunk]
+                self._add(scene, chunk, *future.result())
+
+        far = [chunk for chunk in self._resident if self._distance(chunk, center) > self.unload_radius]
+        for chunk in far:
+            self.unload(chunk)
+
+        if self.max_sprites is not None:
+            by_distance = sorted(self._resident, key=lambda resident: self._distance(resident, center), reverse=True)
+            for chunk in by_distance:
+                if self.sprite_count <= self.max_sprites or chunk == center:
+                    break
+                self.unload(chunk)
+
+        near = [(column, row)
+                for column in range(center[0] - self.load_radius, center[0] + self.load_radius + 1)
+                for row in range(center[1] - self.load_radius, center[1] + self.load_radius + 1)]
+        budget = None if self.max_sprites is None else self.max_sprites - self.sprite_count - sum(
+            self._stored_count(chunk) for chunk in self._loading)
+        for chunk in sorted(near, key=lambda chunk: self._distance(chunk, center)):
+            if chunk in self._resident or chunk in self._loading:
+                continue
+            if budget is not None:
+                count = self._stored_count(chunk)
+                if count > budget:
+                    continue
+                budget -= count
+            self._loading[chunk] = self._executor.submit(self._read, chunk, self._writing.get(chunk))
+
+    def _add(self, scene, chunk: Chunk, records: List[ChunkRecord], size: int):
+        """Build the sprites of a loaded chunk and add them to the scene."""
+        sprites = []
+        for record in records:
+            sprite = self.kinds[record.kind]()
+            sprite.reset(MovementManipulator(record.x, record.y),
+                         MovementManipulator(record.velocity_x, record.velocity_y))
+            sprite.scene_size = scene.world_size
+            if not record.visible:
+                sprite.hide()
+            scene.add(sprite)
+            self._sprite_kinds[sprite] = record.kind
+            sprites.append(sprite)
+        self._resident[chunk] = sprites
+        self.bytes_read += size
+        self.loads += 1
+
+    def _owner(self, sprite: Sprite, origin: Chunk) -> Chunk:
+        """Get the chunk a sprite is stored in, which is where it is now unless that chunk is not loaded."""
+        chunk = self.chunk_of(sprite.movement.position.x, sprite.movement.position.y)
+        return chunk if chunk in self._resident else origin
+
+    def unload(self, chunk: Chunk):
+        """Write a chunk out and remove its sprites from the scene.
+
+        ..Note:: Sprites that moved into another loaded chunk are handed over to it, and killed sprites are dropped.
+
+        :param chunk: Tuple[int, int]
+            The chunk to unload.
+        """
+        leaving = []
+        handed_over: Dict[Chunk, List[Sprite]] = {}
+        for origin, sprites in list(self._resident.items()):
+            kept = []
+            for sprite in sprites:
+                owner = self._owner(sprite, origin)
+                if not sprite.alive():
+                    self._sprite_kinds.pop(sprite, None)
+                elif owner == chunk:
+                    leaving.append(sprite)
+                elif origin == chunk:
+                    handed_over.setdefault(owner, []).append(sprite)
+                else:
+                    kept.append(sprite)
+            self._resident[origin] = kept
+        del self._resident[chunk]
+        for owner, sprites in handed_over.items():
+            self._resident[owner].extend(sprites)
+
+        records = [ChunkRecord(self._sprite_kinds.pop(sprite), sprite.movement.position.x,
+                               sprite.movement.position.y, sprite.movement.velocity.x, sprite.movement.velocity.y,
+                               sprite.visible)
+                   for sprite in leaving]
+        for sprite in leaving:
+            sprite.kill()
+        data = ChunkRecord.encode(records)
+        self._queue_write(chunk, data)
+        self.bytes_written += len(data)
+        self.unloads += 1
+
+    def flush(self):
+        """Unload every chunk, writing the current state of the world to disk."""
+        for chunk in list(self._resident):
+            self.unload(chunk)
+
+    def shutdown(self):
+        """Wait for pending reads and writes and stop the worker threads. They are started again when needed."""
+        self._executor.shutdown(wait=True)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="chunk-stream")
@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from math import sqrt
+from typing import Optional, Tuple
+
+import pygame
+
+from . import Size
+
+
+Point = Tuple[float, float]
+
+
+@dataclass
+class Contact:
+    """
+    How two overlapping shapes touch.
+
+    :param normal_x: float
+        The horizontal part of the unit normal, pointing out of the other shape.
+    :param normal_y: float
+        The vertical part of the unit normal, pointing out of the other shape.
+    :param depth: float
+        How far the shapes overlap along the normal.
+    """
+    normal_x: float
+    normal_y: float
+    depth: float
+
+    @property
+    def normal(self) -> Point:
+        """Get the unit normal pointing out of the other shape."""
+        return self.normal_x, self.normal_y
+
+    def flipped(self) -> "Contact":
+        """Get the contact as seen from the other shape."""
+        return Contact(-self.normal_x, -self.normal_y, self.depth)
+
+
+class Collider:
+    """
+    The shape of a sprite used for collisions instead of its image rect. Shapes are centered on the sprite position.
+
+    Use :ref:`CircleCollider` or :ref:`BoxCollider`.
+    """
+    def fitted(self, size: Size) -> "Collider":
+        """Get the collider with its missing dimensions taken from the size of a sprite.
+
+        :param size: :ref:`Size`
+            The size of the sprite.
+        """
+        return self
+
+    def contact(self, center: Point, other: "Collider", other_center: Point) -> Optional[Contact]:
+        """Get how the shape touches another shape.
+
+        :param center: Tuple[float, float]
+            The center of this shape.
+        :param other: :ref:`Collider`
+            The other shape.
+        :param other_center: Tuple[float, float]
+            The center of the other shape.
+        :returns: Optional[:ref:`Contact`]
+            The contact seen from this shape, or None when the shapes do not overlap.
+        """
+        if isinstance(self, CircleCollider):
+            if isinstance(other, CircleCollider):
+                return _circle_circle(self, center, other, other_center)
+            return _circle_box(self, center, other, other_center)
+        if isinstance(other, CircleCollider):
+            contact = _circle_box(other, other_center, self, center)
+            return contact.flipped() if contact else None
+        return _box_box(self, center, other, other_center)
+
+    def contact_rect(self, center: Point, rect: pygame.Rect) -> Optional[Contact]:
+        """Get how the shape touches a rect, such as a tile.
+
+        :param center: Tuple[float, float]
+            The center of this shape.
+        :param rect: pygame.Rect
+            The rect.
+        """
+        return self.contact(center, BoxCollider(rect.width, rect.height), rect.center)
+
+
+class CircleCollider(Collider):
+    """
+    A circle, which suits balls and other round sprites.
+
+    :param radius: Optional[float]
+        The radius. Defaults to half of the smaller side of the sprite.
+    """
+    def __init__(self, radius: float = None):
+        self.radius = radius
+
+    def __repr__(self):
+        return f"CircleCollider(radius={self.radius})"
+
+    def fitted(self, size: Size) -> Collider:
+        if self.radius is not None:
+            return self
+        return CircleCollider(min(size.width, size.height) / 2)
+
+
+class BoxCollider(Collider):
+    """
+    An axis-aligned box.
+
+    :param width: Optional[float]
+        The width. Defaults to the width of the sprite.
+    :param height: Optional[float]
+        The height. Defaults to the height of the sprite.
+    """
+    def __init__(self, width: float = None, height: float = None):
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        return f"BoxCollider(width={self.width}, height={self.height})"
+
+    def fitted(self, size: Size) -> Collider:
+        if self.width is not None and self.height is not None:
+            return self
+        return BoxCollider(size.width if self.width is None else self.width,
+                           size.height if self.height is None else self.height)
+
+
+def _circle_circle(circle: CircleCollider, center: Point, other: CircleCollider,
+                   other_center: Point) -> Optional[Contact]:
+    """Get the contact between two circles."""
+    dx, dy = center[0] - other_center[0], center[1] - other_center[1]
+    radii = circle.radius + other.radius
+    distance_squared = dx * dx + dy * dy
+    if distance_squared >= radii * radii:
+        return None
+    distance = sqrt(distance_squared)
+    if distance == 0:
+        # the centers are on top of each other, so any direction separates them.
+        return Contact(0.0, -1.0, radii)
+    return Contact(dx / distance, dy / distance, radii - distance)
+
+
+def _circle_box(circle: CircleCollider, center: Point, box: BoxCollider, box_center: Point) -> Optional[Contact]:
+    """Get the contact between a circle and a box, seen from the circle."""
+    half_width, half_height = box.width / 2, box.height / 2
+    dx, dy = center[0] - box_center[0], center[1] - box_center[1]
+    # the point of the box closest to the center of the circle.
+    closest_x = min(max(dx, -half_width), half_width)
+    closest_y = min(max(dy, -half_height), half_height)
+
+    if closest_x != dx or closest_y != dy:
+        offset_x, offset_y = dx - closest_x, dy - closest_y
+        distance_squared = offset_x * offset_x + offset_y * offset_y
+        if distance_squared >= circle.radius * circle.radius:
+            return None
+        distance = sqrt(distance_squared)
+        return Contact(offset_x / distance, offset_y / distance, circle.radius - distance)
+
+    # the center is inside of the box, so leave through the nearest side.
+    gap_x, gap_y = half_width - abs(dx), half_height - abs(dy)
+    if gap_x < gap_y:
+        return Contact(1.0 if dx >= 0 else -1.0, 0.0, gap_x + circle.radius)
+    return Contact(0.0, 1.0 if dy >= 0 else -1.0, gap_y + circle.radius)
+
+
+def _box_box(box: BoxCollider, center: Point, other: BoxCollider, other_center: Point) -> Optional[Contact]:
+    """Get the contact between two boxes, separating them along the axis they overlap the least on."""
+    dx, dy = center[0] - other_center[0], center[1] - other_center[1]
+    overlap_x = (box.width + other.width) / 2 - abs(dx)
+    overlap_y = (box.height + other.height) / 2 - abs(dy)
+    if overlap_x <= 0 or overlap_y <= 0:
+        return None
+    if overlap_x < overlap_y:
+        return Contact(1.0 if dx >= 0 else -1.0, 0.0, overlap_x)
+    return Contact(0.0, 1.0 if dy >= 0 else -1.0, overlap_y)
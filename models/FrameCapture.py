@@ -0,0 +1,118 @@
+import logging
+import os
+import queue
+import threading
+from typing import Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class FrameCapture:
+    """
+    Records presented frames on a background thread without stalling the game loop.
+
+    Frames are copied once on the game thread since the display buffer is reused on the next frame.
+    Converting and writing them happens on the writer thread. When the writer falls behind, frames are dropped
+    and counted instead of blocking.
+
+    :param directory: str
+        The folder to write frames to.
+    :param frame_format: str
+        Either "raw" to append RGB frames to a single file or "png" for a numbered image sequence.
+    :param queue_size: int
+        The amount of frames that may wait for the writer.
+    :param every: int
+        Capture every n-th presented frame.
+    """
+    def __init__(self, directory: str, frame_format: str = "raw", queue_size: int = 60, every: int = 1):
+        if frame_format not in ("raw", "png"):
+            raise ValueError(f"Unknown frame format {frame_format!r}, expected 'raw' or 'png'.")
+        self.directory = directory
+        self.frame_format = frame_format
+        self.every = max(1, every)
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self._presented = 0
+        self._queue = queue.Queue(queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._raw_file = None
+        # the error that stopped the writer thread, if any.
+        self.error: Optional[BaseException] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """Start the writer thread."""
+        if self.running:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._write_frames, name="frame-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write the remaining frames and stop the writer thread.
+
+        ..Note:: Frames that a failed writer left in the queue are counted as dropped.
+        """
+        if not self.running:
+            return
+        while self._thread.is_alive():
+            try:
+                # a writer that died would never make room in a full queue, so keep checking on it.
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self._thread.join()
+        self._thread = None
+        while not self._queue.empty():
+            if self._queue.get_nowait() is not None:
+                self.dropped += 1
+        if self._raw_file:
+            self._raw_file.close()
+            self._raw_file = None
+
+    def capture(self, surface: pygame.Surface):
+        """Queue a frame for writing.
+
+        :param surface: pygame.Surface
+            The surface to capture, usually the display.
+        """
+        self._presented += 1
+        if not self.running or self._presented % self.every:
+            return
+        if self._queue.full():
+            self.dropped += 1
+            return
+
+        self._queue.put_nowait((self.captured, surface.copy()))
+        self.captured += 1
+
+    def _write_frames(self):
+        """Write queued frames until stopped or writing fails."""
+        try:
+            self._write_queued()
+        except (OSError, pygame.error) as error:
+            self.error = error
+            logger.error("Frame capture stopped after %d frames: %s", self.written, error)
+
+    def _write_queued(self):
+        """Write queued frames until stopped."""
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            index, surface = frame
+            if self.frame_format == "png":
+                pygame.image.save(surface, f"{self.directory}/frame_{index:06d}.png")
+            else:
+                if not self._raw_file:
+                    width, height = surface.get_size()
+                    self._raw_file = open(f"{self.directory}/frames_{width}x{height}.rgb", "ab")
+                self._raw_file.write(pygame.image.tostring(surface, "RGB"))
+            self.written += 1
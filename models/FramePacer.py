@@ -0,0 +1,73 @@
+import asyncio
+import time
+from typing import List, Optional
+
+
+class FramePacer:
+    """
+    Paces frames on an asyncio event loop instead of sleeping the whole thread.
+
+    ..Note:: Other tasks on the event loop run while the pacer waits for the next frame,
+        so their I/O overlaps with the frame sleep instead of the frame work.
+
+    :param frame_rate: int
+        The target amount of frames per second. Zero does not limit the frame rate.
+    """
+    def __init__(self, frame_rate: int):
+        self.frame_rate = abs(frame_rate)
+        self.frame = 0
+        # the time spent between the end of the last wait and the start of this one.
+        self.rawtime = 0.0
+        self._deadline: Optional[float] = None
+        self._last_tick: Optional[float] = None
+        self._waiters: List[asyncio.Future] = []
+
+    @property
+    def frame_time(self) -> float:
+        """The target duration of a frame in seconds."""
+        return 1 / self.frame_rate if self.frame_rate else 0.0
+
+    def next_frame(self) -> asyncio.Future:
+        """Get a future that resolves with the frame number once the current frame has been presented."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        return waiter
+
+    def _release_waiters(self):
+        """Resolve every waiting future so their coroutines resume during the frame sleep."""
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(self.frame)
+
+    async def tick(self) -> float:
+        """Wait until the next frame is due.
+
+        :returns: float
+            The seconds since the previous tick.
+        """
+        now = time.perf_counter()
+        if self._last_tick is None:
+            self._last_tick = self._deadline = now
+        self.rawtime = now - self._last_tick
+
+        self._release_waiters()
+        self._deadline += self.frame_time
+        delay = self._deadline - now
+        if delay < -self.frame_time:
+            # too far behind to catch up, so pace from now rather than rushing frames.
+            self._deadline = now
+        # always yield so coroutines resumed by this frame get to run.
+        await asyncio.sleep(max(0.0, delay))
+
+        now = time.perf_counter()
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        self.frame += 1
+        return elapsed
+
+    def cancel(self):
+        """Cancel every coroutine still waiting for a frame."""
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.cancel()
@@ -1,8 +1,11 @@
+import threading
 from pathlib import Path
+from typing import Dict, Optional
 
 import pygame
 
-from . import Size, Angle
+from . import Size, Angle, AssetCache
+from .SurfaceTracker import surface_tracker
 
 
 ASSETS_FOLDER_PATH = f"{Path(__file__).parent.parent.absolute()}/assets"
@@ -20,15 +23,60 @@ class Image:
     :param wallpaper: bool
         Whether the image is a wallpaper.
         Used for positioning. Defaults to False.
+    :param rotation_step: Optional[float]
+        Rotations are rounded to multiples of this many degrees and cached as frames.
+        Defaults to rotating at the exact angle without caching.
     """
-    def __init__(self, size: Size, image_name=None, file_location=None, wallpaper=False):
+    # when set, decoded and scaled images are shared through an on-disk cache. Scenes set it while they run.
+    asset_cache: Optional[AssetCache] = None
+    rotation_step: Optional[float] = None
+    # when disabled, images keep their unrotated surface instead of rotating every frame.
+    rotation_enabled = True
+
+    def __init__(self, size: Size, image_name=None, file_location=None, wallpaper=False,
+                 rotation_step: float = None):
         self.size: Size = size
         self.image_name = image_name or "DEFAULT"
         self.file_location = file_location or DEFAULT_IMAGE
         self._surface = None
+        # the decoded surface loaded ahead of time, converted once the display is used.
+        self._decoded: Optional[pygame.Surface] = None
+        # images shared between scenes may be preloaded on a worker while the main thread uses them.
+        self._load_lock = threading.Lock()
         # helps for rotating an image at an angle without distorting the image.
         self.no_rotation_surface = None
         self.wallpaper = wallpaper
+        # the type of the sprite using the image, used for memory accounting.
+        self.sprite_type = None
+        # the last scaled surface along with the surface and scale it was created from.
+        self._scaled = (None, None, None)
+        # scaled versions of the unrotated surface by scale.
+        self.scaled_variants: Dict[float, pygame.Surface] = {}
+        if rotation_step:
+            self.rotation_step = rotation_step
+        self._rotation_frames: Dict[float, pygame.Surface] = {}
+        self._rotation_frames_step = self.rotation_step
+        # a single rotation rendered ahead of time, such as by a transform pool.
+        self.prepared_rotation = (None, None)
+
+    def track(self, surface: pygame.Surface) -> pygame.Surface:
+        """Account for a surface created for this image.
+
+        :param surface: pygame.Surface
+            The new surface.
+        :returns: pygame.Surface
+            The same surface.
+        """
+        surface_tracker.track(surface, self.file_location, self.image_name, self.sprite_type)
+        return surface
+
+    def _load(self, asset_cache: AssetCache = None) -> pygame.Surface:
+        """Decode the image file and scale it to the image size."""
+        asset_cache = asset_cache or Image.asset_cache
+        if asset_cache:
+            # the mapped pixels are only converted, never written to, so they are not copied.
+            return asset_cache.get(self.file_location, self.size, copy=False)
+        return pygame.transform.scale(pygame.image.load(self.file_location), self.size.get_tuple())
 
     @property
     def surface(self):
@@ -37,11 +85,15 @@ class Image:
         ..Note:: Is defined as a property because the pygame display must be initialized first.
         """
         if not self._surface:
-            no_rotation_surface = pygame.transform.scale(pygame.image.load(self.file_location), self.size.get_tuple())
-            self.no_rotation_surface = no_rotation_surface.convert_alpha() if '.png' in self.file_location \
-                else no_rotation_surface.convert()
-
-            self._surface = self.no_rotation_surface
+            with self._load_lock:
+                if not self._surface:
+                    no_rotation_surface = self._decoded if self._decoded is not None else self._load()
+                    self._decoded = None
+                    self.no_rotation_surface = no_rotation_surface.convert_alpha() if '.png' in self.file_location \
+                        else no_rotation_surface.convert()
+                    self.track(self.no_rotation_surface)
+
+                    self._surface = self.no_rotation_surface
         return self._surface
 
     @surface.setter
@@ -49,12 +101,101 @@ class Image:
         """Set a new surface."""
         self._surface = new_surface
 
-    def rotate(self, angle: Angle):
-        new_surface = pygame.transform.rotate(self.no_rotation_surface, angle.angle_in_degrees)
+    @property
+    def loaded(self) -> bool:
+        """Whether the image was decoded, either ahead of time or by using its surface."""
+        return self._surface is not None or self._decoded is not None
+
+    def preload(self, asset_cache: AssetCache = None):
+        """Decode the image file ahead of time.
+
+        ..Note:: The surface is not converted to the display format, so it is safe to call from worker threads.
+
+        :param asset_cache: Optional[:ref:`AssetCache`]
+            The cache to load the image from, such as the one of the scene the image is preloaded for.
+        """
+        with self._load_lock:
+            if not self.loaded:
+                self._decoded = self._load(asset_cache)
+        return self
+
+    def release(self):
+        """Drop every surface of the image. They are loaded again the next time the surface is used."""
+        self._surface = None
+        self._decoded = None
+        self.no_rotation_surface = None
+        self._scaled = (None, None, None)
+        self.scaled_variants = {}
+        self._rotation_frames = {}
+        self.prepared_rotation = (None, None)
+
+    def scaled(self, scale: float) -> pygame.Surface:
+        """Get the current surface scaled by a factor.
+
+        ..Note:: The scaled surface is cached until the surface or the scale changes.
+
+        :param scale: float
+            The factor to scale the surface by.
+        """
+        if scale in self.scaled_variants and self.surface is self.no_rotation_surface:
+            return self.scaled_variants[scale]
+
+        source, source_scale, scaled = self._scaled
+        if source is not self.surface or source_scale != scale:
+            width, height = self.surface.get_size()
+            scaled = pygame.transform.scale(self.surface, (max(1, int(width * scale)), max(1, int(height * scale))))
+            self._scaled = (self.surface, scale, self.track(scaled))
+        return scaled
+
+    @property
+    def rotation_frames(self) -> Dict[float, pygame.Surface]:
+        """Get the cached rotation frames by their rounded angle in degrees.
+
+        ..Note:: Frames are dropped whenever the rotation step changes.
+        """
+        if self._rotation_frames_step != self.rotation_step:
+            self._rotation_frames = {}
+            self._rotation_frames_step = self.rotation_step
+        return self._rotation_frames
+
+    def rotation_key(self, degrees: float) -> float:
+        """Get the angle a rotation is rendered and cached at.
+
+        :param degrees: float
+            The requested angle in degrees.
+        """
+        if not self.rotation_step:
+            return degrees
+        return Angle.normalize_degrees(round(degrees / self.rotation_step) * self.rotation_step)
+
+    def render_rotation(self, degrees: float) -> pygame.Surface:
+        """Render the unrotated surface at an angle, cropped to the original size.
+
+        ..Note:: Does not modify the image, so it is safe to call from worker threads.
+
+        :param degrees: float
+            The angle in degrees.
+        """
+        new_surface = pygame.transform.rotate(self.no_rotation_surface, degrees)
         old_rect = self.no_rotation_surface.get_rect().copy()
         old_rect.center = new_surface.get_rect().center
-        new_surface = new_surface.subsurface(old_rect)
-        new_surface = new_surface.convert_alpha() if '.png' in self.file_location else new_surface.convert()
+        # copy instead of convert so the cropped surface no longer depends on the rotated one.
+        return self.track(new_surface.subsurface(old_rect).copy())
+
+    def rotate(self, angle: Angle):
+        if not self.rotation_enabled:
+            self.surface = self.no_rotation_surface
+            return self.no_rotation_surface.get_rect()
+
+        key = self.rotation_key(angle.angle_in_degrees)
+        new_surface = self.rotation_frames.get(key)
+        if new_surface is None:
+            prepared_key, new_surface = self.prepared_rotation
+            if prepared_key != key:
+                new_surface = self.render_rotation(key)
+            if self.rotation_step:
+                self.rotation_frames[key] = new_surface
+
         new_surface_rect = new_surface.get_rect()
         self.surface = new_surface
         return new_surface_rect
@@ -0,0 +1,102 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+
+@dataclass
+class FrameTiming:
+    """
+    The timestamps of the stages of a single frame in seconds.
+
+    :param start: float
+        When the frame started, after waiting for the frame rate.
+    :param input: float
+        When the input was sampled.
+    :param update: float
+        When the simulation finished.
+    :param present: float
+        When the frame was presented on the display.
+    """
+    start: float
+    input: float = 0.0
+    update: float = 0.0
+    present: float = 0.0
+
+    @property
+    def input_to_present(self) -> float:
+        """Get the time between sampling the input and showing its result."""
+        return self.present - self.input
+
+    @property
+    def input_delay(self) -> float:
+        """Get the time between the start of the frame and sampling the input."""
+        return self.input - self.start
+
+    @property
+    def update_time(self) -> float:
+        """Get the time spent simulating, including work after sampling the input."""
+        return self.update - self.start
+
+    @property
+    def draw_time(self) -> float:
+        """Get the time spent drawing and presenting."""
+        return self.present - self.update
+
+
+class LatencyMonitor:
+    """
+    Records when each frame samples input, finishes updating and is presented.
+
+    ..Note:: Frames that skip rendering are not recorded, since their input is not presented by them.
+
+    :param window: int
+        The amount of recent frames the report is based on.
+    """
+    def __init__(self, window: int = 300):
+        self.frames: Deque[FrameTiming] = deque(maxlen=window)
+        self._current: Optional[FrameTiming] = None
+
+    def begin(self):
+        """Start timing a frame."""
+        self._current = FrameTiming(time.perf_counter())
+
+    def mark(self, stage: str):
+        """Record the time a stage of the current frame was reached.
+
+        :param stage: str
+            Either input, update or present. Presenting finishes the frame.
+        """
+        if not self._current:
+            return
+        setattr(self._current, stage, time.perf_counter())
+        if stage == "present":
+            self.frames.append(self._current)
+            self._current = None
+
+    def discard(self):
+        """Stop timing the current frame without recording it."""
+        self._current = None
+
+    @staticmethod
+    def _percentile(values: List[float], fraction: float) -> float:
+        """Get the value below which a fraction of the sorted values fall."""
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get the average, 95th percentile and maximum of every measurement in milliseconds."""
+        summary = {}
+        for measurement in ("input_to_present", "input_delay", "update_time", "draw_time"):
+            values = sorted(getattr(frame, measurement) * 1000 for frame in self.frames)
+            if values:
+                summary[measurement] = {"average": sum(values) / len(values),
+                                        "p95": self._percentile(values, 0.95), "max": values[-1]}
+        return summary
+
+    def report(self) -> str:
+        """Get a readable summary of the recorded frames."""
+        lines = [f"{len(self.frames)} frames"]
+        for measurement, values in self.summary().items():
+            lines.append(f"{measurement.replace('_', ' '):>16}: {values['average']:6.2f}ms average, "
+                         f"{values['p95']:6.2f}ms p95, {values['max']:6.2f}ms max")
+        return "\n".join(lines)
@@ -0,0 +1,258 @@
+from typing import List, Optional
+
+import pygame
+
+from . import Size, SpatialGroup
+from .SurfaceTracker import surface_tracker
+
+
+class LayerPolicy:
+    """
+    Represents how a layer updates and draws its sprites.
+
+    :param policy_type: str
+        The policy type.
+    """
+    def __init__(self, policy_type: str):
+        self.type: str = policy_type
+
+    def __eq__(self, other):
+        return self.type.lower() == other.type.lower()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @classmethod
+    def dynamic(cls):
+        """Update and draw the sprites every frame."""
+        return LayerPolicy("dynamic")
+
+    @classmethod
+    def draw_only(cls):
+        """Draw the sprites every frame without updating them."""
+        return LayerPolicy("draw_only")
+
+    @classmethod
+    def cached(cls):
+        """Draw the sprites once into a cached surface that is redrawn only after a change."""
+        return LayerPolicy("cached")
+
+    @classmethod
+    def on_change(cls):
+        """Update the sprites every frame, but draw them again only after they changed or were drawn over."""
+        return LayerPolicy("on_change")
+
+
+class Layer(SpatialGroup):
+    """
+    A named sprite group with its own update and draw policy.
+
+    Sprites in layers that are not updated still receive their collision responses from the sprites that are.
+
+    :param name: str
+        The name of the layer.
+    :param policy: Optional[:ref:`LayerPolicy`]
+        How the layer updates and draws its sprites. Defaults to dynamic.
+    :param sprites: :ref:`Sprite`
+        The sprites to add.
+    :param size: Optional[:ref:`Size`]
+        The size of the cached surface. Set by the scene.
+    """
+    def __init__(self, name: str, policy: LayerPolicy = None, *sprites, size: Size = None):
+        self.name = name
+        self.policy = policy or LayerPolicy.dynamic()
+        self.size = size
+        # the layers whose sprites the sprites of this layer collide with.
+        self.collision_layers: List[Layer] = []
+        self._cache: Optional[pygame.Surface] = None
+        self._scaled_cache = (None, None)
+        # whether the cached surface was fully drawn since it was last rebuilt.
+        self._cache_drawn = False
+        # the areas of the cached surface that were repainted, but not drawn yet.
+        self._repainted: List[pygame.Rect] = []
+        super(Layer, self).__init__(*sprites)
+
+    def __repr__(self):
+        return f"<Layer {self.name} ({len(self)} sprites)>"
+
+    @classmethod
+    def default_layers(cls) -> List:
+        """Get the background, static world, dynamic and UI layers in drawing order."""
+        return [Layer("background", LayerPolicy.cached()), Layer("static", LayerPolicy.cached()),
+                Layer("dynamic", LayerPolicy.dynamic()), Layer("ui", LayerPolicy.on_change())]
+
+    @property
+    def updates(self) -> bool:
+        """Whether the sprites of the layer are updated every physics step."""
+        return self.policy in (LayerPolicy.dynamic(), LayerPolicy.on_change())
+
+    @property
+    def cached(self) -> bool:
+        """Whether the layer is drawn from a cached surface."""
+        return LayerPolicy.cached() == self.policy
+
+    def add_internal(self, sprite, layer=None):
+        super(Layer, self).add_internal(sprite, layer)
+        if self._cache is not None:
+            self.repaint(sprite.rect)
+
+    def remove_internal(self, sprite):
+        super(Layer, self).remove_internal(sprite)
+        if self._cache is not None:
+            self.repaint(sprite.rect)
+
+    def invalidate(self):
+        """Redraw the cached surface before it is drawn next."""
+        self._cache = None
+        self._scaled_cache = (None, None)
+        self._cache_drawn = False
+        self._repainted = []
+
+    def repaint(self, area: pygame.Rect):
+        """Redraw a part of the cached surface, such as where a sprite changed, instead of the whole surface.
+
+        :param area: pygame.Rect
+            The area to redraw in scene coordinates.
+        """
+        if self._cache is None:
+            return
+        area = area.clip(self._cache.get_rect())
+        if not area:
+            return
+        self._cache.fill((0, 0, 0, 0), area)
+        for sprite in self.sprites():
+            rect = sprite.rect
+            if sprite.visible and rect.colliderect(area):
+                part = rect.clip(area)
+                self._cache.blit(sprite.image, part, part.move(-rect.x, -rect.y))
+        self._scaled_cache = (None, None)
+        self._repainted.append(area)
+
+    def update(self, *args, **kwargs):
+        if self.updates:
+            super(Layer, self).update(*args, **kwargs)
+
+    def cached_image(self, scale: float = 1) -> pygame.Surface:
+        """Get the cached surface of all visible sprites in the layer.
+
+        :param scale: float
+            The factor to scale the surface by.
+        """
+        if not self._cache:
+            size = self.size.get_tuple() if self.size else pygame.display.get_surface().get_size()
+            self._cache = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self._cache.blits([(sprite.image, sprite.rect) for sprite in self.sprites() if sprite.visible],
+                              doreturn=False)
+            surface_tracker.track(self._cache, "layer", self.name, type(self).__name__)
+
+        if scale == 1:
+            return self._cache
+
+        cached_scale, scaled = self._scaled_cache
+        if cached_scale != scale:
+            width, height = self._cache.get_size()
+            scaled = pygame.transform.scale(self._cache, (max(1, int(width * scale)), max(1, int(height * scale))))
+            self._scaled_cache = (scale, scaled)
+        return scaled
+
+    def draw(self, surface, *args, **kwargs):
+        if not self.cached:
+            return super(Layer, self).draw(surface, *args, **kwargs)
+        self._repainted = []
+        return [surface.blit(self.cached_image(), (0, 0))]
+
+    def clear(self, surface, background) -> List[pygame.Rect]:
+        """Erase the sprites drawn in the last frame and the repainted parts of a cached surface.
+
+        :param surface: pygame.Surface
+            The surface to clear.
+        :param background: pygame.Surface
+            The background to restore.
+        :returns: List[pygame.Rect]
+            The cleared areas.
+        """
+        if self.cached:
+            return self.clear_dirty(surface, background)
+        cleared = self.lostsprites + [rect for rect in self.spritedict.values() if rect]
+        super(Layer, self).clear(surface, background)
+        return cleared
+
+    @property
+    def needs_full_redraw(self) -> bool:
+        """Whether the cached surface changed since it was last drawn, so everything above it has to be drawn again."""
+        return self.cached and not self._cache_drawn
+
+    def mark_drawn(self):
+        """Record that the whole layer was drawn, such as when the whole display was drawn."""
+        self._cache_drawn = True
+        for sprite in self.sprites():
+            if getattr(sprite, "dirty", False):
+                sprite.dirty = False
+
+    @staticmethod
+    def _changed(sprite) -> bool:
+        """Whether a sprite has to be drawn again. Sprites without a dirty flag always do."""
+        return getattr(sprite, "dirty", True)
+
+    def clear_dirty(self, surface: pygame.Surface, background: pygame.Surface) -> List[pygame.Rect]:
+        """Erase the sprites that will be drawn somewhere else, for drawing only the changed parts of the display.
+
+        :param surface: pygame.Surface
+            The surface to clear.
+        :param background: pygame.Surface
+            The background to restore.
+        :returns: List[pygame.Rect]
+            The cleared areas.
+        """
+        if self.cached:
+            # repainted areas of the cache may have become transparent, so the layers below are drawn there again.
+            repainted, self._repainted = self._repainted, []
+            for rect in repainted:
+                surface.blit(background, rect, rect)
+            return repainted
+
+        cleared, self.lostsprites = self.lostsprites, []
+        if LayerPolicy.on_change() == self.policy:
+            cleared.extend(self.spritedict[sprite] for sprite in self.sprites()
+                           if self._changed(sprite) and self.spritedict[sprite])
+        else:
+            cleared.extend(rect for rect in self.spritedict.values() if rect)
+        for rect in cleared:
+            surface.blit(background, rect, rect)
+        return cleared
+
+    def draw_dirty(self, surface: pygame.Surface, damaged: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Draw the sprites that changed and repair the damaged areas, for drawing only the changed parts.
+
+        :param surface: pygame.Surface
+            The surface to draw on.
+        :param damaged: List[pygame.Rect]
+            The areas that were cleared or drawn over by other layers this frame.
+        :returns: List[pygame.Rect]
+            The areas that were drawn.
+        """
+        if self.cached:
+            cache = self.cached_image()
+            self._cache_drawn = True
+            surface.blits([(cache, rect, rect) for rect in damaged], doreturn=False)
+            return []
+
+        if LayerPolicy.on_change() != self.policy:
+            return self.draw(surface)
+
+        drawn = []
+        for sprite in self.sprites():
+            if not sprite.visible:
+                continue
+            rect = sprite.rect
+            if self._changed(sprite) or not self.spritedict[sprite]:
+                drawn.append(surface.blit(sprite.image, rect))
+                self.spritedict[sprite] = rect
+                if hasattr(sprite, "dirty"):
+                    sprite.dirty = False
+                continue
+            # only the damaged parts are drawn again, so blended edges are not drawn twice.
+            for area in (rect.clip(damaged_rect) for damaged_rect in damaged):
+                if area:
+                    surface.blit(sprite.image, area, area.move(-rect.x, -rect.y))
+        return drawn
@@ -0,0 +1,450 @@
+import json
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import Size, Image, Action, MovementManipulator, TileLayer, Archetype, Collider, \
+    CircleCollider, BoxCollider
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        # TOML levels need Python 3.11 or the tomli package.
+        tomllib = None
+
+
+# a binary level is a header, the definitions as JSON and one block of packed positions per placement.
+LEVEL_MAGIC = b"LEVL"
+LEVEL_VERSION = 1
+LEVEL_HEADER = struct.Struct("<4sHII")
+PLACEMENT_HEADER = struct.Struct("<HIB")
+
+ACTIONS = ("die", "hide", "wrap", "stop", "bounce", "pass_through", "kill", "kill_non_players")
+COLLIDERS = {"circle": CircleCollider, "box": BoxCollider}
+
+Placement = Tuple[str, np.ndarray, Optional[np.ndarray]]
+
+
+class LevelError(ValueError):
+    """
+    Raised when a level file is invalid.
+
+    :param problems: List[str]
+        Every problem found in the file.
+    :param source: Optional[str]
+        The file the level was read from.
+    """
+    def __init__(self, problems: List[str], source: str = None):
+        self.problems = problems
+        self.source = source
+        super(LevelError, self).__init__(f"Invalid level {source or ''}:\n" + "\n".join(problems))
+
+
+@dataclass
+class LevelLoadReport:
+    """
+    The time spent on each stage of loading a level, in seconds.
+
+    :param parse: float
+        Reading and decoding the file.
+    :param validate: float
+        Checking the level for problems.
+    :param assets: float
+        Creating and decoding the images.
+    :param sprites: float
+        Creating the archetypes, sprites and tile layers.
+    :param asset_count: int
+        The amount of images.
+    :param sprite_count: int
+        The amount of sprites and tile layers.
+    """
+    parse: float = 0.0
+    validate: float = 0.0
+    assets: float = 0.0
+    sprites: float = 0.0
+    asset_count: int = 0
+    sprite_count: int = 0
+
+    @property
+    def total(self) -> float:
+        """Get the time spent on every stage."""
+        return self.parse + self.validate + self.assets + self.sprites
+
+    def report(self) -> str:
+        """Get a readable breakdown of the load time."""
+        return f"{self.sprite_count} sprites and {self.asset_count} assets in {self.total * 1000:.1f}ms: " \
+               f"parse {self.parse * 1000:.1f}ms, validate {self.validate * 1000:.1f}ms, " \
+               f"assets {self.assets * 1000:.1f}ms, sprites {self.sprites * 1000:.1f}ms"
+
+
+class Level:
+    """
+    A level described by data instead of code: the assets it uses, the archetypes built from them, where sprites of
+    every archetype are placed and the tile layers.
+
+    Levels are read from JSON, TOML or the compact binary form written by :ref:`Level.save_binary`.
+    The level is validated when it is loaded, so every problem is reported before any sprite is created.
+    Sprites are created in bulk from their archetype and every asset is loaded once.
+
+    :param data: Dict[str, Any]
+        The level description.
+    :param source: Optional[str]
+        The file the level was read from, used in error messages.
+    """
+    def __init__(self, data: Dict[str, Any], source: str = None):
+        self.data = data
+        self.source = source
+        self.report = LevelLoadReport()
+        self.images: Dict[str, Image] = {}
+        self.archetypes: Dict[str, Archetype] = {}
+
+    @classmethod
+    def load(cls, file_location: str) -> "Level":
+        """Read and validate a level file. The format is picked by the extension: .json, .toml or .lvl.
+
+        :param file_location: str
+            The absolute or relative file location.
+        """
+        start = time.perf_counter()
+        with open(file_location, "rb") as level_file:
+            content = level_file.read()
+        if file_location.endswith(".json"):
+            level = cls(json.loads(content), file_location)
+        elif file_location.endswith(".toml"):
+            if tomllib is None:
+                raise ImportError("Reading TOML levels requires Python 3.11 or the tomli package.")
+            level = cls(tomllib.loads(content.decode()), file_location)
+        elif file_location.endswith(".lvl"):
+            level = cls.from_binary(content, file_location)
+        else:
+            raise ValueError(f"Unknown level format of {file_location}, expected .json, .toml or .lvl.")
+        level.report.parse = time.perf_counter() - start
+        level.validate()
+        return level
+
+    @property
+    def size(self) -> Optional[Size]:
+        """Get the size of the level, if it has one."""
+        size = self.data.get("size")
+        return Size(*size) if size else None
+
+    @staticmethod
+    def _is_pair(value) -> bool:
+        """Check whether a value is a pair of numbers."""
+        return isinstance(value, (list, tuple)) and len(value) == 2 and \
+            all(isinstance(number, (int, float)) and not isinstance(number, bool) for number in value)
+
+    @staticmethod
+    def _is_pairs(value) -> bool:
+        """Check whether a value is a list of pairs of numbers or an array with a row per pair."""
+        if isinstance(value, list):
+            try:
+                value = np.asarray(value, dtype=np.float64)
+            except (TypeError, ValueError):
+                return False
+        return isinstance(value, np.ndarray) and (value.size == 0 or (value.ndim == 2 and value.shape[1] == 2))
+
+    @staticmethod
+    def _is_size(value) -> bool:
+        """Check whether a value is a pair of positive whole numbers."""
+        return isinstance(value, (list, tuple)) and len(value) == 2 and \
+            all(isinstance(number, int) and not isinstance(number, bool) and number > 0 for number in value)
+
+    @classmethod
+    def _is_grid(cls, grid) -> bool:
+        """Check whether a value describes a grid of sprite positions."""
+        return isinstance(grid, dict) and cls._is_pair(grid.get("origin")) and cls._is_pair(grid.get("spacing")) and \
+            all(isinstance(grid.get(key), int) and not isinstance(grid.get(key), bool) and grid[key] >= 0
+                for key in ("columns", "rows"))
+
+    @staticmethod
+    def _is_tile_id(value) -> bool:
+        """Check whether a value is a tile id, which is empty or a positive whole number."""
+        return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 0xFFFF
+
+    @staticmethod
+    def _section(data: Dict[str, Any], key: str, kind: type, problems: List[str]):
+        """Get a section of the level, reporting it and using an empty one when it has the wrong type."""
+        section = data.get(key, kind())
+        if not isinstance(section, kind):
+            problems.append(f"{key}: expected a {'table' if kind is dict else 'list'}")
+            return kind()
+        return section
+
+    @staticmethod
+    def _placement_count(sprite: Dict[str, Any]) -> int:
+        """Get the amount of sprites a valid placement creates."""
+        if "position" in sprite:
+            return 1
+        if "positions" in sprite:
+            return len(sprite["positions"])
+        return sprite["grid"]["columns"] * sprite["grid"]["rows"]
+
+    def validate(self):
+        """Check the whole level and raise a :ref:`LevelError` listing every problem."""
+        start = time.perf_counter()
+        problems = []
+        data = self.data
+        if not isinstance(data, dict):
+            self.report.validate = time.perf_counter() - start
+            raise LevelError(["expected a table with the level definitions"], self.source)
+        if data.get("version", LEVEL_VERSION) != LEVEL_VERSION:
+            problems.append(f"version: unsupported version {data.get('version')}, expected {LEVEL_VERSION}")
+        if "size" in data and not self._is_pair(data["size"]):
+            problems.append("size: expected [width, height]")
+
+        assets = self._section(data, "assets", dict, problems)
+        for name, asset in assets.items():
+            where = f"assets.{name}"
+            if not isinstance(asset, dict):
+                problems.append(f"{where}: expected a table")
+                continue
+            if not isinstance(asset.get("file"), str):
+                problems.append(f"{where}.file: expected a file location")
+            elif not os.path.exists(asset["file"]):
+                problems.append(f"{where}.file: {asset['file']} does not exist")
+            if not self._is_size(asset.get("size")):
+                problems.append(f"{where}.size: expected [width, height] as positive whole numbers")
+            if "wallpaper" in asset and not isinstance(asset["wallpaper"], bool):
+                problems.append(f"{where}.wallpaper: expected true or false")
+            rotation_step = asset.get("rotation_step")
+            if rotation_step is not None and (isinstance(rotation_step, bool) or
+                                              not isinstance(rotation_step, (int, float)) or rotation_step <= 0):
+                problems.append(f"{where}.rotation_step: expected a positive number of degrees")
+
+        archetypes = self._section(data, "archetypes", dict, problems)
+        for name, archetype in archetypes.items():
+            where = f"archetypes.{name}"
+            if not isinstance(archetype, dict):
+                problems.append(f"{where}: expected a table")
+                continue
+            if archetype.get("asset") not in assets:
+                problems.append(f"{where}.asset: unknown asset {archetype.get('asset')!r}")
+            for key in ("bounded_action", "collision_action"):
+                if key in archetype and archetype[key] not in ACTIONS:
+                    problems.append(f"{where}.{key}: unknown action {archetype[key]!r}, expected one of "
+                                    f"{', '.join(ACTIONS)}")
+            if "collider" in archetype and archetype["collider"] not in COLLIDERS:
+                problems.append(f"{where}.collider: unknown collider {archetype['collider']!r}, expected one of "
+                                f"{', '.join(COLLIDERS)}")
+            for key in ("static", "angle_collision", "player_controlled"):
+                if key in archetype and not isinstance(archetype[key], bool):
+                    problems.append(f"{where}.{key}: expected true or false")
+
+        for index, sprite in enumerate(self._section(data, "sprites", list, problems)):
+            where = f"sprites[{index}]"
+            if not isinstance(sprite, dict):
+                problems.append(f"{where}: expected a table")
+                continue
+            if sprite.get("archetype") not in archetypes:
+                problems.append(f"{where}.archetype: unknown archetype {sprite.get('archetype')!r}")
+            placed = False
+            placements = [key for key in ("position", "positions", "grid") if key in sprite]
+            if len(placements) != 1:
+                problems.append(f"{where}: expected exactly one of position, positions or grid")
+            elif "position" in sprite and not self._is_pair(sprite["position"]):
+                problems.append(f"{where}.position: expected [x, y]")
+            elif "positions" in sprite and not self._is_pairs(sprite["positions"]):
+                problems.append(f"{where}.positions: expected a list of [x, y]")
+            elif "grid" in sprite and not self._is_grid(sprite["grid"]):
+                problems.append(f"{where}.grid: expected origin, spacing, columns and rows")
+            else:
+                placed = True
+            if "velocity" in sprite and not self._is_pair(sprite["velocity"]):
+                problems.append(f"{where}.velocity: expected [x, y]")
+            if "velocities" in sprite:
+                if not self._is_pairs(sprite["velocities"]):
+                    problems.append(f"{where}.velocities: expected a list of [x, y]")
+                elif placed and len(sprite["velocities"]) != self._placement_count(sprite):
+                    problems.append(f"{where}.velocities: expected one velocity per position, got "
+                                    f"{len(sprite['velocities'])} for {self._placement_count(sprite)}")
+
+        for index, tile_layer in enumerate(self._section(data, "tile_layers", list, problems)):
+            where = f"tile_layers[{index}]"
+            if not isinstance(tile_layer, dict):
+                problems.append(f"{where}: expected a table")
+                continue
+            tiles = tile_layer.get("tiles", {})
+            if not isinstance(tiles, dict):
+                problems.append(f"{where}.tiles: expected a table of tile ids and assets")
+                tiles = {}
+            for tile_id, asset in tiles.items():
+                if not str(tile_id).isdigit() or int(tile_id) == TileLayer.EMPTY:
+                    problems.append(f"{where}.tiles: tile ids must be positive numbers, got {tile_id!r}")
+                if asset not in assets:
+                    problems.append(f"{where}.tiles.{tile_id}: unknown asset {asset!r}")
+            if not self._is_size(tile_layer.get("tile_size")):
+                problems.append(f"{where}.tile_size: expected [width, height] as positive whole numbers")
+            if "position" in tile_layer and not self._is_pair(tile_layer["position"]):
+                problems.append(f"{where}.position: expected [x, y]")
+            fill = tile_layer.get("fill", TileLayer.EMPTY)
+            if not self._is_tile_id(fill) or (fill != TileLayer.EMPTY and str(fill) not in tiles):
+                problems.append(f"{where}.fill: unknown tile id {fill!r}")
+            if "action" in tile_layer and tile_layer["action"] not in ACTIONS:
+                problems.append(f"{where}.action: unknown action {tile_layer['action']!r}")
+            grid = tile_layer.get("grid")
+            if grid is not None:
+                if not isinstance(grid, list) or not grid or not all(isinstance(row, list) for row in grid):
+                    problems.append(f"{where}.grid: expected a list of rows of tile ids")
+                elif any(len(row) != len(grid[0]) for row in grid):
+                    problems.append(f"{where}.grid: every row needs the same amount of tiles")
+                elif not all(self._is_tile_id(tile_id) for row in grid for tile_id in row):
+                    problems.append(f"{where}.grid: tile ids must be whole numbers")
+                elif any(str(tile_id) not in tiles for row in grid for tile_id in row if tile_id):
+                    problems.append(f"{where}.grid: uses tile ids without an asset")
+            elif not self._is_size((tile_layer.get("columns"), tile_layer.get("rows"))):
+                problems.append(f"{where}: expected a grid, or columns and rows as positive whole numbers")
+
+        self.report.validate = time.perf_counter() - start
+        if problems:
+            raise LevelError(problems, self.source)
+
+    def _placements(self) -> Iterator[Placement]:
+        """Get the archetype, positions and velocities of every placement as arrays."""
+        for sprite in self.data.get("sprites", []):
+            if "position" in sprite:
+                positions = np.array([sprite["position"]], dtype=np.float32)
+            elif "positions" in sprite:
+                positions = np.asarray(sprite["positions"], dtype=np.float32).reshape(-1, 2)
+            else:
+                grid = sprite["grid"]
+                columns, rows = np.meshgrid(np.arange(grid["columns"]), np.arange(grid["rows"]))
+                positions = np.column_stack([columns.ravel(), rows.ravel()]).astype(np.float32)
+                positions *= np.array(grid["spacing"], dtype=np.float32)
+                positions += np.array(grid["origin"], dtype=np.float32)
+
+            velocities = None
+            if "velocities" in sprite:
+                velocities = np.asarray(sprite["velocities"], dtype=np.float32).reshape(-1, 2)
+            elif "velocity" in sprite:
+                velocities = np.tile(np.array(sprite["velocity"], dtype=np.float32), (len(positions), 1))
+            yield sprite["archetype"], positions, velocities
+
+    def build(self, scene_size: Size = None, preload: bool = True) -> List:
+        """Create the sprites and tile layers of the level.
+
+        :param scene_size: Optional[:ref:`Size`]
+            The size of the area the sprites are bounded by. Defaults to the size of the level.
+        :param preload: bool
+            Decode the images now instead of when they are first drawn.
+        :returns: List[Union[:ref:`Sprite`, :ref:`TileLayer`]]
+            The tile layers followed by the sprites in the order they were placed.
+        """
+        start = time.perf_counter()
+        self.images = {name: Image(Size(*asset["size"]), image_name=name, file_location=asset["file"],
+                                   wallpaper=asset.get("wallpaper", False), rotation_step=asset.get("rotation_step"))
+                       for name, asset in self.data.get("assets", {}).items()}
+        if preload:
+            for image in self.images.values():
+                image.preload()
+        self.report.assets = time.perf_counter() - start
+        self.report.asset_count = len(self.images)
+
+        start = time.perf_counter()
+        scene_size = scene_size or self.size
+        self.archetypes = {
+            name: Archetype(self.images[archetype["asset"]], static=archetype.get("static", True),
+                            scene_size=scene_size,
+                            bounded_action=self._action(archetype.get("bounded_action")),
+                            collision_action=self._action(archetype.get("collision_action")),
+                            angle_collision=archetype.get("angle_collision", True),
+                            player_controlled=archetype.get("player_controlled", False),
+                            collider=self._collider(archetype.get("collider")))
+            for name, archetype in self.data.get("archetypes", {}).items()}
+
+        sprites = [self._tile_layer(tile_layer) for tile_layer in self.data.get("tile_layers", [])]
+        for archetype, positions, velocities in self._placements():
+            sprites.extend(self.archetypes[archetype].create_many(positions, velocities))
+        self.report.sprites = time.perf_counter() - start
+        self.report.sprite_count = len(sprites)
+        return sprites
+
+    @staticmethod
+    def _action(name: Optional[str]) -> Optional[Action]:
+        """Get an action by its name."""
+        return getattr(Action, name)() if name else None
+
+    @staticmethod
+    def _collider(name: Optional[str]) -> Optional[Collider]:
+        """Get a collider fitted to the sprite by its name."""
+        return COLLIDERS[name]() if name else None
+
+    def _tile_layer(self, tile_layer: Dict[str, Any]) -> TileLayer:
+        """Create a tile layer of the level."""
+        grid = tile_layer.get("grid")
+        columns = len(grid[0]) if grid else tile_layer["columns"]
+        rows = len(grid) if grid else tile_layer["rows"]
+        layer = TileLayer(Size(*tile_layer["tile_size"]), columns=columns, rows=rows,
+                          tiles={int(tile_id): self.images[asset] for tile_id, asset in tile_layer["tiles"].items()},
+                          position=MovementManipulator(*tile_layer.get("position", (0, 0))),
+                          grid=grid, collision_action=self._action(tile_layer.get("action")))
+        if "fill" in tile_layer:
+            layer.fill(tile_layer["fill"])
+        return layer
+
+    def to_binary(self) -> bytes:
+        """Pack the level into the compact binary form, where positions are stored as 32-bit floats."""
+        archetype_names = list(self.data.get("archetypes", {}))
+        definitions = {key: value for key, value in self.data.items() if key != "sprites"}
+        definitions["archetype_order"] = archetype_names
+
+        blocks = []
+        placement_count = 0
+        for archetype, positions, velocities in self._placements():
+            placement_count += 1
+            blocks.append(PLACEMENT_HEADER.pack(archetype_names.index(archetype), len(positions),
+                                                velocities is not None))
+            blocks.append(positions.astype("<f4").tobytes())
+            if velocities is not None:
+                blocks.append(velocities.astype("<f4").tobytes())
+
+        encoded = json.dumps(definitions, separators=(",", ":")).encode()
+        return LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, len(encoded), placement_count) + encoded + b"".join(blocks)
+
+    @classmethod
+    def from_binary(cls, data: bytes, source: str = None) -> "Level":
+        """Unpack a level from the compact binary form.
+
+        :param data: bytes
+            The packed level.
+        :param source: Optional[str]
+            The file the level was read from.
+        """
+        magic, version, definitions_length, placement_count = LEVEL_HEADER.unpack_from(data)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise LevelError([f"unsupported binary format {magic!r} version {version}"], source)
+
+        offset = LEVEL_HEADER.size
+        definitions = json.loads(bytes(data[offset:offset + definitions_length]))
+        archetype_names = definitions.pop("archetype_order")
+        offset += definitions_length
+
+        sprites = []
+        for _ in range(placement_count):
+            archetype_index, count, has_velocities = PLACEMENT_HEADER.unpack_from(data, offset)
+            offset += PLACEMENT_HEADER.size
+            sprite = {"archetype": archetype_names[archetype_index],
+                      "positions": np.frombuffer(data, "<f4", count * 2, offset).reshape(-1, 2)}
+            offset += count * 8
+            if has_velocities:
+                sprite["velocities"] = np.frombuffer(data, "<f4", count * 2, offset).reshape(-1, 2)
+                offset += count * 8
+            sprites.append(sprite)
+        definitions["sprites"] = sprites
+        return cls(definitions, source)
+
+    def save_binary(self, file_location: str):
+        """Write the level in the compact binary form.
+
+        :param file_location: str
+            The file location, ending with .lvl.
+        """
+        with open(file_location, "wb") as level_file:
+            level_file.write(self.to_binary())
@@ -3,6 +3,11 @@ import math
 from typing import Optional, Union
 
 
+# Velocities are expressed in pixels per reference frame so per-frame values written for a 60 FPS loop
+# keep their meaning when the simulation runs at a different rate.
+REFERENCE_FRAME_RATE = 60
+
+
 @dataclass
 class MovementManipulator:
     """
@@ -118,29 +123,89 @@ class Movement:
         self.img_angle = img_angle or Angle()
         self.move_angle = move_angle or Angle()
         self.static = static
+        # the position before the last update, used to interpolate between two physics states.
+        self.previous_position = MovementManipulator(*self.position.get_tuple())
 
     def set_position(self, center_x, center_y):
-        """Set the object's position."""
+        """Set the object's position.
+
+        ..Note:: This is treated as a teleport, so there is nothing to interpolate from.
+        """
         self.position.x = center_x
         self.position.y = center_y
+        self.previous_position.x = center_x
+        self.previous_position.y = center_y
+
+    def shift(self, dx: float, dy: float):
+        """Move the object along with its previous position, such as when pushing it out of a collision.
+
+        ..Note:: Interpolation keeps moving smoothly instead of sliding across the push.
+
+        :param dx: float
+            The horizontal offset.
+        :param dy: float
+            The vertical offset.
+        """
+        self.position.x += dx
+        self.position.y += dy
+        self.previous_position.x += dx
+        self.previous_position.y += dy
+
+    def reset(self, position: MovementManipulator = None, velocity: MovementManipulator = None):
+        """Reset the movement so the object can be reused.
+
+        :param position: Optional[:ref:`MovementManipulator`]
+            The new position. Keeps the current position if not given.
+        :param velocity: Optional[:ref:`MovementManipulator`]
+            The new velocity. Keeps the current velocity if not given.
+        """
+        if position:
+            self.set_position(*position.get_tuple())
+        if velocity:
+            self.velocity.x, self.velocity.y = velocity.get_tuple()
+        self.acceleration.x, self.acceleration.y = 0, 0
+        self.img_angle.angle = 0
+        self.update_speed()
+        self.update_move_angle()
+
+    def update_position(self, dt: Optional[float] = None):
+        """Update the position of the object.
+
+        :param dt: Optional[float]
+            The elapsed time in seconds. Defaults to a single reference frame.
+        """
+        scale = 1 if dt is None else dt * REFERENCE_FRAME_RATE
+        self.position.x += self.velocity.x * scale
+        self.position.y += self.velocity.y * scale
 
-    def update_position(self):
-        """Update the position of the object."""
-        self.position.x += self.velocity.x
-        self.position.y += self.velocity.y
+    def interpolated_position(self, alpha: float):
+        """Get the position between the previous and the current physics state.
+
+        :param alpha: float
+            How far between the previous (0) and the current (1) state.
+        """
+        x = self.previous_position.x + (self.position.x - self.previous_position.x) * alpha
+        y = self.previous_position.y + (self.position.y - self.previous_position.y) * alpha
+        return x, y
 
     def add_vector(self, angle: Angle, thrust=1):
         """Modify the motion."""
         self.velocity.x += thrust * angle.cos
         self.velocity.y += thrust * angle.sin
 
-    def update(self):
-        """Update the movement."""
+    def update(self, dt: Optional[float] = None):
+        """Update the movement.
+
+        :param dt: Optional[float]
+            The elapsed time in seconds. Defaults to a single reference frame.
+        """
         if not self.static:
+            self.previous_position.x = self.position.x
+            self.previous_position.y = self.position.y
             self.update_speed()
             self.update_move_angle()
             self.update_velocity()
-            self.update_position()
+            self.update_position(dt)
 
     @property
     def is_moving(self):
@@ -0,0 +1,224 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from . import Size, Image, Action
+from .Movement import REFERENCE_FRAME_RATE
+
+
+class ParticleEmitter:
+    """
+    Emits short-lived particles that are stored in arrays instead of being sprites.
+
+    Particles are moved all at once, drawn in a single batch and never enter the sprite groups,
+    so they do not take part in sprite collisions.
+
+    :param max_particles: int
+        The most particles alive at once. New particles are dropped while the emitter is full.
+    :param particle_size: int
+        The width and height in pixels of particles drawn as colored squares.
+    :param images: Optional[List[:ref:`Image`]]
+        Frames to draw the particles with instead of colored squares. A particle moves through the frames over its
+        lifetime.
+    :param gravity: Tuple[float, float]
+        The velocity added to every particle each reference frame.
+    :param bounded_action: Optional[:ref:`Action`]
+        What particles do at the boundaries of the scene: bounce, stop, wrap or die.
+        Defaults to passing through the boundaries.
+    :param layer: str
+        The name of the layer the particles are drawn above.
+    :param seed: Optional[int]
+        Seeds the random spread of emitted particles.
+    """
+    def __init__(self, max_particles: int = 1024, particle_size: int = 2, images: List[Image] = None,
+                 gravity: Tuple[float, float] = (0.0, 0.0), bounded_action: Action = None, layer: str = "dynamic",
+                 seed: int = None):
+        self.max_particles = max_particles
+        self.particle_size = max(1, particle_size)
+        self.images = images or []
+        self.gravity = np.array(gravity, dtype=np.float32)
+        self.bounded_action = bounded_action or Action.pass_through()
+        self.layer = layer
+        self.positions = np.zeros((max_particles, 2), dtype=np.float32)
+        self.velocities = np.zeros((max_particles, 2), dtype=np.float32)
+        self.ages = np.zeros(max_particles, dtype=np.float32)
+        self.lifetimes = np.ones(max_particles, dtype=np.float32)
+        self.colors = np.zeros((max_particles, 3), dtype=np.uint8)
+        # particles are kept packed at the front of the arrays.
+        self.count = 0
+        self.dropped = 0
+        self._random = np.random.default_rng(seed)
+        self._drawn_rect: Optional[pygame.Rect] = None
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, amount: int, position: Tuple[float, float], velocity: Tuple[float, float] = (0.0, 0.0),
+             speed: float = 2.0, spread: float = 360.0, direction: float = 0.0, lifetime: float = 1.0,
+             lifetime_variance: float = 0.25, color: Sequence[int] = (255, 255, 255)):
+        """Emit particles from a point.
+
+        :param amount: int
+            The amount of particles.
+        :param position: Tuple[float, float]
+            The world position to emit from.
+        :param velocity: Tuple[float, float]
+            A velocity added to every particle, such as the velocity of the emitting sprite.
+        :param speed: float
+            The highest speed of a particle in pixels per reference frame. Speeds are spread evenly up to it.
+        :param spread: float
+            The width of the cone in degrees particles are emitted in.
+        :param direction: float
+            The center of the cone in degrees, where 0 points right and 90 points down.
+        :param lifetime: float
+            The average lifetime of a particle in seconds.
+        :param lifetime_variance: float
+            The fraction the lifetime of a particle may differ from the average.
+        :param color: Sequence[int]
+            The RGB color of the particles.
+        """
+        amount = int(amount)
+        free = self.max_particles - self.count
+        if amount > free:
+            self.dropped += amount - free
+            amount = free
+        if amount <= 0:
+            return
+
+        start, end = self.count, self.count + amount
+        angles = np.radians(direction + self._random.uniform(-spread / 2, spread / 2, amount))
+        speeds = self._random.uniform(0, speed, amount)
+        self.positions[start:end] = position
+        self.velocities[start:end, 0] = np.cos(angles) * speeds + velocity[0]
+        self.velocities[start:end, 1] = np.sin(angles) * speeds + velocity[1]
+        self.ages[start:end] = 0
+        self.lifetimes[start:end] = lifetime * (1 + self._random.uniform(-lifetime_variance, lifetime_variance, amount))
+        self.colors[start:end] = color[:3]
+        self.count = end
+
+    def update(self, dt: float, bounds: Size = None):
+        """Move the particles and remove the expired ones.
+
+        :param dt: float
+            The elapsed time in seconds.
+        :param bounds: Optional[:ref:`Size`]
+            The size of the area the bounded action applies to.
+        """
+        if not self.count:
+            return
+
+        count = self.count
+        scale = dt * REFERENCE_FRAME_RATE
+        positions, velocities = self.positions[:count], self.velocities[:count]
+        velocities += self.gravity * scale
+        positions += velocities * scale
+        self.ages[:count] += dt
+        alive = self.ages[:count] < self.lifetimes[:count]
+
+        if bounds and self.bounded_action != Action.pass_through():
+            alive &= self._apply_bounds(positions, velocities, bounds)
+
+        if not alive.all():
+            # pack the surviving particles at the front of the arrays.
+            survivors = np.flatnonzero(alive)
+            kept = len(survivors)
+            for values in (self.positions, self.velocities, self.ages, self.lifetimes, self.colors):
+                values[:kept] = values[survivors]
+            self.count = kept
+
+    def _apply_bounds(self, positions: np.ndarray, velocities: np.ndarray, bounds: Size) -> np.ndarray:
+        """Apply the bounded action to the particles outside of the bounds.
+
+        :returns: np.ndarray
+            Whether each particle survives the boundaries.
+        """
+        limits = np.array([bounds.width, bounds.height], dtype=np.float32)
+        outside_low = positions < 0
+        outside_high = positions > limits
+
+        if self.bounded_action == Action.die():
+            return ~(outside_low | outside_high).any(axis=1)
+
+        if self.bounded_action == Action.wrap():
+            np.mod(positions, limits, out=positions)
+        elif self.bounded_action == Action.bounce():
+            velocities[outside_low] = np.abs(velocities[outside_low])
+            velocities[outside_high] = -np.abs(velocities[outside_high])
+            np.clip(positions, 0, limits, out=positions)
+        elif self.bounded_action == Action.stop():
+            velocities[outside_low | outside_high] = 0
+            np.clip(positions, 0, limits, out=positions)
+        return np.ones(len(positions), dtype=bool)
+
+    def clear(self, surface: pygame.Surface, background: pygame.Surface):
+        """Erase the particles drawn last by drawing the background over them.
+
+        :param surface: pygame.Surface
+            The surface the particles were drawn on.
+        :param background: pygame.Surface
+            The background to restore.
+        :returns: Optional[pygame.Rect]
+            The area that was erased.
+        """
+        cleared, self._drawn_rect = self._drawn_rect, None
+        if cleared:
+            surface.blit(background, cleared, cleared)
+        return cleared
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[float, float] = (0, 0), scale: float = 1):
+        """Draw every particle in a single batch.
+
+        :param surface: pygame.Surface
+            The surface to draw on.
+        :param offset: Tuple[float, float]
+            The world position of the top left of the surface.
+        :param scale: float
+            The factor world positions and frames are scaled by.
+        :returns: Optional[pygame.Rect]
+            The area that was drawn on.
+        """
+        if not self.count:
+            return None
+
+        points = ((self.positions[:self.count] - offset) * scale).astype(np.int32)
+        if self.images:
+            self._draw_frames(surface, points, scale)
+            width, height = self.images[0].size.get_tuple()
+            size = (int(width * scale) + 1, int(height * scale) + 1)
+        else:
+            self._draw_points(surface, points, max(1, int(self.particle_size * scale)))
+            size = (max(1, int(self.particle_size * scale)),) * 2
+
+        low, high = points.min(axis=0), points.max(axis=0)
+        self._drawn_rect = pygame.Rect(int(low[0]), int(low[1]), int(high[0] - low[0]) + size[0],
+                                       int(high[1] - low[1]) + size[1]).clip(surface.get_rect())
+        return self._drawn_rect
+
+    def _draw_frames(self, surface: pygame.Surface, points: np.ndarray, scale: float):
+        """Draw the particles with the frame matching their age."""
+        frames = [image.surface if scale == 1 else image.scaled(scale) for image in self.images]
+        progress = self.ages[:self.count] / self.lifetimes[:self.count]
+        indexes = np.minimum((progress * len(frames)).astype(np.int32), len(frames) - 1)
+        surface.blits([(frames[index], (x, y)) for index, (x, y) in zip(indexes.tolist(), points.tolist())],
+                      doreturn=False)
+
+    def _draw_points(self, surface: pygame.Surface, points: np.ndarray, size: int):
+        """Write the particle colors straight into the pixels of the surface."""
+        width, height = surface.get_size()
+        inside = (points[:, 0] >= 0) & (points[:, 1] >= 0) & (points[:, 0] < width - size + 1) & \
+                 (points[:, 1] < height - size + 1)
+        xs, ys, colors = points[inside, 0], points[inside, 1], self.colors[:self.count][inside]
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except ValueError:
+            # the surface format cannot be viewed as an array, so fill one square at a time.
+            for x, y, color in zip(xs.tolist(), ys.tolist(), colors.tolist()):
+                surface.fill(color, (x, y, size, size))
+            return
+
+        for dx in range(size):
+            for dy in range(size):
+                pixels[xs + dx, ys + dy] = colors
+        # release the lock on the surface.
+        del pixels
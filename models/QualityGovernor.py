@@ -0,0 +1,162 @@
+from collections import deque
+from typing import Callable, List
+
+import pygame
+
+from . import Image
+
+
+QUALITY_CHANGED = pygame.event.custom_type()
+
+
+class QualityStep:
+    """
+    A single quality reduction the governor can apply to and restore on a scene.
+
+    :param name: str
+        The name of the step.
+    :param degrade: Callable[[:ref:`Scene`], None]
+        Lowers the quality of the scene.
+    :param restore: Callable[[:ref:`Scene`], None]
+        Restores the quality of the scene.
+    """
+    def __init__(self, name: str, degrade: Callable, restore: Callable):
+        self.name = name
+        self.degrade = degrade
+        self.restore = restore
+
+    @classmethod
+    def rotation_granularity(cls, step: float = 15):
+        """Round rotations to coarse, cached frames.
+
+        ..Note:: Images with their own rotation step are changed too, and a step that is already coarser is kept.
+        """
+        previous = []
+
+        def coarser(current):
+            return max(current or 0, step)
+
+        def degrade(scene):
+            images = {image: image.rotation_step for image in scene.images() if "rotation_step" in vars(image)}
+            previous.append((Image.rotation_step, images))
+            Image.rotation_step = coarser(Image.rotation_step)
+            for image, rotation_step in images.items():
+                image.rotation_step = coarser(rotation_step)
+
+        def restore(_):
+            Image.rotation_step, images = previous.pop()
+            for image, rotation_step in images.items():
+                image.rotation_step = rotation_step
+
+        return QualityStep("rotation_granularity", degrade, restore)
+
+    @classmethod
+    def rotation(cls):
+        """Stop rotating images every frame."""
+        def degrade(_):
+            Image.rotation_enabled = False
+
+        def restore(_):
+            Image.rotation_enabled = True
+
+        return QualityStep("rotation", degrade, restore)
+
+    @classmethod
+    def render_scale(cls, scale: float = 0.5):
+        """Draw at a reduced internal resolution."""
+        previous = []
+
+        def degrade(scene):
+            previous.append(scene.render_scale)
+            scene.render_scale = min(scene.render_scale, scale)
+
+        def restore(scene):
+            scene.render_scale = previous.pop()
+
+        return QualityStep("render_scale", degrade, restore)
+
+    @classmethod
+    def far_updates(cls, interval: int = 4):
+        """Update sprites far outside of the viewport less often."""
+        previous = []
+
+        def degrade(scene):
+            previous.append(scene.far_update_interval)
+            scene.far_update_interval = max(scene.far_update_interval, interval)
+
+        def restore(scene):
+            scene.far_update_interval = previous.pop()
+
+        return QualityStep("far_updates", degrade, restore)
+
+
+class QualityGovernor:
+    """
+    Steps scene quality down when frames exceed their time budget and back up when there is headroom.
+
+    Changes post a :data:`QUALITY_CHANGED` event and call every listener with the governor, the step
+    and whether the quality was lowered.
+
+    :param steps: Optional[List[:ref:`QualityStep`]]
+        The quality steps in the order they are applied.
+    :param window: int
+        The amount of frames the frame time is averaged over.
+    :param degrade_threshold: float
+        Lower the quality when the average frame time exceeds this fraction of the budget.
+    :param restore_threshold: float
+        Restore the quality when the average frame time drops below this fraction of the budget.
+    :param cooldown: int
+        The amount of frames to wait after a change before measuring again.
+    """
+    def __init__(self, steps: List[QualityStep] = None, window: int = 30, degrade_threshold: float = 1.0,
+                 restore_threshold: float = 0.6, cooldown: int = 60):
+        self.steps = steps or [QualityStep.rotation_granularity(), QualityStep.rotation(),
+                               QualityStep.render_scale(), QualityStep.far_updates()]
+        self.degrade_threshold = degrade_threshold
+        self.restore_threshold = restore_threshold
+        self.cooldown = cooldown
+        self.level = 0  # the amount of steps currently applied.
+        self.listeners: List[Callable] = []
+        self._frame_times = deque(maxlen=window)
+        self._cooldown_frames = 0
+
+    @property
+    def average_frame_time(self) -> float:
+        """Get the average measured frame time in seconds."""
+        return sum(self._frame_times) / len(self._frame_times) if self._frame_times else 0.0
+
+    def record(self, frame_time: float, scene):
+        """Record the time spent on a frame and change the quality if needed.
+
+        :param frame_time: float
+            The time in seconds spent on the frame, excluding the time waiting for the next frame.
+        :param scene: :ref:`Scene`
+            The scene to change the quality of.
+        """
+        if self._cooldown_frames:
+            self._cooldown_frames -= 1
+            return
+
+        self._frame_times.append(frame_time)
+        if len(self._frame_times) < self._frame_times.maxlen:
+            return
+
+        budget = 1 / scene.frame_rate
+        if self.average_frame_time > budget * self.degrade_threshold and self.level < len(self.steps):
+            step = self.steps[self.level]
+            step.degrade(scene)
+            self.level += 1
+            self._changed(step, degraded=True)
+        elif self.average_frame_time < budget * self.restore_threshold and self.level > 0:
+            self.level -= 1
+            step = self.steps[self.level]
+            step.restore(scene)
+            self._changed(step, degraded=False)
+
+    def _changed(self, step: QualityStep, degraded: bool):
+        """Notify about a quality change and start the cooldown."""
+        self._frame_times.clear()
+        self._cooldown_frames = self.cooldown
+        pygame.event.post(pygame.event.Event(QUALITY_CHANGED, level=self.level, step=step.name, degraded=degraded))
+        for listener in self.listeners:
+            listener(self, step, degraded)
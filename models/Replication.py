@@ -0,0 +1,482 @@
+import socket
+import struct
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from . import Sprite, Layer, LayerPolicy
+
+
+# every message is length prefixed and starts with the tick, its flags and the amount of entries.
+MESSAGE_LENGTH = struct.Struct("<I")
+MESSAGE_HEADER = struct.Struct("<IBI")
+KEYFRAME_HEADER = struct.Struct("<H")
+ENTRY_HEADER = struct.Struct("<HB")
+KIND = struct.Struct("<H")
+FIELD = struct.Struct("<f")
+
+KEYFRAME = 1
+# ids are sent as 16 bits to keep entries small, and freed ids are reused.
+MAX_SPRITES = 2 ** 16
+
+# an entry mask says which fields of a sprite follow it.
+SPAWN = 1
+X = 2
+Y = 4
+VELOCITY_X = 8
+VELOCITY_Y = 16
+VISIBILITY = 32
+VISIBLE = 64
+REMOVE = 128
+FIELDS = (X, Y, VELOCITY_X, VELOCITY_Y)
+
+# id, mask, kind, x, y, velocity x, velocity y, visible
+Entry = Tuple[int, int, int, float, float, float, float, bool]
+# x, y, visible, kind, spawn tick
+Snapshot = Tuple[float, float, bool, int, int]
+
+
+def encode(tick: int, entries: List[Entry], tick_rate: int = None) -> bytes:
+    """Pack the entries of a tick into a length prefixed message.
+
+    :param tick: int
+        The server tick.
+    :param entries: List[Entry]
+        The changed sprites.
+    :param tick_rate: Optional[int]
+        The server ticks per second. Only sent with keyframes.
+    """
+    parts = [MESSAGE_HEADER.pack(tick, KEYFRAME if tick_rate else 0, len(entries))]
+    if tick_rate:
+        parts.append(KEYFRAME_HEADER.pack(tick_rate))
+    for sprite_id, mask, kind, *values in entries:
+        mask = (mask | VISIBLE) if values[4] else (mask & ~VISIBLE)
+        parts.append(ENTRY_HEADER.pack(sprite_id, mask))
+        if mask & SPAWN:
+            parts.append(KIND.pack(kind))
+        parts.extend(FIELD.pack(value) for field, value in zip(FIELDS, values) if mask & field)
+    body = b"".join(parts)
+    return MESSAGE_LENGTH.pack(len(body)) + body
+
+
+def decode(body: bytes) -> Tuple[int, Optional[int], List[Entry]]:
+    """Unpack a message without its length prefix.
+
+    :returns: Tuple[int, Optional[int], List[Entry]]
+        The tick, the tick rate of keyframes and the entries. Fields that were not sent are None.
+    """
+    tick, flags, count = MESSAGE_HEADER.unpack_from(body)
+    offset = MESSAGE_HEADER.size
+    tick_rate = None
+    if flags & KEYFRAME:
+        tick_rate, = KEYFRAME_HEADER.unpack_from(body, offset)
+        offset += KEYFRAME_HEADER.size
+
+    entries = []
+    for _ in range(count):
+        sprite_id, mask = ENTRY_HEADER.unpack_from(body, offset)
+        offset += ENTRY_HEADER.size
+        kind = None
+        if mask & SPAWN:
+            kind, = KIND.unpack_from(body, offset)
+            offset += KIND.size
+        values = []
+        for field in FIELDS:
+            if mask & field:
+                values.append(FIELD.unpack_from(body, offset)[0])
+                offset += FIELD.size
+            else:
+                values.append(None)
+        entries.append((sprite_id, mask, kind, *values, bool(mask & VISIBLE)))
+    return tick, tick_rate, entries
+
+
+class ReplicationServer:
+    """
+    Replicates the sprites of an authoritative scene to clients over a local socket.
+
+    Every physics step, the movement and visibility of each sprite is compared with what was last sent,
+    and only the changed fields are sent. Clients that connect receive a keyframe with every field first.
+
+    ..Note:: A headless server can run its scene with the `SDL_VIDEODRIVER` environment variable set to `dummy`.
+
+    :param host: str
+        The address to listen on.
+    :param port: int
+        The port to listen on. Zero picks a free port.
+    :param kind_of: Optional[Callable[[:ref:`Sprite`], int]]
+        Gets the kind of a sprite, which clients use to pick the factory that creates it. Defaults to 0.
+    :param tolerance: float
+        The smallest change of a field that is sent.
+    :param max_buffer: int
+        The most bytes queued for a client. A client that falls further behind gets a keyframe of the current state
+        instead of the queued changes.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, kind_of: Callable[[Sprite], int] = None,
+                 tolerance: float = 0.01, max_buffer: int = 2 ** 20):
+        self.kind_of = kind_of or (lambda sprite: 0)
+        self.tolerance = tolerance
+        self.max_buffer = max_buffer
+        self._listener = socket.create_server((host, port))
+        self._listener.setblocking(False)
+        self._clients: Dict[socket.socket, bytearray] = {}
+        # the bytes at the start of every client buffer that are left of a partly sent message.
+        self._unfinished: Dict[socket.socket, int] = {}
+        self._new_clients: List[socket.socket] = []
+        self._ids: Dict[Sprite, int] = {}
+        self._free_ids: List[int] = []
+        self._next_id = 0
+        # the last sent kind, x, y, velocity x, velocity y and visibility of each sprite.
+        self._sent: Dict[int, list] = {}
+        self.tick = 0
+        self.bytes_per_tick = 0
+        self.keyframe_bytes = 0
+        self.total_bytes = 0
+        self.resyncs = 0
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Get the host and port clients connect to."""
+        return self._listener.getsockname()[:2]
+
+    @property
+    def clients(self) -> int:
+        """Get the amount of connected clients."""
+        return len(self._clients)
+
+    @property
+    def average_bytes_per_tick(self) -> float:
+        """Get the average size of a delta message."""
+        return self.total_bytes / self.tick if self.tick else 0.0
+
+    def _allocate_id(self, sprite: Sprite) -> int:
+        """Assign an id to a new sprite."""
+        if self._free_ids:
+            sprite_id = self._free_ids.pop()
+        else:
+            if self._next_id >= MAX_SPRITES:
+                raise ValueError(f"At most {MAX_SPRITES} sprites can be replicated at the same time.")
+            sprite_id = self._next_id
+            self._next_id += 1
+        self._ids[sprite] = sprite_id
+        return sprite_id
+
+    def update(self, scene):
+        """Accept new clients and send the data that did not fit into the socket buffers yet.
+
+        ..Note:: The changes of a physics step are sent by :ref:`ReplicationServer.step` right after it.
+
+        :param scene: :ref:`Scene`
+            The authoritative scene.
+        """
+        while True:
+            try:
+                client, _ = self._listener.accept()
+            except BlockingIOError:
+                break
+            client.setblocking(False)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._new_clients.append(client)
+        self._flush()
+
+    def step(self, scene):
+        """Send the changes of the physics step that just ran.
+
+        :param scene: :ref:`Scene`
+            The authoritative scene.
+        """
+        self.tick += 1
+        sprites = [sprite for layer in scene.sprite_groups for sprite in layer.sprites() if isinstance(sprite, Sprite)]
+        current = set(sprites)
+        entries: List[Entry] = []
+        freed = []
+        for sprite, sprite_id in list(self._ids.items()):
+            if sprite not in current:
+                del self._ids[sprite]
+                del self._sent[sprite_id]
+                freed.append(sprite_id)
+                entries.append((sprite_id, REMOVE, 0, 0, 0, 0, 0, False))
+
+        for sprite in sprites:
+            movement = sprite.movement
+            state = [movement.position.x, movement.position.y, movement.velocity.x, movement.velocity.y,
+                     sprite.visible]
+            sprite_id = self._ids.get(sprite)
+            if sprite_id is None:
+                sprite_id = self._allocate_id(sprite)
+                kind = self.kind_of(sprite)
+                self._sent[sprite_id] = [kind] + state
+                entries.append((sprite_id, SPAWN | X | Y | VELOCITY_X | VELOCITY_Y | VISIBILITY, kind, *state))
+                continue
+
+            sent = self._sent[sprite_id]
+            mask = 0
+            for index, field in enumerate(FIELDS):
+                if abs(state[index] - sent[index + 1]) > self.tolerance:
+                    mask |= field
+                    sent[index + 1] = state[index]
+            if state[4] != sent[5]:
+                mask |= VISIBILITY
+                sent[5] = state[4]
+            if mask:
+                entries.append((sprite_id, mask, 0, *sent[1:]))
+        # ids are only reused on a later tick, after clients removed their sprites.
+        self._free_ids.extend(freed)
+
+        message = encode(self.tick, entries)
+        self.bytes_per_tick = len(message)
+        self.total_bytes += len(message)
+        keyframe = None
+        for client, buffer in self._clients.items():
+            if len(buffer) + len(message) > self.max_buffer:
+                # the client fell too far behind, so the queued changes are replaced by the current state.
+                keyframe = keyframe or self._keyframe(scene)
+                del buffer[self._unfinished[client]:]
+                buffer += keyframe
+                self.resyncs += 1
+            else:
+                buffer += message
+
+        if self._new_clients:
+            keyframe = keyframe or self._keyframe(scene)
+            for client in self._new_clients:
+                self._clients[client] = bytearray(keyframe)
+                self._unfinished[client] = 0
+            self._new_clients = []
+        self._flush()
+
+    def _keyframe(self, scene) -> bytes:
+        """Pack every field of every sprite into a message."""
+        keyframe = encode(self.tick, [(sprite_id, SPAWN | X | Y | VELOCITY_X | VELOCITY_Y | VISIBILITY, *sent)
+                                      for sprite_id, sent in self._sent.items()], scene.physics_rate)
+        self.keyframe_bytes = len(keyframe)
+        return keyframe
+
+    @staticmethod
+    def _unfinished_after(buffer: bytearray, unfinished: int, sent: int) -> int:
+        """Get the bytes left of the message that is partly sent after sending the start of a buffer."""
+        position = unfinished
+        while position < sent:
+            length, = MESSAGE_LENGTH.unpack_from(buffer, position)
+            position += MESSAGE_LENGTH.size + length
+        return position - sent
+
+    def _flush(self):
+        """Send as much of every client buffer as the sockets accept."""
+        for client, buffer in list(self._clients.items()):
+            try:
+                sent = client.send(buffer) if buffer else 0
+            except BlockingIOError:
+                continue
+            except OSError:
+                client.close()
+                del self._clients[client]
+                del self._unfinished[client]
+                continue
+            self._unfinished[client] = self._unfinished_after(buffer, self._unfinished[client], sent)
+            del buffer[:sent]
+
+    def close(self):
+        """Disconnect every client and stop listening."""
+        for client in list(self._clients) + self._new_clients:
+            client.close()
+        self._clients = {}
+        self._unfinished = {}
+        self._new_clients = []
+        self._listener.close()
+
+
+class ReplicationClient:
+    """
+    Renders the sprites replicated by a :ref:`ReplicationServer`.
+
+    Received ticks are buffered and sprites are drawn between the two ticks around a point slightly in the past,
+    so movement stays smooth even though the state arrives in bursts. The server reuses the ids of removed sprites,
+    so a sprite spawned under a reused id is never interpolated from, or drawn as, the sprite it replaced.
+
+    ..Note:: Replicated sprites are placed in a layer that is drawn but never updated, so the client scene
+        does not simulate them.
+
+    :param host: str
+        The address of the server.
+    :param port: int
+        The port of the server.
+    :param kinds: Dict[int, Callable[[], :ref:`Sprite`]]
+        Factories that create a sprite of a kind.
+    :param delay: float
+        How many ticks behind the newest received tick sprites are drawn.
+    :param layer: str
+        The name of the layer replicated sprites are added to. It is created when the scene does not have it.
+    :param buffer_size: int
+        The amount of received ticks kept for interpolation.
+    """
+    def __init__(self, host: str, port: int, kinds: Dict[int, Callable[[], Sprite]], delay: float = 2,
+                 layer: str = "replicated", buffer_size: int = 32):
+        self.kinds = kinds
+        self.delay = delay
+        self.layer = layer
+        self._socket = socket.create_connection((host, port))
+        self._socket.setblocking(False)
+        self._received = bytearray()
+        # the kind, x, y, velocity x, velocity y, visibility and spawn tick of every sprite.
+        self._state: Dict[int, list] = {}
+        # the drawn sprites along with the tick they were spawned on.
+        self._sprites: Dict[int, Tuple[int, Sprite]] = {}
+        # the x, y, visibility, kind and spawn tick of every sprite by tick.
+        self._snapshots: Deque[Tuple[int, Dict[int, Snapshot]]] = deque(maxlen=buffer_size)
+        # the ids and spawn ticks of sprites whose kind has no factory.
+        self._unknown_kinds: Dict[int, int] = {}
+        self.unknown_entries = 0
+        self.unknown_kinds = 0
+        self.tick_rate = None
+        self._latest_time = None
+        self.bytes_received = 0
+        self.ticks_received = 0
+        self.connected = True
+
+    def _receive(self):
+        """Read everything the server sent and apply the complete messages."""
+        while self.connected:
+            try:
+                data = self._socket.recv(65536)
+            except BlockingIOError:
+                break
+            if not data:
+                self.connected = False
+                break
+            self._received += data
+            self.bytes_received += len(data)
+
+        while len(self._received) >= MESSAGE_LENGTH.size:
+            length, = MESSAGE_LENGTH.unpack_from(self._received)
+            if len(self._received) < MESSAGE_LENGTH.size + length:
+                break
+            body = bytes(self._received[MESSAGE_LENGTH.size:MESSAGE_LENGTH.size + length])
+            del self._received[:MESSAGE_LENGTH.size + length]
+            self._apply(*decode(body))
+
+    def _apply(self, tick: int, tick_rate: Optional[int], entries: List[Entry]):
+        """Apply the entries of a tick to the replicated state."""
+        if tick_rate:
+            self.tick_rate = tick_rate
+            self._state = {}
+            self._snapshots.clear()
+        for sprite_id, mask, kind, *values in entries:
+            if mask & REMOVE:
+                self._state.pop(sprite_id, None)
+                continue
+            if mask & SPAWN:
+                self._state[sprite_id] = [kind, 0.0, 0.0, 0.0, 0.0, True, tick]
+            state = self._state.get(sprite_id)
+            if state is None:
+                # a change of a sprite whose spawn was never received, such as one sent before a keyframe.
+                self.unknown_entries += 1
+                continue
+            for index, value in enumerate(values[:4]):
+                if value is not None:
+                    state[index + 1] = value
+            if mask & VISIBILITY:
+                state[5] = values[4]
+
+        self._snapshots.append((tick, {sprite_id: (state[1], state[2], state[5], state[0], state[6])
+                                       for sprite_id, state in self._state.items()}))
+        self._latest_time = time.perf_counter()
+        self.ticks_received += 1
+
+    @property
+    def average_bytes_per_tick(self) -> float:
+        """Get the average amount of bytes received per tick."""
+        return self.bytes_received / self.ticks_received if self.ticks_received else 0.0
+
+    def _render_tick(self) -> float:
+        """Get the tick to draw, which trails the estimated server tick by the delay."""
+        latest = self._snapshots[-1][0]
+        estimated = latest + (time.perf_counter() - self._latest_time) * self.tick_rate
+        return min(estimated, latest + 1) - self.delay
+
+    def _interpolated(self) -> Dict[int, Snapshot]:
+        """Get the position, visibility, kind and spawn tick of every sprite at the render tick."""
+        render_tick = self._render_tick()
+        older = newer = self._snapshots[0]
+        for snapshot in self._snapshots:
+            if snapshot[0] <= render_tick:
+                older = snapshot
+            else:
+                newer = snapshot
+                break
+        else:
+            newer = older
+
+        (older_tick, older_states), (newer_tick, newer_states) = older, newer
+        alpha = 0.0 if newer_tick == older_tick else min(1.0, max(0.0, (render_tick - older_tick) /
+                                                                 (newer_tick - older_tick)))
+        states = {}
+        for sprite_id, state in newer_states.items():
+            older_state = older_states.get(sprite_id)
+            if older_state is not None and older_state[4] == state[4]:
+                old_x, old_y, visible, kind, spawned = older_state
+                x, y = old_x + (state[0] - old_x) * alpha, old_y + (state[1] - old_y) * alpha
+                state = (x, y, visible, kind, spawned)
+            elif older_state is not None and alpha < 1:
+                # the id was reused after the render tick, so the removed sprite is still drawn until then.
+                state = older_state
+            states[sprite_id] = state
+        return states
+
+    def _replicated_layer(self, scene) -> Layer:
+        """Get the layer of the replicated sprites, creating it below the UI when needed."""
+        layer = scene.layer(self.layer)
+        if layer is None:
+            layer = Layer(self.layer, LayerPolicy.draw_only(), size=scene.world_size)
+            ui = scene.layer("ui")
+            scene.sprite_groups.insert(scene.sprite_groups.index(ui) if ui is not None else len(scene.sprite_groups),
+                                       layer)
+        return layer
+
+    def update(self, scene):
+        """Receive the latest ticks and move the replicated sprites to their interpolated state.
+
+        :param scene: :ref:`Scene`
+            The scene rendering the replicated sprites.
+        """
+        self._receive()
+        if not self._snapshots:
+            return
+
+        states = self._interpolated()
+        # sprites that were removed, or whose id now belongs to a newly spawned sprite.
+        for sprite_id in [sprite_id for sprite_id, (spawned, _) in self._sprites.items()
+                          if sprite_id not in states or states[sprite_id][4] != spawned]:
+            self._sprites.pop(sprite_id)[1].kill()
+        self._unknown_kinds = {sprite_id: spawned for sprite_id, spawned in self._unknown_kinds.items()
+                               if sprite_id in states and states[sprite_id][4] == spawned}
+
+        layer = None
+        for sprite_id, (x, y, visible, kind, spawned) in states.items():
+            sprite = self._sprites.get(sprite_id, (None, None))[1]
+            if sprite is None:
+                if kind not in self.kinds:
+                    # a kind without a factory, which is skipped like changes of unknown sprites.
+                    if sprite_id not in self._unknown_kinds:
+                        self._unknown_kinds[sprite_id] = spawned
+                        self.unknown_kinds += 1
+                    continue
+                if layer is None:
+                    layer = self._replicated_layer(scene)
+                sprite = self.kinds[kind]()
+                self._sprites[sprite_id] = (spawned, sprite)
+                sprite.scene_size = scene.world_size
+                layer.add(sprite)
+            if visible != sprite.visible:
+                sprite.show() if visible else sprite.hide()
+            if visible:
+                sprite.movement.set_position(x, y)
+                sprite.rect.center = (x, y)
+
+    def step(self, scene):
+        """Replicated sprites are only moved by the server."""
+
+    def close(self):
+        """Disconnect from the server."""
+        self._socket.close()
+        self.connected = False
@@ -1,8 +1,19 @@
-from typing import List
+import asyncio
+import logging
+import time
+from typing import List, Optional, Union
 
 import pygame
 
-from . import Size, MovementManipulator, Sprite, Visibility, Color, KeyboardTrigger
+from . import Size, MovementManipulator, Sprite, Visibility, Color, KeyboardTrigger, AssetCache, Image, Camera, \
+    Layer, TransformPool, QualityGovernor, AudioConfig, surface_tracker, FrameCapture, \
+    FramePacer, TileLayer, ChunkStreamer, ParticleEmitter, ReplicationServer, ReplicationClient, \
+    LatencyMonitor, Scheduler
+
+
+logger = logging.getLogger(__name__)
+# posted to wake an idle scene.
+SCENE_WAKE = pygame.event.custom_type()
 
 
 class Scene(Visibility):
@@ -16,64 +27,770 @@ class Scene(Visibility):
     :param frame_rate: int
         The frame rate of the scene.
     :param sprites: Optional[List[:ref:`BaseSprite`]]
-         A list of sprites.
+         A list of sprites. Each sprite is added to the background, static or dynamic layer.
     :param visibility: bool
         Whether the sprite is visible.
     :param keyboard_input: :ref:`KeyboardTrigger`
         Object to control keyboard functionality.
+    :param physics_rate: Optional[int]
+        The amount of fixed physics steps per second. Defaults to the frame rate.
+    :param max_catch_up_steps: int
+        The maximum amount of physics steps run in a single frame before dropping the remaining time.
+    :param interpolate: bool
+        Whether to render sprites between the last two physics states.
+    :param frame_skip: int
+        The maximum amount of consecutive frames that may skip rendering while the simulation is behind.
+    :param asset_cache: Optional[:ref:`AssetCache`]
+        The on-disk cache to load decoded images from while the scene runs.
+    :param render_scale: float
+        The fraction of the scene size sprites are drawn at before being scaled to the display.
+    :param smooth_scaling: bool
+        Whether to use smooth instead of nearest neighbour scaling when presenting a reduced render scale.
+    :param world_size: Optional[:ref:`Size`]
+        The size of the world when it is larger than the scene. Sprites are bounded by the world instead.
+    :param camera: Optional[:ref:`Camera`]
+        The viewport into the world. Created automatically when a world size is given.
+    :param far_update_interval: int
+        Sprites outside of the camera's update margin are only updated every `far_update_interval` physics steps.
+    :param update_margin: int
+        The distance in pixels around the viewport in which sprites are updated every physics step.
+    :param transform_pool: Optional[:ref:`TransformPool`]
+        Worker threads that render the rotations of a physics step in parallel.
+    :param governor: Optional[:ref:`QualityGovernor`]
+        Lowers and restores the quality of the scene based on the measured frame time.
+    :param audio_config: Optional[:ref:`AudioConfig`]
+        The mixer frequency, buffer size and channel count. Defaults to the pygame defaults.
+    :param surface_report_interval: Optional[float]
+        Track the live surfaces and log their growth every this many seconds.
+    :param capture: Optional[:ref:`FrameCapture`]
+        Records every presented frame while the scene is running.
+    :param layers: Optional[List[:ref:`Layer`]]
+        The layers in drawing order. Defaults to a cached background, a cached static world, a dynamic layer and a
+        UI layer, where dynamic sprites collide with each other and with the static world.
+    :param streamer: Optional[:ref:`ChunkStreamer`]
+        Streams the sprites of a large world in and out of the scene in chunks around the camera.
+    :param replication: Optional[Union[:ref:`ReplicationServer`, :ref:`ReplicationClient`]]
+        Sends the state of the sprites to clients every physics step, or draws the sprites replicated by a server.
+    :param latency_monitor: Optional[:ref:`LatencyMonitor`]
+        Records when every frame samples input, finishes updating and is presented.
+    :param late_input: bool
+        Whether to sample input after simulating the world, right before updating player controlled sprites.
+        Input reaches the display sooner, but the world reacts to player controlled sprites a step late.
+    :param dirty_rects: bool
+        Whether to draw and update only the parts of the display that changed instead of the whole display.
+        Not used with a camera or a reduced render scale.
+    :param idle_timeout: Optional[float]
+        While nothing moves, animates or waits to be drawn, block for up to this many seconds waiting for input
+        instead of running frames. Timers keep counting while idle. Disabled by default.
 
 
     """
     def __init__(self, title: str, size: Size = None, frame_rate: int = 60,
-                 sprites: List[Sprite] = None, visibility: bool = True, keyboard_input: KeyboardTrigger = None):
+                 sprites: List[Sprite] = None, visibility: bool = True, keyboard_input: KeyboardTrigger = None,
+                 physics_rate: int = None, max_catch_up_steps: int = 5, interpolate: bool = True,
+                 frame_skip: int = 0, asset_cache: AssetCache = None, render_scale: float = 1.0,
+                 smooth_scaling: bool = False, world_size: Size = None, camera: Camera = None,
+                 far_update_interval: int = 1, update_margin: int = 256, transform_pool: TransformPool = None,
+                 governor: QualityGovernor = None, audio_config: AudioConfig = None,
+                 surface_report_interval: float = None, capture: FrameCapture = None, layers: List[Layer] = None,
+                 streamer: ChunkStreamer = None,
+                 replication: Union[ReplicationServer, ReplicationClient] = None,
+                 latency_monitor: LatencyMonitor = None, late_input: bool = False, dirty_rects: bool = False,
+                 idle_timeout: float = None):
         super(Scene, self).__init__(visibility)
         self.title = title
         self.size: Size = size or Size(1280, 720)
         self.frame_rate = abs(frame_rate)
         self.sprites: List[Sprite] = sprites or []
-        self.sprite_groups = []
+        self.sprite_groups: List[Layer] = layers or Layer.default_layers()
+        if not layers:
+            self.set_collision("dynamic", "dynamic")
+            self.set_collision("dynamic", "static")
+        self.physics_rate = abs(physics_rate or self.frame_rate)
+        self.max_catch_up_steps = max(1, max_catch_up_steps)
+        self.interpolate = interpolate
+        self.frame_skip = max(0, frame_skip)
+        self._accumulator = 0.0
+        self._skipped_frames = 0
+        self._behind = False
+        self.dropped_steps = 0
+        self.asset_cache = asset_cache
+        self._previous_asset_cache: Optional[AssetCache] = None
 
+        self.audio_config = audio_config
+        self.surface_report_interval = surface_report_interval
+        self._last_surface_report = None
+        self.capture = capture
+        if surface_report_interval:
+            surface_tracker.enabled = True
+        if audio_config:
+            # the mixer is initialized by pygame.init, so its settings must come first.
+            audio_config.pre_init()
         pygame.init()
-        screen_res = self.size.get_tuple()
-        self.screen = pygame.display.set_mode(screen_res)
+        # scenes built while another scene is running must not replace its display, so a display of another size
+        # is only opened once the scene starts.
+        self.screen: Optional[pygame.Surface] = None
+        if pygame.display.get_surface() is None or pygame.display.get_surface().get_size() == self.size.get_tuple():
+            self.open_display()
         self.clock = pygame.time.Clock()
         self.background = pygame.Surface(self.size.get_tuple())
         self.background.fill(Color.white())
+        surface_tracker.track(self.background, "scene", "background", type(self).__name__)
         self.keyboard = keyboard_input or KeyboardTrigger()
         self.active = False
+        self.smooth_scaling = smooth_scaling
+        self.canvas = None
+        self._canvas_background = None
+        self._render_scale = 1.0
+        self._redraw_background = False
+        self.render_scale = render_scale
+        self.camera = camera or (Camera(self.size, world_size) if world_size else None)
+        self.world_size = self.camera.world_size if self.camera else self.size
+        self.far_update_interval = max(1, far_update_interval)
+        self.update_margin = update_margin
+        self._steps = 0
+        self.transform_pool = transform_pool
+        self.governor = governor
+        self.streamer = streamer
+        self.replication = replication
+        self.latency_monitor = latency_monitor
+        self.late_input = late_input
+        self.dirty_rects = dirty_rects
+        self.idle_timeout = idle_timeout
+        # frames run and frames skipped while idle, counted at the frame rate.
+        self.busy_frames = 0
+        self.idle_frames = 0
+        self._wake_requested = False
+        self.emitters: List[ParticleEmitter] = []
+        # runs timers and coroutines on the simulated time of the scene.
+        self.scheduler = Scheduler()
+        # only set while the scene runs on an event loop.
+        self.pacer: Optional[FramePacer] = None
+        self._tasks: List[asyncio.Task] = []
         pygame.mixer.init()
 
     def start(self):
         """Start the scene."""
-        sprites = pygame.sprite.OrderedUpdates(*self.sprites)
-        self.sprite_groups.append(sprites)
+        self._prepare()
+        while self._run_loop() is not False and self.active:
+            continue
+        self._finish()
+
+    async def start_async(self):
+        """Start the scene on the running event loop.
+
+        ..Note:: Yields to the event loop every frame, so other coroutines run while the scene waits for its next frame.
+        """
+        self._prepare()
+        self.pacer = FramePacer(self.frame_rate)
+        try:
+            while await self._run_loop_async() is not False and self.active:
+                continue
+        finally:
+            self.pacer.cancel()
+            for task in self._tasks:
+                task.cancel()
+            self._tasks = []
+            self.pacer = None
+            self._finish()
+
+    def next_frame(self) -> asyncio.Future:
+        """Wait for the current frame to be presented.
+
+        ..Note:: Only available while the scene was started with `start_async`.
+
+        :returns: asyncio.Future
+            Resolves with the frame number.
+        """
+        if not self.pacer:
+            raise RuntimeError("The scene is not running on an event loop, start it with start_async.")
+        return self.pacer.next_frame()
+
+    def create_task(self, coroutine) -> asyncio.Task:
+        """Run a coroutine alongside the scene. It is cancelled when the scene finishes.
+
+        :param coroutine: Coroutine
+            The coroutine to run, which may await `next_frame` to resume on frame boundaries.
+        """
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks = [running for running in self._tasks if not running.done()] + [task]
+        return task
+
+    def open_display(self) -> pygame.Surface:
+        """Use the display for the scene, opening it again when another scene changed it.
+
+        ..Note:: Replaces the display of a running scene when their sizes differ.
+        """
+        screen = pygame.display.get_surface()
+        self.screen = screen if screen is not None and screen.get_size() == self.size.get_tuple() \
+            else pygame.display.set_mode(self.size.get_tuple())
+        return self.screen
+
+    def _prepare(self):
+        """Add the sprites to their layers and activate the scene."""
+        self.open_display()
+        for layer in self.sprite_groups:
+            layer.size = self.world_size
+        for sprite in self.sprites:
+            self.add(sprite)
+        if self.asset_cache:
+            # the cache is shared by every image, so the one of the scene before is restored once this one ends.
+            self._previous_asset_cache, Image.asset_cache = Image.asset_cache, self.asset_cache
         pygame.display.set_caption(self.title)
         self.screen.blit(self.background, (0, 0))
+        # the scene may have been built long before it starts, which should not count as elapsed time.
+        self.clock.tick()
         self.active = True
+        if self.capture:
+            self.capture.start()
 
-        while self._run_loop() is not False and self.active:
-            continue
+    def _finish(self):
+        """Clean up after the scene stopped running."""
+        if self.capture:
+            self.capture.stop()
+        if self.streamer:
+            # write the chunks in memory out, or the changes to them are lost once the scene ends.
+            self.streamer.flush()
+            self.streamer.shutdown()
+        if self.asset_cache:
+            Image.asset_cache = self._previous_asset_cache
+
+    def images(self) -> List[Image]:
+        """Get every image used by the sprites of the scene."""
+        images = []
+        for sprite in self.sprites:
+            if isinstance(sprite, TileLayer):
+                images.extend(sprite.tiles.values())
+            elif isinstance(sprite, Sprite):
+                images.append(sprite.image_obj)
+                if sprite.animator:
+                    images.extend(frame for animation in sprite.animator.animations.values()
+                                  for frame in animation.frames)
+        return list(dict.fromkeys(images))
+
+    def release_surfaces(self, keep: List[Image] = None):
+        """Drop the surfaces of the scene so they can be freed while the scene is not running.
+
+        :param keep: Optional[List[:ref:`Image`]]
+            Images to keep loaded, such as the ones shared with the next scene.
+        """
+        keep = set(keep or [])
+        for image in self.images():
+            if image not in keep:
+                image.release()
+        for sprite in self.sprites:
+            if isinstance(sprite, TileLayer):
+                sprite.release()
+        for layer in self.sprite_groups:
+            layer.invalidate()
+
+    def layer(self, name: str) -> Optional[Layer]:
+        """Get a layer by its name.
+
+        :param name: str
+            The name of the layer.
+        """
+        return next((layer for layer in self.sprite_groups if layer.name == name), None)
+
+    def _default_layer(self, sprite) -> Layer:
+        """Get the layer a sprite belongs to when none is given."""
+        image = getattr(sprite, "image_obj", None)
+        name = getattr(sprite, "default_layer", None) or \
+            ("background" if image and image.wallpaper else
+             "static" if sprite.static and not getattr(sprite, "animator", None) else "dynamic")
+        layer = self.layer(name)
+        return layer if layer is not None else self.sprite_groups[-1]
+
+    def add(self, sprite, layer: str = None):
+        """Add a sprite to a layer.
+
+        :param sprite: :ref:`Sprite`
+            The sprite to add.
+        :param layer: Optional[str]
+            The name of the layer. Defaults to the layer matching the sprite.
+        """
+        if self.camera and isinstance(sprite, Sprite):
+            # sprites are bounded by the world instead of the screen the camera looks through.
+            sprite.scene_size = self.world_size
+        target = self.layer(layer) if layer else self._default_layer(sprite)
+        target.add(sprite)
+
+    def move_to_layer(self, sprite, layer: str):
+        """Move a sprite to another layer.
+
+        :param sprite: :ref:`Sprite`
+            The sprite to move.
+        :param layer: str
+            The name of the layer to move to.
+        """
+        sprite.remove(*[group for group in sprite.groups() if group in self.sprite_groups])
+        self.layer(layer).add(sprite)
+
+    def add_emitter(self, emitter: ParticleEmitter):
+        """Add a particle emitter. Its particles are updated every physics step and drawn above its layer.
+
+        :param emitter: :ref:`ParticleEmitter`
+            The emitter to add.
+        """
+        if emitter not in self.emitters:
+            self.emitters.append(emitter)
+
+    def remove_emitter(self, emitter: ParticleEmitter):
+        """Remove a particle emitter.
+
+        :param emitter: :ref:`ParticleEmitter`
+            The emitter to remove.
+        """
+        if emitter in self.emitters:
+            self.emitters.remove(emitter)
+            emitter.clear(self.screen, self.background)
+
+    def _layer_emitters(self, layer: Layer) -> List[ParticleEmitter]:
+        """Get the emitters drawn above a layer."""
+        return [emitter for emitter in self.emitters if emitter.layer == layer.name]
+
+    def set_collision(self, first: str, second: str, enabled: bool = True):
+        """Set whether the sprites of two layers collide with each other.
+
+        :param first: str
+            The name of the first layer.
+        :param second: str
+            The name of the second layer. May be the same as the first layer.
+        :param enabled: bool
+            Whether the layers collide.
+        """
+        first_layer, second_layer = self.layer(first), self.layer(second)
+        for layer, other in ((first_layer, second_layer), (second_layer, first_layer)):
+            if enabled and other not in layer.collision_layers:
+                layer.collision_layers.append(other)
+            elif not enabled and other in layer.collision_layers:
+                layer.collision_layers.remove(other)
+
+    @property
+    def render_scale(self) -> float:
+        """Get the fraction of the scene size sprites are drawn at."""
+        return self._render_scale
+
+    @render_scale.setter
+    def render_scale(self, scale: float):
+        """
+        Set the fraction of the scene size sprites are drawn at. Can be changed while the scene is running.
+
+        :param scale: float
+            A value between 0.1 and 1. A scale of 1 draws directly onto the display.
+        """
+        self._render_scale = min(1.0, max(0.1, scale))
+        self.canvas = None
+        self._canvas_background = None
+        if self._render_scale != 1:
+            render_size = self.to_render_space(self.size.get_tuple())
+            self.canvas = pygame.Surface(render_size).convert()
+            self._canvas_background = pygame.transform.scale(self.background, render_size).convert()
+            surface_tracker.track(self.canvas, "scene", "canvas", type(self).__name__)
+            surface_tracker.track(self._canvas_background, "scene", "background", type(self).__name__)
+        # the display holds the last presented canvas, which sprite groups do not know how to clear.
+        self._redraw_background = True
+
+    def to_render_space(self, position):
+        """Map a position in scene coordinates, such as the mouse position, to the render canvas.
+
+        :param position: Tuple[int, int]
+            The position in scene coordinates.
+        """
+        return int(position[0] * self.render_scale), int(position[1] * self.render_scale)
+
+    def to_scene_space(self, position):
+        """Map a position on the render canvas back to scene coordinates.
+
+        :param position: Tuple[int, int]
+            The position on the render canvas.
+        """
+        return position[0] / self.render_scale, position[1] / self.render_scale
+
+    @property
+    def mouse_position(self):
+        """Get the mouse position in scene coordinates, or world coordinates when there is a camera."""
+        position = pygame.mouse.get_pos()
+        return self.camera.screen_to_world(position) if self.camera else position
+
+    def start_capture(self, capture: FrameCapture):
+        """Start recording presented frames while the scene is running.
+
+        :param capture: :ref:`FrameCapture`
+            The capture to record into.
+        """
+        self.stop_capture()
+        self.capture = capture
+        capture.start()
+
+    def stop_capture(self):
+        """Stop recording and write the remaining frames."""
+        if self.capture:
+            self.capture.stop()
+            self.capture = None
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.QUIT:
             return False
 
+    @property
+    def physics_step(self) -> float:
+        """Get the duration of a single physics step in seconds."""
+        return 1 / self.physics_rate
+
+    def _step(self, dt: float):
+        """Advance the simulation by a single physics step.
+
+        :param dt: float
+            The duration of the step in seconds.
+        """
+        self._steps += 1
+        self.scheduler.advance(dt)
+        if self.transform_pool:
+            self.transform_pool.prepare_rotations(sprite for sprite_group in self.sprite_groups
+                                                  if sprite_group.updates for sprite in sprite_group.sprites())
+        for emitter in self.emitters:
+            emitter.update(dt, self.world_size)
+
+        interval = self.far_update_interval
+        if not self.camera or interval == 1:
+            for sprite_group in self.sprite_groups:
+                self._update_group(sprite_group, dt)
+            return
+
+        near_area = self.camera.rect.inflate(self.update_margin * 2, self.update_margin * 2)
+        for sprite_group in self.sprite_groups:
+            if not sprite_group.updates:
+                continue
+            # the index is otherwise only refreshed when drawing, which has not happened yet for new sprites.
+            sprite_group.refresh()
+            near = set(sprite_group.query(near_area))
+            for position, sprite in enumerate(sprite_group.sprites()):
+                if self._deferred(sprite):
+                    continue
+                if sprite in near:
+                    sprite.update(dt)
+                elif (position + self._steps) % interval == 0:
+                    # spread far sprites over the interval and let them catch up on the skipped time.
+                    sprite.update(dt * interval)
+
+    def _deferred(self, sprite) -> bool:
+        """Check whether a sprite is updated after sampling input late instead of with the world."""
+        return self.late_input and getattr(sprite, "player_controlled", False)
+
+    def _update_group(self, sprite_group: Layer, dt: float):
+        """Update the sprites of a layer, leaving out the deferred sprites."""
+        if not self.late_input:
+            sprite_group.update(dt)
+        elif sprite_group.updates:
+            for sprite in sprite_group.sprites():
+                if not self._deferred(sprite):
+                    sprite.update(dt)
+
+    def _step_players(self, steps: int):
+        """Run the physics steps of the deferred sprites after sampling input late.
+
+        :param steps: int
+            The amount of physics steps the world ran this frame.
+        """
+        players = [sprite for sprite_group in self.sprite_groups if sprite_group.updates
+                   for sprite in sprite_group.sprites() if self._deferred(sprite)]
+        for _ in range(steps):
+            for sprite in players:
+                sprite.update(self.physics_step)
+
+    def _simulate(self, elapsed: float) -> int:
+        """Run as many fixed physics steps as the elapsed time allows.
+
+        :param elapsed: float
+            The time in seconds since the last frame.
+        :returns: int
+            The amount of physics steps that were run.
+        """
+        step = self.physics_step
+        self._accumulator += elapsed
+        if self._accumulator >= step:
+            # rendering may have moved rects to an interpolated position.
+            self._interpolate_sprites(1)
+
+        steps = 0
+        while self._accumulator >= step and steps < self.max_catch_up_steps:
+            self._step(step)
+            if self.replication:
+                self.replication.step(self)
+            self._accumulator -= step
+            steps += 1
+
+        if self._accumulator >= step:
+            # we are too far behind, drop the remaining time instead of spiraling.
+            self.dropped_steps += int(self._accumulator // step)
+            self._accumulator %= step
+            self._behind = True
+        else:
+            self._behind = steps > 1
+        return steps
+
+    def _interpolate_sprites(self, alpha: float):
+        """Place all sprites between their last two physics states.
+
+        :param alpha: float
+            How far between the previous (0) and the current (1) state.
+        """
+        if not self.interpolate:
+            return
+
+        for sprite_group in self.sprite_groups:
+            if not sprite_group.updates:
+                continue
+            for sprite in sprite_group.sprites():
+                sprite.interpolate(alpha)
+
+    def _should_skip_frame(self) -> bool:
+        """Check whether rendering should be skipped to let the simulation catch up."""
+        if self._behind and self._skipped_frames < self.frame_skip:
+            self._skipped_frames += 1
+            return True
+        self._skipped_frames = 0
+        return False
+
+    def _draw(self) -> Optional[List[pygame.Rect]]:
+        """Draw the sprites onto the screen.
+
+        :returns: Optional[List[pygame.Rect]]
+            The areas of the display that changed, or None when the whole display has to be updated.
+        """
+        self._interpolate_sprites(self._accumulator / self.physics_step)
+        if self.camera:
+            self.camera.update()
+
+        if self.camera or self.canvas:
+            self._draw_view()
+            return None
+        if self.dirty_rects:
+            return self._draw_dirty()
+
+        redraw = self._redraw_background or any(sprite_group.needs_full_redraw for sprite_group in self.sprite_groups)
+        if redraw:
+            self.screen.blit(self.background, (0, 0))
+            self._redraw_background = False
+
+        # clear every layer first so clearing one layer does not erase the layers below it.
+        damaged = []
+        for sprite_group in self.sprite_groups:
+            damaged.extend(sprite_group.clear(self.screen, self.background))
+        for emitter in self.emitters:
+            cleared = emitter.clear(self.screen, self.background)
+            if cleared:
+                damaged.append(cleared)
+        for sprite_group in self.sprite_groups:
+            if sprite_group.cached and not redraw:
+                # the rest of the cached layer is still on the display from the frames before.
+                sprite_group.draw_dirty(self.screen, damaged)
+            else:
+                sprite_group.draw(self.screen)
+            for emitter in self._layer_emitters(sprite_group):
+                emitter.draw(self.screen)
+
+    def _draw_dirty(self) -> List[pygame.Rect]:
+        """Draw only what changed since the last frame.
+
+        :returns: List[pygame.Rect]
+            The areas of the display that changed.
+        """
+        damaged = []
+        if self._redraw_background or any(sprite_group.needs_full_redraw for sprite_group in self.sprite_groups):
+            self.screen.blit(self.background, (0, 0))
+            self._redraw_background = False
+            damaged.append(self.screen.get_rect())
+
+        for sprite_group in self.sprite_groups:
+            damaged.extend(sprite_group.clear_dirty(self.screen, self.background))
+        for emitter in self.emitters:
+            cleared = emitter.clear(self.screen, self.background)
+            if cleared:
+                damaged.append(cleared)
+
+        for sprite_group in self.sprite_groups:
+            damaged.extend(sprite_group.draw_dirty(self.screen, damaged))
+            for emitter in self._layer_emitters(sprite_group):
+                drawn = emitter.draw(self.screen)
+                if drawn:
+                    damaged.append(drawn)
+        return damaged
+
+    def _draw_view(self):
+        """Draw the sprites inside of the viewport at the render scale and present them on the display."""
+        scale = self.render_scale
+        surface = self.canvas or self.screen
+        surface.blit(self._canvas_background or self.background, (0, 0))
+
+        view = self.camera.rect if self.camera else None
+        offset_x, offset_y = view.topleft if view else (0, 0)
+        for sprite_group in self.sprite_groups:
+            if sprite_group.cached:
+                surface.blit(sprite_group.cached_image(scale), (int(-offset_x * scale), int(-offset_y * scale)))
+            else:
+                if view:
+                    sprite_group.refresh()
+                    sprites = sprite_group.query(view)
+                else:
+                    sprites = sprite_group.sprites()
+                surface.blits([(sprite.image if scale == 1 else sprite.scaled_image(scale),
+                                (int((sprite.rect.x - offset_x) * scale), int((sprite.rect.y - offset_y) * scale)))
+                               for sprite in sprites if sprite.visible], doreturn=False)
+            for emitter in self._layer_emitters(sprite_group):
+                emitter.draw(surface, (offset_x, offset_y), scale)
+
+        if self.canvas:
+            present = pygame.transform.smoothscale if self.smooth_scaling else pygame.transform.scale
+            present(self.canvas, self.size.get_tuple(), self.screen)
+
+    @property
+    def idle_fraction(self) -> float:
+        """Get the fraction of frames that were skipped because the scene was idle."""
+        total = self.busy_frames + self.idle_frames
+        return self.idle_frames / total if total else 0.0
+
+    def wake(self):
+        """Run the next frame even if the scene is idle, such as after changing it from another thread."""
+        self._wake_requested = True
+        pygame.event.post(pygame.event.Event(SCENE_WAKE))
+
+    def _is_idle(self) -> bool:
+        """Check whether nothing in the scene can change until input arrives or a timer is due."""
+        if self._wake_requested or self._redraw_background or self.replication or \
+                (self.streamer and self.streamer.loading) or self.scheduler.waiting_for_frames or \
+                any(emitter.count for emitter in self.emitters) or any(pygame.key.get_pressed()):
+            return False
+
+        for sprite_group in self.sprite_groups:
+            if sprite_group.needs_full_redraw or sprite_group.lostsprites:
+                return False
+            if not sprite_group.updates:
+                continue
+            for sprite in sprite_group.sprites():
+                if getattr(sprite, "dirty", False):
+                    return False
+                if isinstance(sprite, Sprite) and sprite.visible and \
+                        ((not sprite.static and sprite.movement.is_moving) or
+                         (sprite.animator and not sprite.animator.finished)):
+                    return False
+        return True
+
+    def _idle(self):
+        """Wait for input, a due timer or a wake up instead of running a frame."""
+        timeout = self.idle_timeout
+        deadline = self.scheduler.next_deadline
+        if deadline is not None:
+            timeout = min(timeout, deadline)
+
+        start = time.perf_counter()
+        event = pygame.event.wait(max(1, int(timeout * 1000)))
+        waited = time.perf_counter() - start
+        self.idle_frames += max(1, round(waited * self.frame_rate))
+        self.scheduler.advance(waited)
+        # the wait should not count as elapsed time for the next frame.
+        self.clock.tick()
+        if event.type not in (pygame.NOEVENT, SCENE_WAKE):
+            return self.handle_event(event)
+
     def _run_loop(self):
         """Main Loop for the scene."""
-        self.clock.tick(self.frame_rate)
+        if self.idle_timeout and self._is_idle():
+            return self._idle()
 
+        self._wake_requested = False
+        self.busy_frames += 1
+        elapsed = self.clock.tick(self.frame_rate) / 1000
+        # the raw time excludes the time spent waiting for the next frame.
+        return self._frame(elapsed, self.clock.get_rawtime() / 1000)
+
+    async def _run_loop_async(self):
+        """Main Loop for the scene when running on an event loop."""
+        elapsed = await self.pacer.tick()
+        if self.idle_timeout and not pygame.event.peek() and self._is_idle():
+            # blocking would stall the event loop, so idle frames are skipped at the frame rate instead.
+            self.idle_frames += 1
+            self.scheduler.advance(elapsed)
+            return
+
+        self._wake_requested = False
+        self.busy_frames += 1
+        return self._frame(elapsed, self.pacer.rawtime)
+
+    def _frame(self, elapsed: float, frame_time: float):
+        """Run a single frame.
+
+        :param elapsed: float
+            The seconds since the previous frame.
+        :param frame_time: float
+            The seconds the previous frame took, excluding the wait for this one.
+        """
+        if self.latency_monitor:
+            self.latency_monitor.begin()
+        if not self.late_input and self._sample_input() is False:
+            return False
+
+        if self.streamer:
+            self.streamer.update(self)
+        if self.replication:
+            self.replication.update(self)
+        steps = self._simulate(elapsed)
+        if self.late_input:
+            if self._sample_input() is False:
+                return False
+            self._step_players(steps)
+        self.scheduler.advance_frame()
+        self._mark("update")
+        if self._should_skip_frame():
+            if self.latency_monitor:
+                self.latency_monitor.discard()
+            return
+
+        areas = self._draw()
+        if areas is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(areas)
+        if self.idle_timeout and areas is None:
+            # the whole display was drawn, so nothing is left waiting to be drawn.
+            for sprite_group in self.sprite_groups:
+                sprite_group.mark_drawn()
+        self._mark("present")
+        if self.capture:
+            self.capture.capture(self.screen)
+
+        if self.governor:
+            self.governor.record(frame_time, self)
+        if self.surface_report_interval:
+            self._report_surfaces()
+
+    def _sample_input(self):
+        """Handle the pending events and run the keyboard triggers."""
         for event in pygame.event.get():
             if self.handle_event(event) is False:
                 return False
 
         self.keyboard.run(pygame.key.get_pressed())
+        self._mark("input")
 
-        for sprite_group in self.sprite_groups:
-            sprite_group.clear(self.screen, self.background)
-            sprite_group.update()
-            sprite_group.draw(self.screen)
+    def _mark(self, stage: str):
+        """Record the time a stage of the frame was reached."""
+        if self.latency_monitor:
+            self.latency_monitor.mark(stage)
+
+    def _report_surfaces(self):
+        """Log the growth of live surfaces since the last report once the report interval has passed."""
+        now = pygame.time.get_ticks() / 1000
+        last_time, last_snapshot = self._last_surface_report or (None, None)
+        if last_time is not None and now - last_time < self.surface_report_interval:
+            return
 
-        pygame.display.flip()
+        snapshot = surface_tracker.snapshot()
+        if last_snapshot:
+            logger.info("Surface growth over %.0fs:\n%s", now - last_time, snapshot.diff(last_snapshot).report())
+        logger.info("Live surfaces:\n%s", snapshot.report())
+        self._last_surface_report = (now, snapshot)
 
     # def clear(self):
     #     """Clear the scene."""
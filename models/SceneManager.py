@@ -0,0 +1,191 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from . import AssetCache, Image, Scene
+
+
+class EvictionPolicy:
+    """
+    Represents what happens to a scene after transitioning away from it.
+
+    :param policy_type: str
+        The policy type.
+    """
+    def __init__(self, policy_type: str):
+        self.type: str = policy_type
+
+    def __eq__(self, other):
+        return self.type.lower() == other.type.lower()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @classmethod
+    def keep(cls):
+        """Keep the scene and its surfaces so returning to it is instant."""
+        return EvictionPolicy("keep")
+
+    @classmethod
+    def release(cls):
+        """Keep the scene, but release the surfaces it does not share with the next scene."""
+        return EvictionPolicy("release")
+
+    @classmethod
+    def discard(cls):
+        """Release the surfaces and drop the scene, so it is built again by its factory when needed."""
+        return EvictionPolicy("discard")
+
+
+class SceneManager:
+    """
+    Runs one scene at a time and builds the next scenes while the current one is running.
+
+    Scenes are registered with a factory. Preloading a scene builds it and decodes its images on a worker thread,
+    so transitioning to it only has to convert the decoded images before its first frame.
+
+    :param eviction_policy: Optional[:ref:`EvictionPolicy`]
+        What happens to a scene after transitioning away from it. Defaults to releasing its unshared surfaces.
+    :param workers: int
+        The amount of threads decoding images in the background.
+    """
+    def __init__(self, eviction_policy: EvictionPolicy = None, workers: int = 1):
+        self.eviction_policy = eviction_policy or EvictionPolicy.release()
+        self._factories: Dict[str, Callable[[], Scene]] = {}
+        self._scenes: Dict[str, Scene] = {}
+        self._loading: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="scene-preload")
+        self.current: Optional[str] = None
+        self._next: Optional[str] = None
+
+    @property
+    def scene(self) -> Optional[Scene]:
+        """Get the running scene."""
+        return self._scenes.get(self.current) if self.current else None
+
+    def register(self, name: str, factory: Callable[[], Scene]):
+        """Register a scene.
+
+        :param name: str
+            The name to transition to the scene with.
+        :param factory: Callable[[], :ref:`Scene`]
+            Builds the scene. Called on the main thread.
+        """
+        self._factories[name] = factory
+
+    def get(self, name: str) -> Scene:
+        """Get a scene, building it when it does not exist yet.
+
+        :param name: str
+            The name of the scene.
+        """
+        if name not in self._scenes:
+            self._scenes[name] = self._factories[name]()
+        return self._scenes[name]
+
+    def preload(self, name: str) -> Future:
+        """Build a scene and decode its images in the background.
+
+        :param name: str
+            The name of the scene.
+        :returns: Future
+            Resolves once every image of the scene is decoded.
+        """
+        if name not in self._loading:
+            scene = self.get(name)
+            self._loading[name] = self._executor.submit(self._decode, scene.images(), scene.asset_cache)
+        return self._loading[name]
+
+    @staticmethod
+    def _decode(images: List[Image], asset_cache: Optional[AssetCache]):
+        """Decode images without converting them to the display format."""
+        for image in images:
+            image.preload(asset_cache)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether the images of a scene finished decoding.
+
+        :param name: str
+            The name of the scene.
+        """
+        return name in self._loading and self._loading[name].done()
+
+    def transition(self, name: str):
+        """Stop the running scene and start another one in its place.
+
+        :param name: str
+            The name of the scene to transition to. It is preloaded if it was not already.
+        """
+        self.preload(name)
+        self._next = name
+        if self.scene:
+            self.scene.stop()
+
+    def start(self, name: str):
+        """Start running scenes, beginning with a scene, until one is closed.
+
+        :param name: str
+            The name of the first scene.
+        """
+        self._next = name
+        try:
+            while self._next:
+                scene = self._enter(self._next)
+                scene.start()
+                if scene.active:
+                    # the scene was closed rather than stopped for a transition.
+                    break
+        finally:
+            self.shutdown()
+
+    async def start_async(self, name: str):
+        """Start running scenes on the running event loop, beginning with a scene, until one is closed.
+
+        :param name: str
+            The name of the first scene.
+        """
+        self._next = name
+        try:
+            while self._next:
+                scene = self._enter(self._next)
+                await scene.start_async()
+                if scene.active:
+                    break
+        finally:
+            self.shutdown()
+
+    def _enter(self, name: str) -> Scene:
+        """Make a scene the current scene and evict the previous one."""
+        self._next = None
+        self.preload(name).result()
+        scene = self.get(name)
+        # the previous scene stopped, so the display can change to the size of the next one.
+        scene.open_display()
+        for image in scene.images():
+            # converting is fast, but needs the display, so it happens on the main thread.
+            _ = image.surface
+
+        previous, self.current = self.current, name
+        if previous and previous != name:
+            self.evict(previous, keep=scene.images())
+        return scene
+
+    def evict(self, name: str, keep: List[Image] = None):
+        """Apply the eviction policy to a scene that is not running.
+
+        :param name: str
+            The name of the scene.
+        :param keep: Optional[List[:ref:`Image`]]
+            Images to keep loaded, such as the ones shared with the current scene.
+        """
+        if self.eviction_policy == EvictionPolicy.keep() or name not in self._scenes:
+            return
+
+        self._scenes[name].release_surfaces(keep)
+        # the images have to be decoded again before the scene runs next.
+        self._loading.pop(name, None)
+        if self.eviction_policy == EvictionPolicy.discard():
+            del self._scenes[name]
+
+    def shutdown(self):
+        """Stop the preloading threads."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,194 @@
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, List, Optional, Tuple
+
+
+@dataclass
+class WaitFrames:
+    """
+    Yielded by a coroutine to wait for frames instead of time.
+
+    :param frames: int
+        The amount of frames to wait.
+    """
+    frames: int = 1
+
+
+class Timer:
+    """
+    A callback or coroutine waiting in a :ref:`Scheduler`.
+
+    :param callback: Optional[Callable]
+        The function to call.
+    :param args: tuple
+        The arguments to call the function with.
+    :param interval: Optional[float]
+        The time between calls of a repeating timer.
+    :param coroutine: Optional[Generator]
+        The coroutine to resume instead of calling a function.
+    """
+    def __init__(self, callback: Callable = None, args: tuple = (), interval: float = None,
+                 coroutine: Generator = None):
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.coroutine = coroutine
+        self.cancelled = False
+        self.done = False
+
+    @property
+    def active(self) -> bool:
+        """Whether the timer is still going to run."""
+        return not (self.cancelled or self.done)
+
+    def cancel(self):
+        """Stop the timer from running again. A cancelled coroutine is closed."""
+        self.cancelled = True
+        # a coroutine cancelling itself is still running and is dropped once it yields.
+        if self.coroutine is not None and not self.coroutine.gi_running:
+            self.coroutine.close()
+
+
+class Scheduler:
+    """
+    Runs callbacks and coroutines once they are due, measured in simulated time or in frames.
+
+    Deadlines are kept in min-heaps, so each frame only the timers that are due are looked at, however many wait.
+    The time only passes while the scene simulates, so timers stop while the scene does.
+
+    Coroutines are generators that yield how long to wait before resuming: seconds as a number, frames as
+    :ref:`WaitFrames`, or None for the next frame.
+    """
+    def __init__(self):
+        self.time = 0.0
+        self.frame = 0
+        self.calls = 0
+        self._timers: List[Tuple[float, int, Timer]] = []
+        self._frame_timers: List[Tuple[int, int, Timer]] = []
+        # breaks ties between equal deadlines in the order the timers were scheduled.
+        self._order = itertools.count()
+
+    def __len__(self):
+        return sum(1 for _, _, timer in self._timers + self._frame_timers if timer.active)
+
+    def _schedule(self, timer: Timer, delay: float) -> Timer:
+        heapq.heappush(self._timers, (self.time + max(0.0, delay), next(self._order), timer))
+        return timer
+
+    def _schedule_frames(self, timer: Timer, frames: int) -> Timer:
+        heapq.heappush(self._frame_timers, (self.frame + max(1, int(frames)), next(self._order), timer))
+        return timer
+
+    def call_later(self, delay: float, callback: Callable, *args: Any) -> Timer:
+        """Call a function once after a delay.
+
+        :param delay: float
+            The delay in seconds.
+        :param callback: Callable
+            The function to call.
+        :param args: Any
+            The arguments to call the function with.
+        """
+        return self._schedule(Timer(callback, args), delay)
+
+    def call_every(self, interval: float, callback: Callable, *args: Any, delay: float = None) -> Timer:
+        """Call a function repeatedly until the timer is cancelled.
+
+        :param interval: float
+            The seconds between calls.
+        :param callback: Callable
+            The function to call.
+        :param args: Any
+            The arguments to call the function with.
+        :param delay: Optional[float]
+            The delay in seconds before the first call. Defaults to the interval.
+        """
+        if interval <= 0:
+            raise ValueError("The interval of a repeating timer must be positive.")
+        return self._schedule(Timer(callback, args, interval), interval if delay is None else delay)
+
+    def call_after_frames(self, frames: int, callback: Callable, *args: Any) -> Timer:
+        """Call a function once after an amount of frames.
+
+        :param frames: int
+            The amount of frames, at least one.
+        :param callback: Callable
+            The function to call.
+        :param args: Any
+            The arguments to call the function with.
+        """
+        return self._schedule_frames(Timer(callback, args), frames)
+
+    def start(self, coroutine: Generator) -> Timer:
+        """Run a coroutine until its first yield and resume it whenever its wait is over.
+
+        :param coroutine: Generator
+            The coroutine, such as the result of calling a generator function.
+        """
+        timer = Timer(coroutine=coroutine)
+        self._resume(timer)
+        return timer
+
+    def _resume(self, timer: Timer):
+        """Run a coroutine until it yields its next wait."""
+        try:
+            wait = next(timer.coroutine)
+        except StopIteration:
+            timer.done = True
+            return
+        if wait is None or (not isinstance(wait, WaitFrames) and wait <= 0):
+            # waiting no time would resume the coroutine again in the same pass, so it waits for the next frame.
+            self._schedule_frames(timer, 1)
+        elif isinstance(wait, WaitFrames):
+            self._schedule_frames(timer, wait.frames)
+        else:
+            self._schedule(timer, wait)
+
+    def _run(self, timer: Timer, deadline: float):
+        """Run a due timer and schedule it again when it repeats."""
+        self.calls += 1
+        if timer.coroutine is not None:
+            self._resume(timer)
+            return
+        if timer.interval:
+            # schedule from the deadline instead of the current time so repeating timers do not drift.
+            heapq.heappush(self._timers, (deadline + timer.interval, next(self._order), timer))
+        else:
+            timer.done = True
+        timer.callback(*timer.args)
+
+    def advance(self, dt: float):
+        """Let time pass and run the timers that became due.
+
+        :param dt: float
+            The elapsed time in seconds.
+        """
+        self.time += dt
+        timers = self._timers
+        while timers and timers[0][0] <= self.time:
+            deadline, _, timer = heapq.heappop(timers)
+            if not timer.cancelled:
+                self._run(timer, deadline)
+
+    def advance_frame(self):
+        """Count a frame and run the timers waiting for it."""
+        self.frame += 1
+        timers = self._frame_timers
+        while timers and timers[0][0] <= self.frame:
+            deadline, _, timer = heapq.heappop(timers)
+            if not timer.cancelled:
+                self._run(timer, deadline)
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """Get the seconds until the next timer is due, or None when no timer waits for time."""
+        timers = self._timers
+        while timers and timers[0][2].cancelled:
+            heapq.heappop(timers)
+        return max(0.0, timers[0][0] - self.time) if timers else None
+
+    @property
+    def waiting_for_frames(self) -> bool:
+        """Whether any timer waits for frames."""
+        return any(timer.active for _, _, timer in self._frame_timers)
@@ -0,0 +1,58 @@
+from typing import Dict, List, Set
+
+import pygame
+
+from . import SpatialHash
+
+
+class SpatialGroup(pygame.sprite.OrderedUpdates):
+    """
+    An ordered sprite group that keeps its sprites in a spatial index.
+
+    Static sprites are indexed once, dynamic sprites are re-indexed on every refresh.
+
+    :param sprites: :ref:`Sprite`
+        The sprites to add.
+    :param cell_size: int
+        The cell size of the spatial index.
+    """
+    def __init__(self, *sprites, cell_size: int = 256):
+        self.index = SpatialHash(cell_size)
+        self._order: Dict[pygame.sprite.Sprite, int] = {}
+        self._next_order = 0
+        self._pending: Set[pygame.sprite.Sprite] = set()
+        self._dynamic: Set[pygame.sprite.Sprite] = set()
+        super(SpatialGroup, self).__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super(SpatialGroup, self).add_internal(sprite, layer)
+        self._order[sprite] = self._next_order
+        self._next_order += 1
+        # sprites are indexed lazily since their rect may need the display to be initialized.
+        self._pending.add(sprite)
+
+    def remove_internal(self, sprite):
+        super(SpatialGroup, self).remove_internal(sprite)
+        self._order.pop(sprite, None)
+        self._pending.discard(sprite)
+        self._dynamic.discard(sprite)
+        self.index.remove(sprite)
+
+    def refresh(self):
+        """Update the spatial index with new and moving sprites."""
+        for sprite in self._pending:
+            if not sprite.static:
+                self._dynamic.add(sprite)
+            self.index.insert(sprite, sprite.rect)
+        self._pending.clear()
+
+        for sprite in self._dynamic:
+            self.index.insert(sprite, sprite.rect)
+
+    def query(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Get the sprites near a rect in drawing order.
+
+        :param rect: pygame.Rect
+            The area to look up.
+        """
+        return sorted(self.index.query(rect), key=self._order.__getitem__)
@@ -0,0 +1,73 @@
+from collections import defaultdict
+from typing import Dict, Hashable, Set, Tuple
+
+import pygame
+
+
+class SpatialHash:
+    """
+    A uniform grid that indexes objects by the cells their rect overlaps.
+
+    :param cell_size: int
+        The width and height of a cell.
+    """
+    def __init__(self, cell_size: int = 256):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = defaultdict(set)
+        self._item_cells: Dict[Hashable, Tuple[Tuple[int, int], ...]] = {}
+
+    def __len__(self):
+        return len(self._item_cells)
+
+    def __contains__(self, item):
+        return item in self._item_cells
+
+    def _keys(self, rect: pygame.Rect) -> Tuple[Tuple[int, int], ...]:
+        """Get the cells a rect overlaps."""
+        size = self.cell_size
+        return tuple((column, row)
+                     for row in range(rect.top // size, (rect.bottom - 1) // size + 1)
+                     for column in range(rect.left // size, (rect.right - 1) // size + 1))
+
+    def insert(self, item: Hashable, rect: pygame.Rect):
+        """Insert or move an item.
+
+        :param item: Hashable
+            The item to index.
+        :param rect: pygame.Rect
+            The bounds of the item.
+        """
+        keys = self._keys(rect)
+        old_keys = self._item_cells.get(item)
+        if old_keys == keys:
+            return
+        if old_keys:
+            for key in old_keys:
+                self._cells[key].discard(item)
+        for key in keys:
+            self._cells[key].add(item)
+        self._item_cells[item] = keys
+
+    def remove(self, item: Hashable):
+        """Remove an item.
+
+        :param item: Hashable
+            The item to remove.
+        """
+        for key in self._item_cells.pop(item, ()):
+            self._cells[key].discard(item)
+
+    def query(self, rect: pygame.Rect) -> Set[Hashable]:
+        """Get the items in the cells a rect overlaps.
+
+        ..Note:: Items are matched by cell, so they may lie slightly outside of the rect.
+
+        :param rect: pygame.Rect
+            The area to look up.
+        """
+        found = set()
+        for key in self._keys(rect):
+            cell = self._cells.get(key)
+            if cell:
+                found.update(cell)
+        return found
@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Optional
 
 import pygame
 
-from . import Image, Movement, Size, MovementManipulator, Angle, Visibility, Action
+from . import Image, Movement, Size, MovementManipulator, Angle, Visibility, Action, TileLayer, Layer, Animator, \
+    Collider, BoxCollider, Contact, SheetFrame
 from math import sqrt, atan2
 
 
@@ -29,32 +30,53 @@ class Sprite(pygame.sprite.Sprite):
         Bounce for collisions using angles.
     :param player_controlled: bool
         Whether the sprite is player controlled.
+    :param animator: Optional[:ref:`Animator`]
+        Plays animations by swapping the image of the sprite for the current frame every physics step.
+    :param collider: Optional[:ref:`Collider`]
+        The shape used for collisions and bounces. Defaults to the rect of the image.
     """
+    # the archetype the configuration of the sprite is shared through, if any.
+    archetype = None
+    collider = None
 
     def __init__(self, size: Size = None,
                  image: Image = None,
                  movement: Movement = None,
                  visibility: bool = True, scene_size: Size = None, bounded_action: Action = None,
-                 collision_action: Action = None, angle_collision=True, player_controlled=False):
+                 collision_action: Action = None, angle_collision=True, player_controlled=False,
+                 animator: Animator = None, collider: Collider = None):
         super(Sprite, self).__init__()
         self.size: Size = size or Size(100, 100)
-        self.image_obj: Image = image or Image(self.size)
+        self.animator = animator
+        self.image_obj: Image = image or (animator.image if animator else Image(self.size))
+        self.image_obj.sprite_type = type(self).__name__
         # The sprite size must match the image size.
         # The image may change the size to fit.
         self.size = self.image_obj.size
-        self.movement: Movement = movement or Movement()
-        self.__visibility = Visibility(visibility)
-        self._rect = None
-        self._rect_surface = None
         self._scene_size = scene_size or Size(1280, 720)
         self._bounded_action = bounded_action or Action.wrap()
         self.collision_action = collision_action or Action.bounce()
+        self.angle_collision = angle_collision
+        self.player_controlled = player_controlled
+        self.collider: Optional[Collider] = collider.fitted(self.size) if collider else None
+        self._init_state(movement or Movement(), visibility)
+
+    def _init_state(self, movement: Movement, visibility: bool = True):
+        """Set the state every sprite keeps for itself, even when the rest is shared through an :ref:`Archetype`.
+
+        :param movement: :ref:`Movement`
+            The movement instance of the sprite.
+        :param visibility: bool
+            Whether the sprite is visible.
+        """
+        self.movement: Movement = movement
+        self.__visibility = Visibility(visibility)
+        self._rect = None
+        self._rect_surface = None
         self.stationary_collisions = []
         self._invert_v_x = False
         self._invert_v_y = False
         self._interacted_with_scene = False  # Know if our display is constantly updating.
-        self.angle_collision = angle_collision
-        self.player_controlled = player_controlled
 
     @property
     def rect(self):
@@ -77,7 +99,8 @@ class Sprite(pygame.sprite.Sprite):
 
             self._rect_surface = self.image_obj.surface
 
-        if self._rect_surface != self.image_obj.surface:
+        # the surface of a shared image changes with the rotations of the other sprites.
+        if self._rect_surface != self.image_obj.surface and not self.shares_image:
             self._rect = None
             return self.rect  # recursive reset.
         return self._rect
@@ -86,22 +109,40 @@ class Sprite(pygame.sprite.Sprite):
     def visible(self):
         return self.__visibility.visible
 
+    @property
+    def scene_size(self) -> Size:
+        """Get the size of the area the sprite is bounded by."""
+        return self._scene_size
+
+    @scene_size.setter
+    def scene_size(self, new_size: Size):
+        """
+        Set the size of the area the sprite is bounded by.
+
+        :param new_size: :ref:`Size`
+            The new bounding size, such as the size of a world larger than the scene.
+        """
+        self._scene_size = new_size
+
     @property
     def static(self):
         return self.movement.static
 
     def hide(self):
         self.__visibility.hide()
+        area = self.rect.copy()
         # only change our current rect values and set them off-screen.
         # we can later fetch our last known position by the movement instance.
         self.rect.x = 0 - self.size.width
         self.rect.y = 0 - self.size.height
+        self._repaint_layers(area)
 
     def show(self):
         self.__visibility.show()
         # our movement position contains the true values of our position.
         self.rect.x = self.movement.position.x
         self.rect.y = self.movement.position.y
+        self._repaint_layers(self.rect)
 
     @property
     def center(self) -> MovementManipulator:
@@ -113,8 +154,21 @@ class Sprite(pygame.sprite.Sprite):
     @property
     def image(self) -> pygame.Surface:
         """Get the surface of the image."""
+        if self.shares_image:
+            surface = self.image_obj.surface
+            if self.static:
+                # static sprites never rotate, so they skip the rotations of the other sprites.
+                return self.image_obj.no_rotation_surface
+            # the shared image only holds the rotation of the sprite that rotated it last.
+            return self._rect_surface if self._rect_surface is not None else surface
         return self.image_obj.surface
 
+    @property
+    def shares_image(self) -> bool:
+        """Whether other sprites use and rotate the same image, such as sprites of an :ref:`Archetype` or sprites
+        animated from the same :ref:`SpriteSheet`."""
+        return self.archetype is not None or isinstance(self.image_obj, SheetFrame)
+
     @image.setter
     def image(self, new_image: Image):
         """
@@ -124,6 +178,15 @@ class Sprite(pygame.sprite.Sprite):
             The new image of the object.
         """
         self.image_obj = new_image
+        self.image_obj.sprite_type = type(self).__name__
+
+    def scaled_image(self, scale: float) -> pygame.Surface:
+        """Get the surface of the image scaled by a factor.
+
+        :param scale: float
+            The factor to scale the surface by.
+        """
+        return self.image_obj.scaled(scale)
 
     @property
     def left(self):
@@ -159,6 +222,9 @@ class Sprite(pygame.sprite.Sprite):
         if (visible and not (self.visible and sprite.visible)) or self == sprite:
             return False
 
+        if (self.collider or sprite.collider) and not return_results:
+            return self.contact(sprite) is not None
+
         # instead of checking to see if the sprites are inside each other (inherently more complex),
         # we check if they are outside.
         results = [self.bottom < sprite.top, self.top > sprite.bottom, self.right < sprite.left,
@@ -172,6 +238,52 @@ class Sprite(pygame.sprite.Sprite):
 
         return True
 
+    def _collision_shape(self):
+        """Get the collider and its center, using the rect when the sprite has no collider."""
+        if self.collider:
+            return self.collider, self.movement.position.get_tuple()
+        rect = self.rect
+        return BoxCollider(rect.width, rect.height), rect.center
+
+    def contact(self, sprite) -> Optional[Contact]:
+        """Get how the sprite touches another sprite.
+
+        :param sprite: :ref:`Sprite`
+            The other sprite.
+        :returns: Optional[:ref:`Contact`]
+            The contact with a normal pointing out of the other sprite, or None when they do not overlap.
+        """
+        collider, center = self._collision_shape()
+        return collider.contact(center, *sprite._collision_shape())
+
+    def resolve_contact(self, contact: Contact, share: float = 1.0):
+        """Reflect the velocity off the contact normal and move out of the other shape.
+
+        :param contact: :ref:`Contact`
+            The contact seen from this sprite.
+        :param share: float
+            The part of the overlap this sprite moves out of, such as half when the other sprite moves out too.
+        """
+        velocity = self.movement.velocity
+        along = velocity.x * contact.normal_x + velocity.y * contact.normal_y
+        if along < 0:
+            # only reflect when moving into the other shape, so a sprite leaving it is not pulled back.
+            velocity.x -= 2 * along * contact.normal_x
+            velocity.y -= 2 * along * contact.normal_y
+        self.movement.shift(contact.normal_x * contact.depth * share, contact.normal_y * contact.depth * share)
+
+    def _bounce_off(self, sprite):
+        """Bounce off another sprite along the normal of their contact."""
+        if self.static or self.player_controlled:
+            return
+        contact = self.contact(sprite)
+        if contact is None:
+            return
+        # a sprite that bounces as well moves out of the other half of the overlap on its own.
+        both_bounce = not (sprite.static or sprite.player_controlled) and sprite.visible and \
+            Action.bounce() == sprite.collision_action
+        self.resolve_contact(contact, 0.5 if both_bounce else 1.0)
+
     def angle_to(self, sprite) -> Angle:
         """Check the angle to another sprite.
 
@@ -222,8 +334,12 @@ class Sprite(pygame.sprite.Sprite):
 
         self.movement.set_position(new_x, new_y)
 
-    def _update_position_and_angle(self):
-        """Update the position of the sprite."""
+    def _update_position_and_angle(self, dt=None):
+        """Update the position of the sprite.
+
+        :param dt: Optional[float]
+            The elapsed time in seconds.
+        """
         if not self.visible or self.static:
             return
 
@@ -233,7 +349,7 @@ class Sprite(pygame.sprite.Sprite):
         self._rect = self.image_obj.rotate(self.movement.img_angle)
         self._rect_surface = self.image_obj.surface
         # self.movement.add_vector(Angle(degrees=20), 5)
-        self.movement.update()
+        self.movement.update(dt)
         self._rect.centerx = self.movement.position.x
         self._rect.centery = self.movement.position.y
 
@@ -249,9 +365,22 @@ class Sprite(pygame.sprite.Sprite):
         if not self._interacted_with_scene:
             return
 
-        colliding_sprites: List[Sprite] = [sprite for sprite_group in self.groups()
-                                           for sprite in sprite_group.sprites()
-                                           if self != sprite and self.collides_with(sprite, visible=True)]
+        colliding_sprites: List[Sprite] = []
+        for sprite_group in self._collision_groups():
+            reacts_for_group = isinstance(sprite_group, Layer) and not sprite_group.updates
+            for sprite in sprite_group.sprites():
+                if isinstance(sprite, TileLayer):
+                    # tile layers resolve their own collisions with a cell lookup.
+                    sprite.handle_collision(self)
+                elif self != sprite and self.collides_with(sprite, visible=True):
+                    if reacts_for_group and not sprite.image_obj.wallpaper and \
+                            Action.pass_through() != sprite.collision_action:
+                        # the sprite is never updated, so it would miss its own side of the collision.
+                        sprite._handle_collision(self)
+                        if not self.collides_with(sprite, visible=True):
+                            continue
+                    colliding_sprites.append(sprite)
+
         if not colliding_sprites or self.collision_action.pass_through() == self.collision_action:
             return
 
@@ -261,6 +390,19 @@ class Sprite(pygame.sprite.Sprite):
 
             self._handle_collision(sprite)
 
+    def _collision_groups(self):
+        """Get the groups with the sprites this sprite can collide with."""
+        groups = []
+        for sprite_group in self.groups():
+            groups.extend(sprite_group.collision_layers if isinstance(sprite_group, Layer) else [sprite_group])
+        return groups
+
+    def _repaint_layers(self, area: pygame.Rect):
+        """Let cached layers know the sprite changed inside of an area."""
+        for sprite_group in self.groups():
+            if isinstance(sprite_group, Layer):
+                sprite_group.repaint(area)
+
     def _handle_collision_hide(self, sprite):
         # Handle when to hide after a collision.
         both_static = self.static and sprite.static
@@ -309,6 +451,15 @@ class Sprite(pygame.sprite.Sprite):
         if Action.pass_through() in [self.collision_action, sprite.collision_action]:
             return
 
+        if self.collider or sprite.collider:
+            # the contact normal gives the bounce direction, so every sprite bounces itself.
+            if Action.bounce() == self.collision_action:
+                self._bounce_off(sprite)
+            if Action.bounce() == sprite.collision_action and not self.visible:
+                # the other sprite would miss the collision once this one is gone.
+                sprite._bounce_off(self)
+            return
+
         # handle bounce for current sprite.
         if Action.bounce() == self.collision_action:
             self._handle_bounce(self, sprite)
@@ -419,14 +570,48 @@ class Sprite(pygame.sprite.Sprite):
                 else:
                     sprite.movement.velocity.y *= -1
 
-    def update(self):
-        """Update the sprite."""
+    def reset(self, position: MovementManipulator = None, velocity: MovementManipulator = None):
+        """Reset the state of the sprite so it can be reused instead of reallocated.
+
+        :param position: Optional[:ref:`MovementManipulator`]
+            The new position of the sprite.
+        :param velocity: Optional[:ref:`MovementManipulator`]
+            The new velocity of the sprite.
+        """
+        self.movement.reset(position, velocity)
+        self.__visibility.show()
+        self._rect = None
+        self._rect_surface = None
+        self.stationary_collisions.clear()
+        self._invert_v_x = False
+        self._invert_v_y = False
+        self._interacted_with_scene = False
+
+    def interpolate(self, alpha: float):
+        """Place the rect between the previous and the current physics state for rendering.
+
+        :param alpha: float
+            How far between the previous (0) and the current (1) state.
+        """
+        if not self.visible or self.static or not self._rect:
+            return
+
+        self._rect.center = self.movement.interpolated_position(alpha)
+
+    def update(self, dt=None):
+        """Update the sprite.
+
+        :param dt: Optional[float]
+            The elapsed time in seconds. Defaults to a single reference frame.
+        """
         if not self.visible:
             return
 
         self._check_bounds()  # check bounds
         self._check_collisions()
-        self._update_position_and_angle()  # update pos
+        if self.animator and self.animator.update(dt):
+            self.image = self.animator.image
+        self._update_position_and_angle(dt)  # update pos
 
         if not self._interacted_with_scene:
             self._interacted_with_scene = True
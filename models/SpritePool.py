@@ -0,0 +1,129 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Set
+
+from . import Sprite, MovementManipulator
+
+
+@dataclass
+class PoolStats:
+    """
+    Statistics of a sprite pool.
+
+    :param hits: int
+        The amount of acquisitions served by a recycled sprite.
+    :param misses: int
+        The amount of acquisitions that had to create a new sprite.
+    :param created: int
+        The amount of sprites the pool has created, including pre-warmed sprites.
+    :param reclaimed: int
+        The amount of killed sprites the pool has taken back on its own.
+    """
+    hits: int = 0
+    misses: int = 0
+    created: int = 0
+    reclaimed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of acquisitions served by a recycled sprite."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SpritePool:
+    """
+    Recycles sprites instead of reallocating them.
+
+    Sprites that were released, or killed after joining a group, are reset and handed out again on the next
+    acquisition. Hidden sprites and sprites that have not been added to a group yet are still in use.
+
+    ..Note:: A sprite acquired without groups is only known to have joined one once the pool sees it in a group.
+        Release sprites that may be killed before then.
+
+    :param factory: Callable[[], :ref:`Sprite`]
+        Creates a new sprite when there is none to recycle.
+    :param size: int
+        The amount of sprites to pre-warm the pool with.
+    """
+    def __init__(self, factory: Callable[[], Sprite], size: int = 0):
+        self.factory = factory
+        self.sprites: List[Sprite] = []
+        self._free = deque()
+        # the sprites handed out, by id, and the ones among them seen in a group since.
+        self._checked_out: Dict[int, Sprite] = {}
+        self._joined: Set[int] = set()
+        self.stats = PoolStats()
+        self.prewarm(size)
+
+    def _create(self) -> Sprite:
+        """Create a new sprite owned by the pool."""
+        sprite = self.factory()
+        self.sprites.append(sprite)
+        self.stats.created += 1
+        return sprite
+
+    def prewarm(self, size: int):
+        """Create sprites ahead of time until the pool holds at least `size` sprites.
+
+        :param size: int
+            The amount of sprites the pool should hold.
+        """
+        while len(self.sprites) < size:
+            self._free.append(self._create())
+
+    def _reclaim(self):
+        """Take back sprites that were killed during gameplay."""
+        for key, sprite in list(self._checked_out.items()):
+            if sprite.alive():
+                self._joined.add(key)
+            elif key in self._joined:
+                self._check_in(sprite)
+                self.stats.reclaimed += 1
+
+    def _check_in(self, sprite: Sprite):
+        """Reset a sprite that is no longer used and make it available again."""
+        del self._checked_out[id(sprite)]
+        self._joined.discard(id(sprite))
+        sprite.reset()
+        self._free.append(sprite)
+
+    def acquire(self, position: MovementManipulator = None, velocity: MovementManipulator = None,
+                groups=()) -> Sprite:
+        """Get a sprite from the pool.
+
+        :param position: Optional[:ref:`MovementManipulator`]
+            The position of the sprite.
+        :param velocity: Optional[:ref:`MovementManipulator`]
+            The velocity of the sprite.
+        :param groups:
+            The sprite groups to add the sprite to.
+        """
+        if not self._free:
+            self._reclaim()
+
+        if self._free:
+            sprite = self._free.popleft()
+            sprite.reset(position, velocity)
+            self.stats.hits += 1
+        else:
+            sprite = self._create()
+            if position or velocity:
+                sprite.movement.reset(position, velocity)
+            self.stats.misses += 1
+
+        self._checked_out[id(sprite)] = sprite
+        sprite.add(groups)
+        if sprite.alive():
+            self._joined.add(id(sprite))
+        return sprite
+
+    def release(self, sprite: Sprite):
+        """Return a sprite to the pool.
+
+        :param sprite: :ref:`Sprite`
+            The sprite to return. Must have been created by this pool.
+        """
+        sprite.kill()
+        if id(sprite) in self._checked_out:
+            self._check_in(sprite)
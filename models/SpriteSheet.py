@@ -0,0 +1,175 @@
+import threading
+from typing import Dict, List, Optional
+
+import pygame
+
+from . import Size, Image, AssetCache
+from .SurfaceTracker import surface_tracker
+
+
+class SheetFrame(Image):
+    """
+    A single frame of a sprite sheet.
+
+    The surface is a subsurface of the sheet, so it shares the pixels of the sheet instead of copying them.
+    Rotations are cached per frame like any other image.
+
+    :param sheet: :ref:`SpriteSheet`
+        The sheet the frame is cut from.
+    :param index: int
+        The position of the frame in the sheet.
+    :param area: pygame.Rect
+        The area of the frame in the scaled sheet.
+    """
+    def __init__(self, sheet, index: int, area: pygame.Rect):
+        super(SheetFrame, self).__init__(sheet.size, image_name=f"{sheet.image_name}[{index}]",
+                                         file_location=sheet.file_location, rotation_step=sheet.rotation_step)
+        self.sheet = sheet
+        self.index = index
+        self.area = area
+
+    @property
+    def surface(self):
+        """Return the subsurface of the sheet, or the current rotation of it."""
+        if not self._surface:
+            self.no_rotation_surface = self.sheet.surface.subsurface(self.area)
+            self._surface = self.no_rotation_surface
+        return self._surface
+
+    @surface.setter
+    def surface(self, new_surface):
+        """Set a new surface."""
+        self._surface = new_surface
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the sheet of the frame was decoded."""
+        return self.sheet.loaded
+
+    def preload(self, asset_cache: AssetCache = None):
+        """Decode the sheet of the frame ahead of time."""
+        self.sheet.preload(asset_cache)
+        return self
+
+
+class SpriteSheet:
+    """
+    A single image file holding animation frames in a grid, read left to right and top to bottom.
+
+    The file is decoded and scaled once and every frame is a subsurface of it.
+    Use :ref:`SpriteSheet.load` to share the frames between every sprite using the same sheet.
+
+    :param file_location: str
+        The absolute or relative file location.
+    :param frame_size: :ref:`Size`
+        The size of a single frame in the file.
+    :param columns: int
+        The amount of frames in a row.
+    :param rows: int
+        The amount of rows.
+    :param count: Optional[int]
+        The amount of frames, for sheets where the last row is not full. Defaults to every cell of the grid.
+    :param size: Optional[:ref:`Size`]
+        The size frames are shown at. Defaults to the frame size.
+    :param image_name: Optional[str]
+        The name of the sheet. Frames are named after it.
+    :param rotation_step: Optional[float]
+        Rotations of every frame are rounded to multiples of this many degrees and cached.
+    """
+    # shared sheets by file, frame size, grid and shown size.
+    sheets: Dict[tuple, "SpriteSheet"] = {}
+
+    def __init__(self, file_location: str, frame_size: Size, columns: int, rows: int = 1, count: int = None,
+                 size: Size = None, image_name: str = None, rotation_step: float = None):
+        self.file_location = file_location
+        self.frame_size = frame_size
+        self.columns = columns
+        self.rows = rows
+        self.size = size or frame_size
+        self.image_name = image_name or file_location.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+        self.rotation_step = rotation_step
+        self._surface: Optional[pygame.Surface] = None
+        self._decoded: Optional[pygame.Surface] = None
+        # sheets shared between scenes may be preloaded on a worker while the main thread uses them.
+        self._load_lock = threading.Lock()
+        count = columns * rows if count is None else min(count, columns * rows)
+        width, height = self.size.get_tuple()
+        self.frames: List[SheetFrame] = [
+            SheetFrame(self, index, pygame.Rect(index % columns * width, index // columns * height, width, height))
+            for index in range(count)]
+
+    @classmethod
+    def load(cls, file_location: str, frame_size: Size, columns: int, rows: int = 1, count: int = None,
+             size: Size = None, image_name: str = None, rotation_step: float = None) -> "SpriteSheet":
+        """Get the shared sheet of a file, creating it the first time.
+
+        Takes the same parameters as :ref:`SpriteSheet`.
+        """
+        key = (file_location, frame_size.get_tuple(), columns, rows, count, (size or frame_size).get_tuple(),
+               rotation_step)
+        if key not in cls.sheets:
+            cls.sheets[key] = cls(file_location, frame_size, columns, rows, count, size, image_name, rotation_step)
+        return cls.sheets[key]
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def sheet_size(self) -> Size:
+        """Get the size of the whole sheet once scaled to the shown frame size."""
+        return Size(self.columns * self.size.width, self.rows * self.size.height)
+
+    def _load(self, asset_cache: AssetCache = None) -> pygame.Surface:
+        """Decode the sheet and scale it so every frame has the shown size."""
+        asset_cache = asset_cache or Image.asset_cache
+        if asset_cache:
+            return asset_cache.get(self.file_location, self.sheet_size, copy=False)
+        surface = pygame.image.load(self.file_location)
+        if self.size != self.frame_size:
+            surface = pygame.transform.scale(surface, self.sheet_size.get_tuple())
+        return surface
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """Get the converted surface of the whole sheet."""
+        if self._surface is None:
+            with self._load_lock:
+                if self._surface is None:
+                    decoded = self._decoded if self._decoded is not None else self._load()
+                    self._decoded = None
+                    self._surface = decoded.convert_alpha() if '.png' in self.file_location else decoded.convert()
+                    surface_tracker.track(self._surface, self.file_location, self.image_name, type(self).__name__)
+        return self._surface
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the sheet was decoded, either ahead of time or by using its surface."""
+        return self._surface is not None or self._decoded is not None
+
+    def preload(self, asset_cache: AssetCache = None):
+        """Decode the sheet ahead of time.
+
+        ..Note:: The surface is not converted to the display format, so it is safe to call from worker threads.
+
+        :param asset_cache: Optional[:ref:`AssetCache`]
+            The cache to load the sheet from.
+        """
+        with self._load_lock:
+            if not self.loaded:
+                self._decoded = self._load(asset_cache)
+        return self
+
+    def release(self):
+        """Drop the sheet and the rotations of every frame. They are loaded again the next time they are used."""
+        for frame in self.frames:
+            frame.release()
+        self._surface = None
+        self._decoded = None
+
+    def row(self, index: int) -> List[SheetFrame]:
+        """Get the frames of a row.
+
+        :param index: int
+            The row, starting from the top.
+        """
+        return self.frames[index * self.columns:(index + 1) * self.columns]
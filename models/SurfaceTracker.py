@@ -0,0 +1,104 @@
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+@dataclass
+class SurfaceSnapshot:
+    """
+    The live surfaces at a point in time.
+
+    :param count: int
+        The amount of live surfaces.
+    :param total_bytes: int
+        The amount of pixel bytes held by the live surfaces.
+    :param by_asset: Dict[str, int]
+        Bytes by source file.
+    :param by_image: Dict[str, int]
+        Bytes by image name.
+    :param by_sprite_type: Dict[str, int]
+        Bytes by the type of the sprite using the image.
+    """
+    count: int = 0
+    total_bytes: int = 0
+    by_asset: Dict[str, int] = field(default_factory=dict)
+    by_image: Dict[str, int] = field(default_factory=dict)
+    by_sprite_type: Dict[str, int] = field(default_factory=dict)
+
+    def diff(self, earlier):
+        """Get the growth since an earlier snapshot.
+
+        :param earlier: :ref:`SurfaceSnapshot`
+            The snapshot to compare against.
+        """
+        def subtract(now: Dict[str, int], then: Dict[str, int]):
+            changes = {key: now.get(key, 0) - then.get(key, 0) for key in set(now) | set(then)}
+            return {key: change for key, change in changes.items() if change}
+
+        return SurfaceSnapshot(self.count - earlier.count, self.total_bytes - earlier.total_bytes,
+                               subtract(self.by_asset, earlier.by_asset), subtract(self.by_image, earlier.by_image),
+                               subtract(self.by_sprite_type, earlier.by_sprite_type))
+
+    def report(self, top: int = 5) -> str:
+        """Get a readable summary of the largest entries.
+
+        :param top: int
+            The amount of entries to list per category.
+        """
+        lines = [f"{self.count} surfaces, {self.total_bytes / 1024:.1f} KiB"]
+        for title, entries in (("asset", self.by_asset), ("image", self.by_image),
+                               ("sprite type", self.by_sprite_type)):
+            largest = sorted(entries.items(), key=lambda entry: abs(entry[1]), reverse=True)[:top]
+            lines.extend(f"  {title} {name}: {size / 1024:.1f} KiB" for name, size in largest)
+        return "\n".join(lines)
+
+
+class SurfaceTracker:
+    """
+    Keeps account of the live surfaces created by the engine.
+
+    Surfaces are held by weak references, so tracking does not keep them alive.
+    Subsurfaces share the pixels of their parent and are counted without bytes.
+    Only surfaces created while the tracker is enabled are accounted for.
+    """
+    def __init__(self):
+        self.enabled = False
+        self._records: Dict[int, Tuple[weakref.ref, int, str, str, str]] = {}
+
+    def track(self, surface: pygame.Surface, asset: str = "unknown", image: str = "unknown",
+              sprite_type: Optional[str] = None):
+        """Start tracking a surface until it is garbage collected.
+
+        :param surface: pygame.Surface
+            The surface to track.
+        :param asset: str
+            The source the surface was created from.
+        :param image: str
+            The name of the image the surface belongs to.
+        :param sprite_type: Optional[str]
+            The type of the sprite the surface belongs to.
+        """
+        if not self.enabled:
+            return
+
+        key = id(surface)
+        size = 0 if surface.get_parent() else surface.get_pitch() * surface.get_height()
+        reference = weakref.ref(surface, lambda _, key=key: self._records.pop(key, None))
+        self._records[key] = (reference, size, asset, image, sprite_type or "none")
+
+    def snapshot(self) -> SurfaceSnapshot:
+        """Get the live surfaces and their size."""
+        by_asset, by_image, by_sprite_type = Counter(), Counter(), Counter()
+        records = list(self._records.values())
+        for _, size, asset, image, sprite_type in records:
+            by_asset[asset] += size
+            by_image[image] += size
+            by_sprite_type[sprite_type] += size
+        return SurfaceSnapshot(len(records), sum(by_asset.values()), dict(by_asset), dict(by_image),
+                               dict(by_sprite_type))
+
+
+surface_tracker = SurfaceTracker()
@@ -0,0 +1,211 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pygame
+
+from . import MovementManipulator
+from .SurfaceTracker import surface_tracker
+
+
+FontKey = Tuple[Optional[str], int]
+
+
+def _font(font_key: FontKey) -> pygame.font.Font:
+    """Get a loaded font by its name and size."""
+    font = Text.fonts.get(font_key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        name, size = font_key
+        font = pygame.font.Font(name, size) if name is None or name.endswith((".ttf", ".otf")) \
+            else pygame.font.SysFont(name, size)
+        Text.fonts[font_key] = font
+    return font
+
+
+class GlyphAtlas:
+    """
+    Renders every character once and composes strings from the cached glyphs.
+
+    ..Note:: Glyphs are placed next to each other without kerning, which suits digits and other short counters.
+
+    :param font_key: Tuple[Optional[str], int]
+        The font name and size.
+    :param color: Tuple[int, int, int]
+        The color of the glyphs.
+    :param antialias: bool
+        Whether the glyphs are antialiased.
+    """
+    def __init__(self, font_key: FontKey, color: Tuple[int, int, int], antialias: bool = True):
+        self.font_key = font_key
+        self.color = color
+        self.antialias = antialias
+        self.glyphs: Dict[str, pygame.Surface] = {}
+
+    def glyph(self, character: str) -> pygame.Surface:
+        """Get the rendered surface of a single character."""
+        glyph = self.glyphs.get(character)
+        if glyph is None:
+            glyph = _font(self.font_key).render(character, self.antialias, self.color).convert_alpha()
+            surface_tracker.track(glyph, "glyph", character, type(self).__name__)
+            self.glyphs[character] = glyph
+        return glyph
+
+
+class Text(pygame.sprite.Sprite):
+    """
+    A line of text, such as a score or a frame rate counter, that is only rendered again when its value changes.
+
+    The label and every rendered string are cached and shared between texts with the same font and color.
+
+    :param value: Any
+        The value shown after the label.
+    :param position: Optional[:ref:`MovementManipulator`]
+        The top left position of the text.
+    :param label: str
+        Text in front of the value that never changes, such as "Score: ".
+    :param value_format: str
+        The format string the value is shown with.
+    :param font_name: Optional[str]
+        A font file or the name of a system font. Defaults to the pygame font.
+    :param font_size: int
+        The size of the font.
+    :param color: Tuple[int, int, int]
+        The color of the text.
+    :param antialias: bool
+        Whether the text is antialiased.
+    :param atlas: bool
+        Compose the value from cached glyphs instead of rendering it, for values that change every frame.
+    :param source: Optional[Callable[[], Any]]
+        Called every physics step to get the value.
+    """
+    fonts: Dict[FontKey, pygame.font.Font] = {}
+    # rendered strings by font, text, color and antialiasing, with the least recently used first.
+    renders: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+    render_cache_size = 256
+    atlases: Dict[tuple, GlyphAtlas] = {}
+    # texts are drawn on top of the scene unless placed in another layer.
+    default_layer = "ui"
+
+    def __init__(self, value: Any = "", position: MovementManipulator = None, label: str = "",
+                 value_format: str = "{}", font_name: str = None, font_size: int = 32,
+                 color: Tuple[int, int, int] = (0, 0, 0), antialias: bool = True, atlas: bool = False,
+                 source: Callable[[], Any] = None):
+        super(Text, self).__init__()
+        self.position = position or MovementManipulator(0, 0)
+        self.label = label
+        self.value_format = value_format
+        self.font_key: FontKey = (font_name, font_size)
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.atlas = atlas
+        self.source = source
+        self.visible = True
+        self.static = True
+        self.player_controlled = False
+        # whether the text changed since it was last drawn.
+        self.dirty = True
+        self._value = value
+        self._text = None
+        self._surface: Optional[pygame.Surface] = None
+        # the surface label and value runs are composed on, reused while its size stays the same.
+        self._composed: Optional[pygame.Surface] = None
+        self._scaled = (None, None, None)
+        self.renders_count = 0
+
+    @property
+    def value(self) -> Any:
+        """Get the shown value."""
+        return self._value
+
+    @value.setter
+    def value(self, new_value: Any):
+        """Set the shown value. The text is rendered again only when the formatted value changes."""
+        self._value = new_value
+        if self.value_format.format(new_value) != self._text:
+            self.dirty = True
+
+    @property
+    def text(self) -> str:
+        """Get the full text."""
+        return self.label + self.value_format.format(self._value)
+
+    def _render(self, text: str) -> pygame.Surface:
+        """Get a rendered string from the shared cache."""
+        key = (self.font_key, text, self.color, self.antialias)
+        surface = Text.renders.get(key)
+        if surface is None:
+            surface = _font(self.font_key).render(text, self.antialias, self.color).convert_alpha()
+            surface_tracker.track(surface, "text", text, type(self).__name__)
+            Text.renders[key] = surface
+            if len(Text.renders) > Text.render_cache_size:
+                Text.renders.popitem(last=False)
+        else:
+            Text.renders.move_to_end(key)
+        return surface
+
+    def _glyph_atlas(self) -> GlyphAtlas:
+        """Get the shared glyph atlas of the font and color."""
+        key = (self.font_key, self.color, self.antialias)
+        if key not in Text.atlases:
+            Text.atlases[key] = GlyphAtlas(self.font_key, self.color, self.antialias)
+        return Text.atlases[key]
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Get the surface of the text, rendering it when the value changed."""
+        text = self.value_format.format(self._value)
+        if self._surface is not None and text == self._text:
+            return self._surface
+
+        self._text = text
+        self.renders_count += 1
+        if not self.atlas and not self.label:
+            self._surface = self._render(text)
+            return self._surface
+
+        runs = [self._render(self.label)] if self.label else []
+        if self.atlas:
+            atlas = self._glyph_atlas()
+            runs.extend(atlas.glyph(character) for character in text)
+        elif text:
+            runs.append(self._render(text))
+
+        size = (max(1, sum(run.get_width() for run in runs)), _font(self.font_key).get_height())
+        if self._composed is None or self._composed.get_size() != size:
+            self._composed = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surface_tracker.track(self._composed, "text", self.label or "value", type(self).__name__)
+        else:
+            self._composed.fill((0, 0, 0, 0))
+
+        x = 0
+        blits = []
+        for run in runs:
+            blits.append((run, (x, 0)))
+            x += run.get_width()
+        self._composed.blits(blits, doreturn=False)
+        self._surface = self._composed
+        return self._surface
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Get the area of the text."""
+        return self.image.get_rect(topleft=(int(self.position.x), int(self.position.y)))
+
+    def scaled_image(self, scale: float) -> pygame.Surface:
+        """Get the surface of the text scaled by a factor."""
+        image = self.image
+        renders_count, source_scale, scaled = self._scaled
+        if renders_count != self.renders_count or source_scale != scale:
+            width, height = image.get_size()
+            scaled = pygame.transform.smoothscale(image, (max(1, int(width * scale)), max(1, int(height * scale))))
+            self._scaled = (self.renders_count, scale, scaled)
+        return scaled
+
+    def update(self, dt=None):
+        """Poll the source for a new value."""
+        if self.source:
+            self.value = self.source()
+
+    def interpolate(self, alpha: float):
+        """Texts do not move between physics steps."""
@@ -0,0 +1,207 @@
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+import pygame
+
+from . import Image, Size, MovementManipulator, Action, Layer
+from .SurfaceTracker import surface_tracker
+
+
+class TileLayer(pygame.sprite.Sprite):
+    """
+    A grid of static, grid-aligned tiles.
+
+    The grid is stored as a compact array of tile ids and rendered through a single cached surface.
+    Collisions are resolved by looking up the cells underneath a sprite instead of checking every tile.
+
+    :param tile_size: :ref:`Size`
+        The size of a single tile.
+    :param columns: int
+        The amount of columns in the grid.
+    :param rows: int
+        The amount of rows in the grid.
+    :param tiles: Dict[int, :ref:`Image`]
+        The image for every tile id. The id 0 is reserved for empty cells.
+    :param position: Optional[:ref:`MovementManipulator`]
+        The top left position of the grid.
+    :param grid: Optional[Sequence[Sequence[int]]]
+        The tile ids of every row. Defaults to an empty grid.
+    :param collision_action: :ref:`Action`
+        The action applied to a cell when a sprite collides with it.
+    """
+    EMPTY = 0
+
+    def __init__(self, tile_size: Size, columns: int, rows: int, tiles: Dict[int, Image],
+                 position: MovementManipulator = None, grid: Sequence[Sequence[int]] = None,
+                 collision_action: Action = None):
+        super(TileLayer, self).__init__()
+        self.tile_size = tile_size
+        self.columns = columns
+        self.rows = rows
+        self.tiles = tiles
+        self.position = position or MovementManipulator(0, 0)
+        self.collision_action = collision_action or Action.hide()
+        self.cells = array('H', bytes(2 * columns * rows))
+        self.visible = True
+        self.static = True
+        self.player_controlled = False
+        self._surface = None
+        self._dirty_cells = set()
+        self._scaled = (None, None)
+        self.rect = pygame.Rect(self.position.x, self.position.y, columns * tile_size.width, rows * tile_size.height)
+
+        for row, tile_ids in enumerate(grid or []):
+            for column, tile_id in enumerate(tile_ids):
+                self.cells[row * columns + column] = tile_id
+
+    def __getitem__(self, cell: Tuple[int, int]) -> int:
+        column, row = cell
+        return self.cells[row * self.columns + column]
+
+    def __setitem__(self, cell: Tuple[int, int], tile_id: int):
+        column, row = cell
+        self.cells[row * self.columns + column] = tile_id
+        self._dirty_cells.add(cell)
+        for group in self.groups():
+            if isinstance(group, Layer):
+                group.repaint(self.cell_rect(column, row))
+
+    def fill(self, tile_id: int):
+        """Set every cell to a tile.
+
+        :param tile_id: int
+            The tile id to fill the grid with.
+        """
+        self.cells = array('H', [tile_id]) * (self.columns * self.rows)
+        self._surface = None
+        for group in self.groups():
+            if isinstance(group, Layer):
+                group.repaint(self.rect)
+
+    def release(self):
+        """Drop the cached surfaces of the grid. They are redrawn the next time the grid is drawn."""
+        self._surface = None
+        self._scaled = (None, None)
+
+    def count(self) -> int:
+        """Get the amount of cells that are not empty."""
+        return len(self.cells) - self.cells.count(self.EMPTY)
+
+    def cell_rect(self, column: int, row: int) -> pygame.Rect:
+        """Get the rect of a cell in scene coordinates."""
+        return pygame.Rect(self.rect.x + column * self.tile_size.width, self.rect.y + row * self.tile_size.height,
+                           self.tile_size.width, self.tile_size.height)
+
+    def _draw_cell(self, column: int, row: int):
+        """Draw a single cell onto the cached surface."""
+        area = pygame.Rect(column * self.tile_size.width, row * self.tile_size.height,
+                           self.tile_size.width, self.tile_size.height)
+        self._surface.fill((0, 0, 0, 0), area)
+        tile_id = self[column, row]
+        if tile_id != self.EMPTY:
+            self._surface.blit(self.tiles[tile_id].surface, area)
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Get the cached surface of the whole grid.
+
+        ..Note:: Only cells that changed since the last call are redrawn.
+        """
+        if not self._surface:
+            self._surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            surface_tracker.track(self._surface, "tiles", "tile_layer", type(self).__name__)
+            self._dirty_cells = {(column, row) for row in range(self.rows) for column in range(self.columns)}
+
+        if self._dirty_cells:
+            for column, row in self._dirty_cells:
+                self._draw_cell(column, row)
+            self._dirty_cells.clear()
+            self._scaled = (None, None)
+        return self._surface
+
+    def scaled_image(self, scale: float) -> pygame.Surface:
+        """Get the cached surface of the whole grid scaled by a factor.
+
+        :param scale: float
+            The factor to scale the surface by.
+        """
+        surface = self.image
+        scaled_scale, scaled = self._scaled
+        if scaled_scale != scale:
+            width, height = surface.get_size()
+            scaled = pygame.transform.scale(surface, (max(1, int(width * scale)), max(1, int(height * scale))))
+            self._scaled = (scale, scaled)
+            surface_tracker.track(scaled, "tiles", "tile_layer", type(self).__name__)
+        return scaled
+
+    def cells_under(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        """Get the non-empty cells overlapping a rect.
+
+        :param rect: pygame.Rect
+            The rect in scene coordinates.
+        """
+        clipped = rect.clip(self.rect)
+        if not clipped:
+            return []
+
+        first_column = (clipped.left - self.rect.x) // self.tile_size.width
+        last_column = (clipped.right - 1 - self.rect.x) // self.tile_size.width
+        first_row = (clipped.top - self.rect.y) // self.tile_size.height
+        last_row = (clipped.bottom - 1 - self.rect.y) // self.tile_size.height
+        return [(column, row) for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)
+                if self.cells[row * self.columns + column] != self.EMPTY]
+
+    def handle_collision(self, sprite):
+        """Apply the collision responses between a moving sprite and the cells underneath it.
+
+        :param sprite: :ref:`Sprite`
+            The sprite colliding with the layer.
+        """
+        if not sprite.visible or sprite.static or Action.pass_through() == sprite.collision_action:
+            return
+
+        cells = self.cells_under(sprite.rect)
+        if cells and sprite.collider:
+            # leave out the cells the rect reaches but the shape does not, such as the corners of a circle.
+            center = sprite.movement.position.get_tuple()
+            cells = [cell for cell in cells if sprite.collider.contact_rect(center, self.cell_rect(*cell))]
+        if not cells:
+            return
+
+        hit = self.cell_rect(*cells[0]).unionall([self.cell_rect(*cell) for cell in cells[1:]])
+
+        if self.collision_action in [Action.hide(), Action.die(), Action.kill()]:
+            for cell in cells:
+                self[cell] = self.EMPTY
+        if Action.kill_non_players() == self.collision_action and not sprite.player_controlled:
+            sprite.kill()
+
+        if Action.bounce() == sprite.collision_action and not (sprite.static or sprite.player_controlled):
+            self._bounce(sprite, hit)
+
+    @staticmethod
+    def _bounce(sprite, hit: pygame.Rect):
+        """Bounce a sprite off the axis it overlaps the least with and push it out of the cells."""
+        if sprite.collider:
+            contact = sprite.collider.contact_rect(sprite.movement.position.get_tuple(), hit)
+            if contact:
+                sprite.resolve_contact(contact)
+            return
+
+        overlap = sprite.rect.clip(hit)
+        velocity = sprite.movement.velocity
+        if overlap.width < overlap.height:
+            direction = -1 if sprite.rect.centerx < hit.centerx else 1
+            velocity.x = abs(velocity.x) * direction
+            sprite.movement.shift(overlap.width * direction, 0)
+        else:
+            direction = -1 if sprite.rect.centery < hit.centery else 1
+            velocity.y = abs(velocity.y) * direction
+            sprite.movement.shift(0, overlap.height * direction)
+
+    def interpolate(self, alpha: float):
+        """Tiles are static, there is nothing to interpolate."""
+
+    def update(self, *args):
+        """Tiles are static and do not need to be updated."""
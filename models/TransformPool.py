@@ -0,0 +1,107 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Sequence
+
+import pygame
+
+from . import Image
+
+
+class TransformPool:
+    """
+    Runs surface transforms for many images on worker threads.
+
+    Pygame's rotate and scale transforms release the GIL, so they can run in parallel.
+    Surfaces are always loaded on the calling thread since loading may need the display.
+
+    :param workers: int
+        The amount of worker threads.
+    :param min_batch: int
+        The least amount of pending transforms in a frame worth handing to the workers.
+    """
+    def __init__(self, workers: int = 4, min_batch: int = 4):
+        self.workers = max(1, workers)
+        self.min_batch = min_batch
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="transform") if self.workers > 1 \
+            else None
+
+    def map(self, func: Callable, items: Iterable) -> List:
+        """Apply a transform to every item in parallel.
+
+        :param func: Callable
+            The transform to apply.
+        :param items: Iterable
+            The items to transform.
+        """
+        if not self._executor:
+            return [func(item) for item in items]
+        return list(self._executor.map(func, items))
+
+    def prerender_rotations(self, images: Iterable[Image], step: float = 15):
+        """Render rotation frames for every image ahead of time.
+
+        :param images: Iterable[:ref:`Image`]
+            The images to render rotations for.
+        :param step: float
+            The amount of degrees between frames. Images that already have a rotation step keep theirs.
+        """
+        jobs = []
+        for image in images:
+            _ = image.surface
+            if not image.rotation_step:
+                image.rotation_step = step
+            angles = [index * image.rotation_step for index in range(int(round(360 / image.rotation_step)))]
+            jobs.extend((image, angle) for angle in angles if angle not in image.rotation_frames)
+
+        frames = self.map(lambda job: job[0].render_rotation(job[1]), jobs)
+        for (image, angle), frame in zip(jobs, frames):
+            image.rotation_frames[angle] = frame
+
+    def prescale(self, images: Iterable[Image], scales: Sequence[float]):
+        """Render scaled versions of every image ahead of time.
+
+        :param images: Iterable[:ref:`Image`]
+            The images to scale.
+        :param scales: Sequence[float]
+            The factors to scale by, such as the render scales a scene may use.
+        """
+        jobs = []
+        for image in images:
+            _ = image.surface
+            base = image.no_rotation_surface
+            width, height = base.get_size()
+            jobs.extend((image, scale, base, (max(1, int(width * scale)), max(1, int(height * scale))))
+                        for scale in scales if scale not in image.scaled_variants)
+
+        variants = self.map(lambda job: pygame.transform.scale(job[2], job[3]), jobs)
+        for (image, scale, _, _), variant in zip(jobs, variants):
+            image.scaled_variants[scale] = image.track(variant)
+
+    def prepare_rotations(self, sprites: Iterable):
+        """Render the rotations a frame is about to request in parallel.
+
+        Each sprite's image receives its rotation as a prepared rotation, so the sprite update does not have to
+        render it on the main thread.
+
+        :param sprites: Iterable[:ref:`Sprite`]
+            The sprites that will be updated.
+        """
+        jobs = []
+        for sprite in sprites:
+            image = getattr(sprite, "image_obj", None)
+            if not image or not image.no_rotation_surface or sprite.static or not sprite.visible:
+                continue
+            key = image.rotation_key(sprite.movement.img_angle.angle_in_degrees)
+            if key not in image.rotation_frames and image.prepared_rotation[0] != key:
+                jobs.append((image, key))
+
+        if len(jobs) < self.min_batch:
+            return
+
+        frames = self.map(lambda job: job[0].render_rotation(job[1]), jobs)
+        for (image, key), frame in zip(jobs, frames):
+            image.prepared_rotation = (key, frame)
+
+    def shutdown(self):
+        """Stop the worker threads."""
+        if self._executor:
+            self._executor.shutdown()
@@ -1,11 +1,35 @@
-from .Audio import Audio
+from .Audio import Audio, AudioConfig
 from .Keyboard import Trigger, KeyboardTrigger
 from .Action import Action
 from .Color import Color
 from .Size import Size
 from .Movement import Movement, MovementManipulator, Angle
+from .SurfaceTracker import SurfaceTracker, SurfaceSnapshot, surface_tracker
+from .AssetCache import AssetCache
 from .Image import Image
+from .SpriteSheet import SpriteSheet, SheetFrame
+from .Animator import Animator, Animation
+from .TransformPool import TransformPool
+from .Camera import Camera
+from .SpatialHash import SpatialHash
+from .SpatialGroup import SpatialGroup
+from .Layer import Layer, LayerPolicy
 from .Visibility import Visibility
+from .Collider import Collider, CircleCollider, BoxCollider, Contact
+from .TileLayer import TileLayer
+from .Text import Text, GlyphAtlas
 from .Sprite import Sprite
 from .Sprite import Sprite
-from .Scene import Scene
\ No newline at end of file
+from .Archetype import Archetype
+from .SpritePool import SpritePool, PoolStats
+from .ParticleEmitter import ParticleEmitter
+from .Replication import ReplicationServer, ReplicationClient
+from .ChunkStreamer import ChunkStreamer, ChunkRecord
+from .Level import Level, LevelError, LevelLoadReport
+from .QualityGovernor import QualityGovernor, QualityStep, QUALITY_CHANGED
+from .FrameCapture import FrameCapture
+from .FramePacer import FramePacer
+from .LatencyMonitor import LatencyMonitor, FrameTiming
+from .Scheduler import Scheduler, Timer, WaitFrames
+from .Scene import Scene, SCENE_WAKE
+from .SceneManager import SceneManager, EvictionPolicy
\ No newline at end of file
@@ -1,4 +1,7 @@
-from models import Sprite, Image, Scene, Movement, MovementManipulator, Angle, Action, Size
+import asyncio
+
+from models import Sprite, Image, Scene, Movement, MovementManipulator, Angle, Action, Size, TileLayer, \
+    ParticleEmitter, SpriteSheet, Animator, Animation, WaitFrames, Level
 
 
 wallpaper = Sprite(image=Image(Size(1280, 720), image_name="wallpaper", file_location="assets/wallpaper.jpg",
@@ -114,6 +117,109 @@ def test_brick_and_default():
     Scene("Test", sprites=[default_sprite, brick_sprite, ball_sprite], size=scene_size).start()
 
 
+def test_tile_layer():
+    size = Size(384 // 3, 128 // 3)
+    tiles = {1: Image(size=size, image_name="tile", file_location="assets/blue_tile.png"),
+             2: Image(size=size, image_name="red_tile", file_location="assets/red_tile.png")}
+    tile_layer = TileLayer(size, columns=8, rows=4, tiles=tiles, position=MovementManipulator(128, 100),
+                           grid=[[1, 2] * 4, [2, 1] * 4, [1, 0] * 4, [0, 1] * 4], collision_action=Action.hide())
+
+    ball_sprite = Sprite(
+        image=Image(size=Size(24, 24),
+                    image_name=f"ball",
+                    file_location="assets/ball.png"),
+        movement=Movement(
+            static=False,
+            position=MovementManipulator(600, 600),
+            velocity=MovementManipulator(-5, -5)),
+        bounded_action=Action.bounce(), collision_action=Action.bounce()
+    )
+
+    Scene("Test", sprites=[wallpaper, tile_layer, ball_sprite]).start()
+
+
+def test_async_scene():
+    movement = Movement(position=MovementManipulator(300, 300), velocity=MovementManipulator(3, 0), static=False)
+    sprite = Sprite(movement=movement, bounded_action=Action.bounce(), collision_action=Action.bounce())
+    scene = Scene("Test", sprites=[wallpaper, sprite])
+
+    async def reverse_every_second():
+        while True:
+            # the sleep overlaps with the frames, and the change is applied on a frame boundary.
+            await asyncio.sleep(1)
+            await scene.next_frame()
+            sprite.movement.velocity.x *= -1
+
+    async def run():
+        scene.create_task(reverse_every_second())
+        await scene.start_async()
+
+    asyncio.run(run())
+
+
+def test_particles():
+    sparks = ParticleEmitter(max_particles=4000, particle_size=3, gravity=(0, 0.15), bounded_action=Action.bounce())
+    scene = Scene("Test", sprites=[wallpaper])
+    scene.add_emitter(sparks)
+
+    async def fountain():
+        while True:
+            sparks.emit(150, (640, 600), speed=8, spread=60, direction=-90, lifetime=3, color=(255, 140, 0))
+            for _ in range(10):
+                await scene.next_frame()
+
+    async def run():
+        scene.create_task(fountain())
+        await scene.start_async()
+
+    asyncio.run(run())
+
+
+def test_sprite_sheet():
+    sheet = SpriteSheet.load("assets/ball_sheet.png", Size(64, 64), columns=4, rows=2, size=Size(48, 48),
+                             rotation_step=10)
+    # every ball shares the frames of the sheet and only keeps its own animation state.
+    bounce = Animation(sheet.frames, fps=16)
+    spin = Animation(sheet.row(0), fps=8, loop=False, next_state="bounce")
+    balls = [Sprite(movement=Movement(position=MovementManipulator(100 + i * 60 % 1080, 100 + i * 45 % 520),
+                                      velocity=MovementManipulator(3, 2), static=False),
+                    animator=Animator({"spin": spin, "bounce": bounce}, speed=0.5 + i % 4 / 4),
+                    bounded_action=Action.bounce(), collision_action=Action.pass_through())
+             for i in range(40)]
+    scene = Scene("Test", sprites=[wallpaper] + balls)
+    scene.start()
+
+
+def test_scheduler():
+    scene = Scene("Test", sprites=[wallpaper])
+
+    def spawn_ball():
+        scene.add(Sprite(movement=Movement(position=MovementManipulator(640, 100), velocity=MovementManipulator(4, 3),
+                                           static=False),
+                         bounded_action=Action.bounce(), collision_action=Action.bounce()))
+
+    def blink(sprite):
+        # hide for half a second, then show for ten frames, until the sprite is gone.
+        while sprite.alive():
+            sprite.hide()
+            yield 0.5
+            sprite.show()
+            yield WaitFrames(10)
+
+    spawner = scene.scheduler.call_every(1, spawn_ball, delay=0)
+    scene.scheduler.call_later(10, spawner.cancel)
+    scene.scheduler.call_later(2, lambda: scene.scheduler.start(blink(scene.layer("dynamic").sprites()[0])))
+    scene.start()
+
+
+def test_level():
+    level = Level.load("assets/levels/bricks.json")
+    sprites = level.build()
+    print(level.report.report())
+    scene = Scene("Test", size=level.size, sprites=sprites)
+    scene.start()
+
+
 if __name__ == '__main__':
     test_horizontal_movement()
     test_vertical_movement()
@@ -126,4 +232,9 @@ if __name__ == '__main__':
     test_static_movement_diagonal_hit_bottom_left()
     test_static_movement_diagonal_hit_bottom_right()
     test_brick_and_default()
-
+    test_tile_layer()
+    test_async_scene()
+    test_particles()
+    test_sprite_sheet()
+    test_scheduler()
+    test_level()